@@ -0,0 +1,118 @@
+#! /usr/bin/env python3
+
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+# Measures KinematicChain.computeAnalyticJacobian() (prefix/suffix products of the joint
+# motors, O(dof)) on chains of 3 to 30 revolute joints, with and without the forward
+# kinematics cache (only the last joint changing between two calls). The results are
+# validated against the straightforward O(dof^2) formula, computed in Python.
+#
+# Usage: python bench_analytic_jacobian.py
+
+import numpy as np
+from helpers import measure
+from helpers import printTable
+
+from pygafro import Motor
+from pygafro import RotorGenerator
+from pygafro import System
+from pygafro import Translator
+from pygafro import TranslatorGenerator
+
+LENGTHS = [3, 5, 7, 10, 15, 20, 25, 30]
+
+
+def createChain(dof):
+    system = System()
+    chain = system.createKinematicChain("default")
+
+    axes = [
+        RotorGenerator([1.0, 0.0, 0.0]),
+        RotorGenerator([0.0, 1.0, 0.0]),
+        RotorGenerator([0.0, 0.0, 1.0]),
+    ]
+
+    for i in range(dof):
+        joint = system.createRevoluteJoint(f"joint{i}")
+        joint.setAxis(axes[i % 3])
+
+        if i > 0:
+            joint.setFrame(Motor(Translator(TranslatorGenerator([0.0, 0.1, 0.0]))))
+
+        chain.addActuatedJoint(joint)
+
+    # The kinematic chain references the system
+    return system, chain
+
+
+# J_j = M_0 * ... * dM_j * ... * M_n-1
+def computeReference(chain, position):
+    jacobian = [Motor() for _ in position]
+
+    for i in range(len(position)):
+        motor = chain.computeMotor(i, position[i])
+
+        for j in range(len(position)):
+            if j == i:
+                jacobian[j] = jacobian[j] * chain.computeMotorDerivative(j, position[j])
+            else:
+                jacobian[j] = jacobian[j] * motor
+
+    return jacobian
+
+
+def benchmarkChain(dof):
+    system, chain = createChain(dof)
+
+    rng = np.random.default_rng(0)
+    position = list(rng.uniform(-np.pi, np.pi, dof))
+
+    # Validation against the O(dof^2) formula
+    max_error = max(
+        [
+            np.max(np.abs(a.vector() - b.vector()))
+            for a, b in zip(
+                chain.computeAnalyticJacobian(position),
+                computeReference(chain, position),
+            )
+        ]
+    )
+
+    uncached = measure(lambda: chain.computeAnalyticJacobian(position))
+
+    # Only the last joint changes between two calls
+    positions = [position[:-1] + [x] for x in rng.uniform(-np.pi, np.pi, 2)]
+    index = [0]
+
+    def cachedCall():
+        index[0] = 1 - index[0]
+        chain.computeAnalyticJacobian(positions[index[0]])
+
+    cache = chain.getForwardKinematicsCache()
+    cache.setEnabled(True)
+    cached = measure(cachedCall)
+    cache.setEnabled(False)
+
+    reference = measure(lambda: computeReference(chain, position), nb_iterations=50)
+
+    return (f"{dof} DOF", [uncached, cached, reference]), max_error
+
+
+if __name__ == "__main__":
+    results = [benchmarkChain(dof) for dof in LENGTHS]
+
+    printTable(["O(dof)", "Cached", "Python O(dof^2)"], [row for row, _ in results])
+
+    max_error = max([error for _, error in results])
+    print()
+    print(f"Max. difference: {max_error:.3e}")
+
+    if max_error > 1e-9:
+        print("ERROR: the Jacobians differ")
+        raise SystemExit(1)
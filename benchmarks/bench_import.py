@@ -0,0 +1,69 @@
+#! /usr/bin/env python3
+
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+# Measures the time needed to import pygafro in a fresh process. The products of
+# multivectors and the Cayley tables are only loaded when first needed: the "eager"
+# scenario loads everything right after the import, like older versions of pygafro did.
+#
+# Usage: python bench_import.py [nb_runs]
+
+import subprocess  # nosec
+import sys
+
+from helpers import printTable
+
+SCENARIOS = [
+    ("import pygafro", ""),
+    (
+        "import + first product",
+        "pygafro.Point(1.0, 2.0, 3.0) * pygafro.Point(3.0, 2.0, 1.0)",
+    ),
+    (
+        "import + eager loading",
+        "pygafro.internals.registerProducts(); "
+        + "[pygafro.utils._getCayleyTable(x) for x in "
+        + "['geometricProduct', 'innerProduct', 'outerProduct']]",
+    ),
+]
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+import pygafro
+import pygafro.utils
+{}
+print(time.perf_counter() - start)
+"""
+
+
+def measureImport(statement, nb_runs):
+    durations = []
+
+    for _ in range(nb_runs):
+        output = subprocess.run(  # nosec
+            [sys.executable, "-c", SCRIPT.format(statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+
+        durations.append(float(output.stdout.strip().split("\n")[-1]))
+
+    return min(durations), sum(durations) / nb_runs
+
+
+if __name__ == "__main__":
+    nb_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    rows = [
+        (name, list(measureImport(statement, nb_runs))) for name, statement in SCENARIOS
+    ]
+
+    printTable(["Min", "Mean"], rows)
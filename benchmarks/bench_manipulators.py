@@ -0,0 +1,80 @@
+#! /usr/bin/env python3
+
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+# Compares the fixed-size Manipulator_<dof> classes with DynamicManipulator, on the
+# same robots, to help choosing which one to use.
+#
+# Usage: python bench_manipulators.py
+
+import os
+
+import numpy as np
+from helpers import measure
+from helpers import printTable
+
+from pygafro import DynamicManipulator
+from pygafro import createManipulator
+from pygafro import __path__ as pygafro_path
+
+ROBOTS = [
+    ("panda/panda.yaml", 7, "panda_endeffector_joint"),
+    ("kuka/iiwa7/iiwa7.yaml", 7, "iiwa_joint_ee"),
+    ("ur5/ur5.yaml", 6, "ee_fixed_joint"),
+]
+
+METHODS = [
+    "getEEMotor",
+    "getEEAnalyticJacobian",
+    "getEEGeometricJacobian",
+    "getEEFrameJacobian",
+    "getMassMatrix",
+]
+
+
+def benchmarkRobot(filename, dof, ee_joint_name):
+    path = os.path.join(pygafro_path[0], "assets", "robots", filename)
+
+    fixed = createManipulator(path, dof, ee_joint_name)
+    dynamic = DynamicManipulator(path, ee_joint_name)
+
+    position = fixed.getRandomConfiguration()
+    positions = np.array([fixed.getRandomConfiguration() for _ in range(1000)])
+
+    rows = []
+
+    for method in METHODS:
+        rows.append(
+            (
+                method,
+                [
+                    measure(lambda: getattr(fixed, method)(position)),
+                    measure(lambda: getattr(dynamic, method)(position)),
+                ],
+            )
+        )
+
+    rows.append(
+        (
+            "getEEMotorBatch (x1000)",
+            [
+                measure(lambda: fixed.getEEMotorBatch(positions), 20),
+                measure(lambda: dynamic.getEEMotorBatch(positions), 20),
+            ],
+        )
+    )
+
+    print(f"{filename} ({dof} DOF)")
+    printTable([f"Manipulator_{dof}", "Dynamic"], rows)
+    print()
+
+
+if __name__ == "__main__":
+    for robot in ROBOTS:
+        benchmarkRobot(*robot)
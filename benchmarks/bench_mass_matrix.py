@@ -0,0 +1,88 @@
+#! /usr/bin/env python3
+
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+# Compares the mass matrix computed by KinematicChain.computeMassMatrix() (composite
+# rigid body algorithm, O(dof^2)) with the one of the fixed-size Manipulator_<dof>
+# classes (gafro's implementation, O(dof^3)), on the bundled manipulators (the planar
+# one has no mass): both the results and the durations.
+#
+# Usage: python bench_mass_matrix.py
+
+import os
+
+import numpy as np
+from helpers import measure
+from helpers import printTable
+
+from pygafro import DynamicManipulator
+from pygafro import createManipulator
+from pygafro import __path__ as pygafro_path
+
+ROBOTS = [
+    ("panda/panda.yaml", 7, "panda_endeffector_joint"),
+    ("kuka/iiwa7/iiwa7.yaml", 7, "iiwa_joint_ee"),
+    ("kuka/iiwa14/iiwa14.yaml", 7, "lbr_joint_ee"),
+    ("ur5/ur5.yaml", 6, "ee_fixed_joint"),
+    ("ufactory/lite6/lite6.yaml", 6, "lite6_joint_eef"),
+]
+
+NB_CONFIGURATIONS = 100
+
+
+def benchmarkRobot(filename, dof, ee_joint_name):
+    path = os.path.join(pygafro_path[0], "assets", "robots", filename)
+
+    fixed = createManipulator(path, dof, ee_joint_name)
+    dynamic = DynamicManipulator(path, ee_joint_name)
+    chain = fixed.getEEKinematicChain()
+
+    positions = [fixed.getRandomConfiguration() for _ in range(NB_CONFIGURATIONS)]
+
+    # Validation against the fixed-size implementation
+    max_error = max(
+        [
+            np.max(
+                np.abs(
+                    chain.computeMassMatrix(list(position))
+                    - fixed.getMassMatrix(position)
+                )
+            )
+            for position in positions
+        ]
+    )
+
+    position = positions[0]
+    position_list = list(position)
+
+    rows = [
+        ("Manipulator.getMassMatrix", [measure(lambda: fixed.getMassMatrix(position))]),
+        (
+            "KinematicChain.computeMassMatrix",
+            [measure(lambda: chain.computeMassMatrix(position_list))],
+        ),
+        (
+            "DynamicManipulator.getMassMatrix",
+            [measure(lambda: dynamic.getMassMatrix(position))],
+        ),
+    ]
+
+    print(f"{filename} ({dof} DOF), max. difference: {max_error:.3e}")
+    printTable(["Duration"], rows)
+    print()
+
+    return max_error
+
+
+if __name__ == "__main__":
+    errors = [benchmarkRobot(*robot) for robot in ROBOTS]
+
+    if max(errors) > 1e-9:
+        print("ERROR: the mass matrices differ")
+        raise SystemExit(1)
@@ -0,0 +1,44 @@
+#! /usr/bin/env python3
+
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+import time
+
+
+# Returns the mean duration (in seconds) of one call to 'function', measured over
+# 'nb_iterations' calls (after a few warm-up calls)
+def measure(function, nb_iterations=1000):
+    for _ in range(min(10, nb_iterations)):
+        function()
+
+    start = time.perf_counter()
+
+    for _ in range(nb_iterations):
+        function()
+
+    return (time.perf_counter() - start) / nb_iterations
+
+
+# Prints a table of durations: 'rows' is a list of (name, [duration, ...]) tuples, with
+# one duration per column (None if not applicable)
+def printTable(columns, rows):
+    width = max([len(name) for name, _ in rows] + [10])
+
+    print(" " * width + "".join([f"{c:>16}" for c in columns]))
+
+    for name, durations in rows:
+        line = f"{name:<{width}}"
+
+        for duration in durations:
+            if duration is None:
+                line += f"{'-':>16}"
+            else:
+                line += f"{duration * 1e6:>13.2f} us"
+
+        print(line)
@@ -9,34 +9,58 @@
 #
 
 import os
+import struct
 import sys
 
 import helpers
 
 
+# Writes a 2D array of unsigned 32-bit integers in the NumPy .npy format (done by hand,
+# NumPy might not be available while building pygafro)
+def write_npy(filename, array):
+    header = "{'descr': '<u4', 'fortran_order': False, 'shape': (%d, %d), }" % (
+        len(array),
+        len(array[0]),
+    )
+
+    # The total size of the preamble must be a multiple of 64 bytes
+    padding = 64 - (10 + len(header) + 1) % 64
+    header += " " * (padding % 64) + "\n"
+
+    with open(filename, "wb") as output:
+        output.write(b"\x93NUMPY\x01\x00")
+        output.write(struct.pack("<H", len(header)))
+        output.write(header.encode("latin1"))
+
+        for row in array:
+            output.write(struct.pack(f"<{len(row)}I", *row))
+
+
 with open(sys.argv[1], "r") as f:
     template = f.read().split('\n')
 
 
-filename = os.path.basename(sys.argv[1]).lower()
+filename = os.path.basename(sys.argv[1]).lower().replace(".py", ".npy")
+
 
+# table[blade1][blade2] is a bitmask of the blades of the product of blade1 and blade2
+# (bit 'i' set if the blade 'i' is in the result)
+table = [[0] * len(helpers.blades) for _ in helpers.blades]
 
-with open(os.path.join(sys.argv[2], filename), "w") as output:
-    output.write("# This file is auto-generated\n\n")
-    output.write("table = {\n")
+for line in template:
+    if (len(line) == 0) or (line[0] == '#'):
+        continue
 
-    for line in template:
-        if (len(line) == 0) or (line[0] == '#'):
-            continue
+    parts = line.split(': ')
+    blade1, blade2 = parts[0].split(', ')
+    result_blades = parts[1].split(', ')
 
-        parts = line.split(': ')
-        blade1, blade2 = parts[0].split(', ')
-        result_blades = parts[1].split(', ')
+    blade1 = helpers.blades.index(blade1)
+    blade2 = helpers.blades.index(blade2)
 
-        blade1 = helpers.blades.index(blade1)
-        blade2 = helpers.blades.index(blade2)
-        result_blades = [helpers.blades.index(x) for x in result_blades if x != '']
+    for x in result_blades:
+        if x != '':
+            table[blade1][blade2] |= 1 << helpers.blades.index(x)
 
-        output.write(f"    ({blade1}, {blade2}): {result_blades},\n")
 
-    output.write("}\n")
+write_npy(os.path.join(sys.argv[2], filename), table)
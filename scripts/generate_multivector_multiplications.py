@@ -48,12 +48,15 @@ void {function_name}(py::module &m)
         output.write("}\n")
 
 
-def generate_index_file(filename, function_name, count):
+def generate_index_file(filename, function_name, count, operands):
     with open(filename, "w") as output:
         output.write(
             """// This file is auto-generated
 
 #include <pybind11/pybind11.h>
+#include <string>
+#include <unordered_map>
+#include <utility>
 
 namespace py = pybind11;
 
@@ -65,13 +68,56 @@ namespace py = pybind11;
 
         output.write("\n\n")
 
-        output.write(f"void {function_name}(py::module &m)\n")
-        output.write("{\n")
-
+        output.write(f"static void (*const groups[{count}])(py::module &) = {{\n")
         for i in range(0, count):
-            output.write(f"    {function_name}_{i}(m);\n")
+            output.write(f"    {function_name}_{i},\n")
+        output.write("};\n\n")
 
-        output.write("}\n")
+        output.write(f"static bool registered[{count}] = {{ false }};\n\n")
+
+        output.write(
+            "// Range of groups containing the products of each multivector (first operand)\n"
+        )
+        output.write(
+            "static const std::unordered_map<std::string, std::pair<int, int>> operands = {\n"
+        )
+        for blades1, (first, last) in operands.items():
+            output.write(f'    {{ "{blades1}", {{ {first}, {last} }} }},\n')
+        output.write("};\n\n\n")
+
+        output.write(
+            f"""static void register_group(py::module &m, int index)
+{{
+    if (!registered[index])
+    {{
+        groups[index](m);
+        registered[index] = true;
+    }}
+}}
+
+
+void {function_name}(py::module &m)
+{{
+    for (int i = 0; i < {count}; ++i)
+        register_group(m, i);
+}}
+
+
+// Registers the products whose first operand is 'blades1' (if not already done), returns
+// false if there isn't any
+bool {function_name}_for(py::module &m, const std::string &blades1)
+{{
+    auto iter = operands.find(blades1);
+    if (iter == operands.end())
+        return false;
+
+    for (int i = iter->second.first; i <= iter->second.second; ++i)
+        register_group(m, i);
+
+    return true;
+}}
+"""
+        )
 
 
 multivectors = helpers.blades.copy()
@@ -125,20 +171,32 @@ for i, group in enumerate(groups):
     )
 
 
+# Groups containing the products of each multivector (as first operand), to only register
+# them when needed
+operands = {}
+for i, group in enumerate(groups):
+    for blades1, _ in all_permutations[group[0]:group[1]]:
+        blades1 = "".join(blades1)
+        first, _ = operands.get(blades1, (i, i))
+        operands[blades1] = (first, i)
+
 generate_index_file(
     os.path.join(sys.argv[1], "geometric_products.cpp"),
     "init_geometric_products",
     len(groups),
+    operands,
 )
 generate_index_file(
     os.path.join(sys.argv[1], "inner_products.cpp"),
     "init_inner_products",
     len(groups),
+    operands,
 )
 generate_index_file(
     os.path.join(sys.argv[1], "outer_products.cpp"),
     "init_outer_products",
     len(groups),
+    operands,
 )
 
 
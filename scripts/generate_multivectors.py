@@ -9,7 +9,6 @@
 #
 
 import copy
-import json
 import os
 import sys
 
@@ -209,11 +208,6 @@ generate_index_file(
 )
 
 
-with open(os.path.join(sys.argv[1], "mv_combinations.py"), "w") as output:
-    output.write("# This file is auto-generated\n\n")
-    output.write("combinations = " + json.dumps(helpers.multivectors, indent=4))
-
-
 if nb != 19:
     print(
         "The number of generated 'multivector' files has changed, update the 'scripts/CMakeLists.txt' file!"
@@ -34,6 +34,9 @@ def generate_file(filename, function_name, template, template_functions, entries
 
 #include <gafro/gafro.hpp>
 
+#include "optimization/CostFunctionBatch.hpp"
+#include "optimization/InverseKinematicsSolver.hpp"
+
 
 namespace py = pybind11;
 using namespace gafro;
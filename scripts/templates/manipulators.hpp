@@ -1,6 +1,7 @@
 py::class_<Manipulator_DOF>(m, "Manipulator_DOF")
     .def(py::init<const gafro::System<double>&, const std::string&>())
     .def(py::init<const std::string&, const std::string&>())
+    .def_static("moveFromSystem", &Manipulator_DOF::moveFromSystem)
     .def_property_readonly_static("dof", [](py::object) { return DOF; })
     .def("getSystem", &Manipulator_DOF::getSystem, py::return_value_policy::reference)
     .def("getLink", &Manipulator_DOF::getLink)
@@ -9,16 +10,25 @@ py::class_<Manipulator_DOF>(m, "Manipulator_DOF")
     .def("getJointLimitsMin", &Manipulator_DOF::getJointLimitsMin)
     .def("getJointLimitsMax", &Manipulator_DOF::getJointLimitsMax)
     .def("getEEKinematicChain", &Manipulator_DOF::getEEKinematicChain)
-    .def("getEEMotor", &Manipulator_DOF::getEEMotor)
-    .def("getEEAnalyticJacobian", &Manipulator_DOF::getEEAnalyticJacobian)
-    .def("getEEGeometricJacobian", &Manipulator_DOF::getEEGeometricJacobian)
-    .def("getGeometricJacobian", &Manipulator_DOF::getGeometricJacobian)
-    .def("getGeometricJacobianTimeDerivative", &Manipulator_DOF::getGeometricJacobianTimeDerivative)
-    .def("getEEFrameJacobian", &Manipulator_DOF::getEEFrameJacobian)
-    .def("getEEVelocityManipulability", &Manipulator_DOF::getEEVelocityManipulability)
-    .def("getEEForceManipulability", &Manipulator_DOF::getEEForceManipulability)
-    .def("getEEDynamicManipulability", &Manipulator_DOF::getEEDynamicManipulability)
-    .def("getEEKinematicNullspaceProjector", &Manipulator_DOF::getEEKinematicNullspaceProjector)
-    .def("getJointTorques", &Manipulator_DOF::getJointTorques, py::arg("position"), py::arg("velocity"), py::arg("acceleration"), py::arg("gravity") = 9.81, py::arg("ee_wrench") = Wrench::Zero())
-    .def("getJointAccelerations", &Manipulator_DOF::getJointAccelerations)
-    .def("getMassMatrix", &Manipulator_DOF::getMassMatrix);
+    .def("getForwardKinematicsCache", &Manipulator_DOF::getForwardKinematicsCache)
+    .def("getEEMotor", &Manipulator_DOF::getEEMotor, py::call_guard<py::gil_scoped_release>())
+    .def("getEEMotorBatch", &Manipulator_DOF::getEEMotorBatch, py::arg("positions"))
+    .def("getEETransformationMatrixBatch", &Manipulator_DOF::getEETransformationMatrixBatch, py::arg("positions"))
+    .def("getEEAnalyticJacobian", &Manipulator_DOF::getEEAnalyticJacobian, py::call_guard<py::gil_scoped_release>())
+    .def("getEEAnalyticJacobianArray", &Manipulator_DOF::getEEAnalyticJacobianArray, py::arg("position"))
+    .def("getEEAnalyticJacobianBatch", &Manipulator_DOF::getEEAnalyticJacobianBatch, py::arg("positions"))
+    .def("getEEGeometricJacobian", &Manipulator_DOF::getEEGeometricJacobian, py::call_guard<py::gil_scoped_release>())
+    .def("getEEGeometricJacobianArray", &Manipulator_DOF::getEEGeometricJacobianArray, py::arg("position"))
+    .def("getEEGeometricJacobianBatch", &Manipulator_DOF::getEEGeometricJacobianBatch, py::arg("positions"))
+    .def("getGeometricJacobian", &Manipulator_DOF::getGeometricJacobian, py::call_guard<py::gil_scoped_release>())
+    .def("getGeometricJacobianTimeDerivative", &Manipulator_DOF::getGeometricJacobianTimeDerivative, py::call_guard<py::gil_scoped_release>())
+    .def("getEEFrameJacobian", &Manipulator_DOF::getEEFrameJacobian, py::call_guard<py::gil_scoped_release>())
+    .def("getEEVelocityManipulability", &Manipulator_DOF::getEEVelocityManipulability, py::call_guard<py::gil_scoped_release>())
+    .def("getEEForceManipulability", &Manipulator_DOF::getEEForceManipulability, py::call_guard<py::gil_scoped_release>())
+    .def("getEEDynamicManipulability", &Manipulator_DOF::getEEDynamicManipulability, py::call_guard<py::gil_scoped_release>())
+    .def("getEEKinematicNullspaceProjector", &Manipulator_DOF::getEEKinematicNullspaceProjector, py::call_guard<py::gil_scoped_release>())
+    .def("getJointTorques", &Manipulator_DOF::getJointTorques, py::arg("position"), py::arg("velocity"), py::arg("acceleration"), py::arg("gravity") = 9.81, py::arg("ee_wrench") = Wrench::Zero(), py::call_guard<py::gil_scoped_release>())
+    .def("getJointAccelerations", &Manipulator_DOF::getJointAccelerations, py::call_guard<py::gil_scoped_release>())
+    .def("getJointTorquesBatch", &Manipulator_DOF::getJointTorquesBatch, py::arg("positions"), py::arg("velocities"), py::arg("accelerations"), py::arg("gravity") = 9.81, py::arg("nbThreads") = 1)
+    .def("getJointAccelerationsBatch", &Manipulator_DOF::getJointAccelerationsBatch, py::arg("positions"), py::arg("velocities"), py::arg("torques"), py::arg("gravity") = 9.81, py::arg("nbThreads") = 1)
+    .def("getMassMatrix", &Manipulator_DOF::getMassMatrix, py::call_guard<py::gil_scoped_release>());
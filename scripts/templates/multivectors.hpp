@@ -1,4 +1,4 @@
-py::class_<MULTIVECTOR_CLASS_NAME>(m, "MULTIVECTOR_CLASS_NAME")
+py::class_<MULTIVECTOR_CLASS_NAME>(m, "MULTIVECTOR_CLASS_NAME", py::buffer_protocol())
     .def(py::init<>())
 BEGIN_DOUBLE_CONSTRUCTOR
     .def(py::init<const double&>())
@@ -8,6 +8,8 @@ END_DOUBLE_CONSTRUCTOR
 
     .def("setParameters", py::overload_cast<const MULTIVECTOR_CLASS_NAME::Parameters&>(&MULTIVECTOR_CLASS_NAME::setParameters))
     .def("vector", py::overload_cast<>(&MULTIVECTOR_CLASS_NAME::vector, py::const_))
+    .def_property_readonly("data", &parameters_view<MULTIVECTOR_CLASS_NAME>)
+    .def_buffer(&parameters_buffer<MULTIVECTOR_CLASS_NAME>)
 
     .def("reverse", &evaluated_reverse<MULTIVECTOR_CLASS_NAME>)
 
@@ -4,4 +4,8 @@ py::class_<SingleManipulatorDualTarget_DOF_TOOL_TARGET>(m, "SingleManipulatorDua
     .def("getGradient", &SingleManipulatorDualTarget_DOF_TOOL_TARGET::getGradient)
     .def("getJacobian", &SingleManipulatorDualTarget_DOF_TOOL_TARGET::getJacobian)
     .def("getGradientAndHessian", &SingleManipulatorDualTarget_DOF_TOOL_TARGET_getGradientAndHessian)
-    .def("getError", &SingleManipulatorDualTarget_DOF_TOOL_TARGET::getError);
+    .def("getError", &SingleManipulatorDualTarget_DOF_TOOL_TARGET::getError)
+    .def("getValues", &pygafro::CostFunctionBatch<double, DOF, SingleManipulatorDualTarget_DOF_TOOL_TARGET>::getValues, py::arg("positions"), py::arg("nbThreads") = 1)
+    .def("getErrors", &pygafro::CostFunctionBatch<double, DOF, SingleManipulatorDualTarget_DOF_TOOL_TARGET>::getErrors, py::arg("positions"), py::arg("nbThreads") = 1)
+    .def("getGradients", &pygafro::CostFunctionBatch<double, DOF, SingleManipulatorDualTarget_DOF_TOOL_TARGET>::getGradients, py::arg("positions"), py::arg("nbThreads") = 1)
+    .def("solve", &SingleManipulatorDualTarget_DOF_TOOL_TARGET_solve, py::arg("arm"), py::arg("options"), py::call_guard<py::gil_scoped_release>());
@@ -2,4 +2,8 @@ py::class_<SingleManipulatorMotorCost_DOF>(m, "SingleManipulatorMotorCost_DOF")
     .def(py::init(&create_SingleManipulatorMotorCost_DOF))
     .def("getGradientAndHessian", &SingleManipulatorMotorCost_DOF_getGradientAndHessian)
     .def("getJacobian", &SingleManipulatorMotorCost_DOF::getJacobian)
-    .def("getError", &SingleManipulatorMotorCost_DOF::getError);
+    .def("getError", &SingleManipulatorMotorCost_DOF::getError)
+    .def("getValues", &pygafro::CostFunctionBatch<double, DOF, SingleManipulatorMotorCost_DOF>::getValues, py::arg("positions"), py::arg("nbThreads") = 1)
+    .def("getErrors", &pygafro::CostFunctionBatch<double, DOF, SingleManipulatorMotorCost_DOF>::getErrors, py::arg("positions"), py::arg("nbThreads") = 1)
+    .def("getGradients", &pygafro::CostFunctionBatch<double, DOF, SingleManipulatorMotorCost_DOF>::getGradients, py::arg("positions"), py::arg("nbThreads") = 1)
+    .def("solve", &SingleManipulatorMotorCost_DOF_solve, py::arg("arm"), py::arg("options"), py::call_guard<py::gil_scoped_release>());
@@ -18,3 +18,10 @@ std::tuple<Eigen::Matrix<double, DOF, 1>, Eigen::Matrix<double, DOF, DOF>> Singl
     return std::make_tuple(gradient, hessian);
 }
 
+
+pygafro::InverseKinematicsResult<double> SingleManipulatorMotorCost_DOF_solve(
+    const SingleManipulatorMotorCost_DOF& self, const Manipulator_DOF* arm, const pygafro::InverseKinematicsOptions<double>& options
+)
+{
+    return pygafro::solveInverseKinematics<double, DOF>(self, arm->getManipulator(), options);
+}
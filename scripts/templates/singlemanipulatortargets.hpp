@@ -4,4 +4,8 @@ py::class_<SingleManipulatorTarget_DOF_TOOL_TARGET>(m, "SingleManipulatorTarget_
     .def("getGradient", &SingleManipulatorTarget_DOF_TOOL_TARGET::getGradient)
     .def("getJacobian", &SingleManipulatorTarget_DOF_TOOL_TARGET::getJacobian)
     .def("getGradientAndHessian", &SingleManipulatorTarget_DOF_TOOL_TARGET_getGradientAndHessian)
-    .def("getError", &SingleManipulatorTarget_DOF_TOOL_TARGET::getError);
+    .def("getError", &SingleManipulatorTarget_DOF_TOOL_TARGET::getError)
+    .def("getValues", &pygafro::CostFunctionBatch<double, DOF, SingleManipulatorTarget_DOF_TOOL_TARGET>::getValues, py::arg("positions"), py::arg("nbThreads") = 1)
+    .def("getErrors", &pygafro::CostFunctionBatch<double, DOF, SingleManipulatorTarget_DOF_TOOL_TARGET>::getErrors, py::arg("positions"), py::arg("nbThreads") = 1)
+    .def("getGradients", &pygafro::CostFunctionBatch<double, DOF, SingleManipulatorTarget_DOF_TOOL_TARGET>::getGradients, py::arg("positions"), py::arg("nbThreads") = 1)
+    .def("solve", &SingleManipulatorTarget_DOF_TOOL_TARGET_solve, py::arg("arm"), py::arg("options"), py::call_guard<py::gil_scoped_release>());
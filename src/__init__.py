@@ -8,11 +8,24 @@
 
 from ._pygafro import *  # noqa: we want to import all exported symbols from the shared library
 from ._pygafro import visual as visual  # noqa
+from .compositecostfunction import CompositeCostFunction  # noqa
+from .inversekinematics import solveInverseKinematics  # noqa
 from .manipulator import createManipulator  # noqa
 from .multivector import Multivector  # noqa
+from .multivectorarray import CircleArray  # noqa
+from .multivectorarray import DirectionVectorArray  # noqa
+from .multivectorarray import LineArray  # noqa
+from .multivectorarray import MotorArray  # noqa
+from .multivectorarray import PlaneArray  # noqa
+from .multivectorarray import PointArray  # noqa
+from .multivectorarray import PointPairArray  # noqa
+from .multivectorarray import RotorArray  # noqa
+from .multivectorarray import SphereArray  # noqa
+from .multivectorarray import VectorArray  # noqa
 from .singlemanipulatordualtarget import SingleManipulatorDualTarget  # noqa
 from .singlemanipulatormotorcost import SingleManipulatorMotorCost  # noqa
 from .singlemanipulatortarget import SingleManipulatorTarget  # noqa
+from .system import System  # noqa
 
 Scalar = lambda value: Multivector_scalar([value])  # noqa
 E1 = lambda value: Multivector_e1([value])  # noqa
@@ -0,0 +1,46 @@
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+from ._pygafro import internals
+from .multivector import _toDynamicMultivector
+
+
+# Weighted sum of several cost terms on the same manipulator, evaluated in one native
+# call: the motor and the analytic Jacobian of the end-effector are computed once per
+# configuration for all the terms.
+#
+# The errors (and Jacobians) of the terms are stacked, each one multiplied by the square
+# root of its weight. 'evaluate(x)' returns the error, the Jacobian, the gradient and the
+# Gauss-Newton Hessian at once. Can be used with 'solveInverseKinematics()'.
+class CompositeCostFunction(internals.CompositeCostFunction):
+
+    def __init__(self, arm):
+        internals.CompositeCostFunction.__init__(self, arm.getEEKinematicChain())
+
+        # The kinematic chain references the system of the arm
+        self.arm = arm
+
+    # Outer product of the target with the tool moved by the end-effector (like
+    # SingleManipulatorTarget)
+    def addTarget(self, tool, target, weight=1.0):
+        internals.CompositeCostFunction.addTarget(
+            self, _toDynamicMultivector(tool), _toDynamicMultivector(target), weight
+        )
+
+    # Inner product of the duals of the target and of the tool moved by the end-effector
+    # (like SingleManipulatorDualTarget)
+    def addDualTarget(self, tool, target, weight=1.0):
+        internals.CompositeCostFunction.addDualTarget(
+            self, _toDynamicMultivector(tool), _toDynamicMultivector(target), weight
+        )
+
+    # Distance to the joint limits of the arm (zero within the limits)
+    def addJointLimits(self, weight=1.0):
+        internals.CompositeCostFunction.addJointLimits(
+            self, self.arm.getJointLimitsMin(), self.arm.getJointLimitsMax(), weight
+        )
@@ -0,0 +1,137 @@
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+import numpy as np
+
+
+# Results of the evaluation of a cost function for one configuration of the arm, computed
+# on demand and only once
+class _Evaluation:
+
+    def __init__(self, arm, position):
+        self.arm = arm
+        self.position = position
+
+        self._motor = None
+        self._jacobian_ee = None
+
+        # Motor from the target to the end-effector (see SingleManipulatorMotorCost)
+        self.relative_motor = None
+
+        self.error = None
+        self.jacobian = None
+        self.gradient = None
+        self.hessian = None
+
+    def motor(self):
+        if self._motor is None:
+            self._motor = self.arm.getEEMotor(self.position)
+        return self._motor
+
+    def jacobianEE(self):
+        if self._jacobian_ee is None:
+            self._jacobian_ee = self.arm.getEEAnalyticJacobian(self.position)
+        return self._jacobian_ee
+
+
+# Base class of the Python implementations of the cost functions (used when no C++ one
+# was compiled). The subclasses must implement '_computeError(evaluation)' and
+# '_computeJacobian(evaluation)'.
+#
+# The evaluation of the last configuration is kept: optimizers usually ask for the value,
+# the gradient and the Hessian of the same configuration in separate calls. Like with the
+# compiled cost functions, the caller gets its own copy of the returned arrays.
+#
+# The batch methods ('getValues()', 'getErrors()' and 'getGradients()') take a (N, dof)
+# array of configurations. 'nbThreads' is only there for compatibility with the compiled
+# cost functions: the configurations are processed sequentially.
+class _CostFunction:
+
+    def __init__(self, arm):
+        self.arm = arm
+        self._last_evaluation = None
+
+    def getValue(self, x):
+        error = self._error(self._evaluate(x))
+        return np.inner(error, error)
+
+    def getError(self, x):
+        return self._error(self._evaluate(x)).copy()
+
+    def getJacobian(self, x):
+        return self._jacobian(self._evaluate(x)).copy()
+
+    def getGradient(self, x):
+        return self._gradient(self._evaluate(x)).copy()
+
+    def getGradientAndHessian(self, x):
+        evaluation = self._evaluate(x)
+
+        if evaluation.hessian is None:
+            jacobian = self._jacobian(evaluation)
+            evaluation.hessian = jacobian.T @ jacobian
+
+        return (self._gradient(evaluation).copy(), evaluation.hessian.copy())
+
+    def getValues(self, positions, nbThreads=1):
+        return np.array(
+            [self.getValue(x) for x in self._checkConfigurations(positions)]
+        )
+
+    def getErrors(self, positions, nbThreads=1):
+        positions = self._checkConfigurations(positions)
+
+        if positions.shape[0] == 0:
+            return np.zeros((0, self.getError(np.zeros(self.arm.dof)).shape[0]))
+
+        return np.array([self.getError(x) for x in positions])
+
+    def getGradients(self, positions, nbThreads=1):
+        positions = self._checkConfigurations(positions)
+        return np.array([self.getGradient(x) for x in positions]).reshape(
+            (positions.shape[0], self.arm.dof)
+        )
+
+    def _checkConfigurations(self, positions):
+        positions = np.asarray(positions, dtype=np.float64)
+
+        if (positions.ndim != 2) or (positions.shape[1] != self.arm.dof):
+            raise ValueError("Invalid number of DOF")
+
+        return positions
+
+    def _error(self, evaluation):
+        if evaluation.error is None:
+            evaluation.error = self._computeError(evaluation)
+
+        return evaluation.error
+
+    def _jacobian(self, evaluation):
+        if evaluation.jacobian is None:
+            evaluation.jacobian = self._computeJacobian(evaluation)
+
+        return evaluation.jacobian
+
+    def _gradient(self, evaluation):
+        if evaluation.gradient is None:
+            evaluation.gradient = self._jacobian(evaluation).T @ self._error(evaluation)
+
+        return evaluation.gradient
+
+    def _evaluate(self, x):
+        try:
+            x = x.tolist()
+        except AttributeError:
+            x = list(x)
+
+        evaluation = self._last_evaluation
+        if (evaluation is None) or (evaluation.position != x):
+            evaluation = _Evaluation(self.arm, x)
+            self._last_evaluation = evaluation
+
+        return evaluation
@@ -49,7 +49,9 @@ const std::string __repr__(T &obj) {
 
 
 
+void init_dynamicmultivector(py::module &m);
 void init_motor(py::module &m);
+void init_multivectorarray(py::module &m);
 void init_rotor(py::module &m);
 
 
@@ -231,4 +233,11 @@ void init_algebra(py::module &m)
         .def("get_e3i", &Motor::Exponential::get<gafro::blades::e3i>)
         .def("get_e123i", &Motor::Exponential::get<gafro::blades::e123i>)
         .def_static("jacobian", static_cast<Eigen::Matrix<double, 8, 6> (*)(const Motor::Generator&)>(&Motor::Exponential::getJacobian));
+
+
+    // MultivectorArray class
+    init_multivectorarray(m);
+
+    // DynamicMultivector class
+    init_dynamicmultivector(m);
 }
@@ -0,0 +1,383 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <array>
+#include <bitset>
+#include <cmath>
+#include <cstdint>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <Eigen/Core>
+
+#include "algebra/ProductTable.hpp"
+
+
+namespace pygafro
+{
+    // Multivector whose blades are only known at runtime, stored as a 32-bit mask (bit 'i'
+    // set if the blade 'i' is present). The parameters of all the blades are stored, the
+    // ones of the blades not in the mask being zero.
+    //
+    // Used for the combinations of blades not compiled as gafro multivectors: the products
+    // are computed from the tables of the products of basis blades.
+    class DynamicMultivector
+    {
+        public:
+            typedef std::array<double, NB_BLADES> Values;
+
+        public:
+            explicit DynamicMultivector(uint32_t mask = 0)
+            : _mask(mask)
+            {
+                _values.fill(0.0);
+            }
+
+            DynamicMultivector(uint32_t mask, const Eigen::VectorXd &parameters)
+            : DynamicMultivector(mask)
+            {
+                setParameters(parameters);
+            }
+
+            // Conversion from a gafro multivector
+            template <class M>
+            static DynamicMultivector fromMultivector(const M &mv)
+            {
+                DynamicMultivector result;
+
+                const auto blades = M::blades();
+                const auto &parameters = mv.vector();
+
+                for (size_t i = 0; i < blades.size(); ++i)
+                {
+                    result._mask |= (1u << blades[i]);
+                    result._values[blades[i]] = parameters[i];
+                }
+
+                return result;
+            }
+
+            // Returns the mask corresponding to a list of blades
+            static uint32_t toMask(const std::vector<int> &blades)
+            {
+                uint32_t mask = 0;
+
+                for (int blade : blades)
+                {
+                    if ((blade < 0) || (blade >= NB_BLADES))
+                        throw std::invalid_argument("Invalid blade: " + std::to_string(blade));
+
+                    mask |= (1u << blade);
+                }
+
+                return mask;
+            }
+
+            inline uint32_t mask() const
+            {
+                return _mask;
+            }
+
+            inline int size() const
+            {
+                return std::bitset<NB_BLADES>(_mask).count();
+            }
+
+            std::vector<int> blades() const
+            {
+                std::vector<int> result;
+                result.reserve(size());
+
+                for (int k = 0; k < NB_BLADES; ++k)
+                {
+                    if (_mask & (1u << k))
+                        result.push_back(k);
+                }
+
+                return result;
+            }
+
+            inline bool has(int blade) const
+            {
+                return (blade >= 0) && (blade < NB_BLADES) && (_mask & (1u << blade));
+            }
+
+            // Parameters of the blades in the mask, sorted by blade
+            Eigen::VectorXd vector() const
+            {
+                return vector(_mask);
+            }
+
+            // Parameters of the blades in the provided mask (0 for the ones not in the mask
+            // of this multivector), sorted by blade
+            Eigen::VectorXd vector(uint32_t mask) const
+            {
+                Eigen::VectorXd result(std::bitset<NB_BLADES>(mask).count());
+
+                int i = 0;
+                for (int k = 0; k < NB_BLADES; ++k)
+                {
+                    if (mask & (1u << k))
+                        result[i++] = _values[k];
+                }
+
+                return result;
+            }
+
+            // Returns a copy only containing the blades of the provided mask
+            DynamicMultivector project(uint32_t mask) const
+            {
+                DynamicMultivector result(_mask & mask);
+
+                for (int k = 0; k < NB_BLADES; ++k)
+                {
+                    if (result._mask & (1u << k))
+                        result._values[k] = _values[k];
+                }
+
+                return result;
+            }
+
+            void setParameters(const Eigen::VectorXd &parameters)
+            {
+                if (parameters.size() != size())
+                    throw std::length_error("Invalid number of parameters");
+
+                int i = 0;
+                for (int k = 0; k < NB_BLADES; ++k)
+                    _values[k] = ((_mask & (1u << k)) ? parameters[i++] : 0.0);
+            }
+
+            inline const Values &values() const
+            {
+                return _values;
+            }
+
+            // Returns 0 for the blades not in the mask
+            inline double get(int blade) const
+            {
+                return has(blade) ? _values[blade] : 0.0;
+            }
+
+            // Does nothing for the blades not in the mask
+            inline void set(int blade, double value)
+            {
+                if (has(blade))
+                    _values[blade] = value;
+            }
+
+            DynamicMultivector geometricProduct(const DynamicMultivector &other) const
+            {
+                return product(other, getProductTable<Product::GEOMETRIC>());
+            }
+
+            DynamicMultivector innerProduct(const DynamicMultivector &other) const
+            {
+                return product(other, getProductTable<Product::INNER>());
+            }
+
+            DynamicMultivector outerProduct(const DynamicMultivector &other) const
+            {
+                return product(other, getProductTable<Product::OUTER>());
+            }
+
+            DynamicMultivector reverse() const
+            {
+                return unary(getReverseTable());
+            }
+
+            DynamicMultivector dual() const
+            {
+                return unary(getDualTable());
+            }
+
+            // Scalar part of (this * this.reverse())
+            double squaredNorm() const
+            {
+                const ProductTable &table = getProductTable<Product::GEOMETRIC>();
+                const UnaryTable &reverse = getReverseTable();
+
+                double result = 0.0;
+
+                for (int i = 0; i < NB_BLADES; ++i)
+                {
+                    if (!(_mask & (1u << i)))
+                        continue;
+
+                    for (int j = 0; j < NB_BLADES; ++j)
+                    {
+                        if (!(_mask & (1u << j)))
+                            continue;
+
+                        for (const Term &r : reverse.terms[j])
+                        {
+                            for (const Term &t : table.terms[i][r.blade])
+                            {
+                                if (t.blade == 0)
+                                    result += r.coefficient * t.coefficient * _values[i] * _values[j];
+                            }
+                        }
+                    }
+                }
+
+                return result;
+            }
+
+            double norm() const
+            {
+                return std::sqrt(std::abs(squaredNorm()));
+            }
+
+            double signedNorm() const
+            {
+                const double squared_norm = squaredNorm();
+                return (squared_norm < 0.0 ? -1.0 : 1.0) * std::sqrt(std::abs(squared_norm));
+            }
+
+            DynamicMultivector inverse() const
+            {
+                DynamicMultivector result = reverse();
+                result /= squaredNorm();
+                return result;
+            }
+
+            void normalize()
+            {
+                *this /= norm();
+            }
+
+            DynamicMultivector normalized() const
+            {
+                DynamicMultivector result(*this);
+                result.normalize();
+                return result;
+            }
+
+            // The blades of the result are the union of the blades of both operands
+            DynamicMultivector &operator+=(const DynamicMultivector &other)
+            {
+                _mask |= other._mask;
+
+                for (int k = 0; k < NB_BLADES; ++k)
+                    _values[k] += other._values[k];
+
+                return *this;
+            }
+
+            DynamicMultivector &operator-=(const DynamicMultivector &other)
+            {
+                _mask |= other._mask;
+
+                for (int k = 0; k < NB_BLADES; ++k)
+                    _values[k] -= other._values[k];
+
+                return *this;
+            }
+
+            DynamicMultivector &operator*=(double value)
+            {
+                for (double &v : _values)
+                    v *= value;
+
+                return *this;
+            }
+
+            DynamicMultivector &operator/=(double value)
+            {
+                for (double &v : _values)
+                    v /= value;
+
+                return *this;
+            }
+
+            DynamicMultivector operator+(const DynamicMultivector &other) const
+            {
+                DynamicMultivector result(*this);
+                result += other;
+                return result;
+            }
+
+            DynamicMultivector operator-(const DynamicMultivector &other) const
+            {
+                DynamicMultivector result(*this);
+                result -= other;
+                return result;
+            }
+
+            DynamicMultivector operator*(double value) const
+            {
+                DynamicMultivector result(*this);
+                result *= value;
+                return result;
+            }
+
+            DynamicMultivector operator/(double value) const
+            {
+                DynamicMultivector result(*this);
+                result /= value;
+                return result;
+            }
+
+        private:
+            // The blades of the result only depend on the blades of the operands (not on the
+            // values of their parameters), like with the gafro multivectors
+            DynamicMultivector product(const DynamicMultivector &other, const ProductTable &table) const
+            {
+                DynamicMultivector result;
+
+                for (int i = 0; i < NB_BLADES; ++i)
+                {
+                    if (!(_mask & (1u << i)))
+                        continue;
+
+                    for (int j = 0; j < NB_BLADES; ++j)
+                    {
+                        if (!(other._mask & (1u << j)))
+                            continue;
+
+                        const double value = _values[i] * other._values[j];
+
+                        for (const Term &t : table.terms[i][j])
+                        {
+                            result._mask |= (1u << t.blade);
+                            result._values[t.blade] += t.coefficient * value;
+                        }
+                    }
+                }
+
+                return result;
+            }
+
+            DynamicMultivector unary(const UnaryTable &table) const
+            {
+                DynamicMultivector result;
+
+                for (int i = 0; i < NB_BLADES; ++i)
+                {
+                    if (!(_mask & (1u << i)))
+                        continue;
+
+                    for (const Term &t : table.terms[i])
+                    {
+                        result._mask |= (1u << t.blade);
+                        result._values[t.blade] += t.coefficient * _values[i];
+                    }
+                }
+
+                return result;
+            }
+
+        private:
+            uint32_t _mask;
+            Values _values;
+    };
+
+}  // namespace pygafro
@@ -0,0 +1,372 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+
+#include <algorithm>
+#include <cmath>
+#include <stdexcept>
+#include <string>
+#include <tuple>
+#include <vector>
+
+#include "algebra/ProductTable.hpp"
+
+
+namespace pygafro
+{
+    // Array of N multivectors sharing the same blades, stored as a contiguous (N, nb_blades)
+    // NumPy array. All the operations are performed by looping over the whole array in C++,
+    // without holding the GIL.
+    class MultivectorArray
+    {
+        public:
+            typedef pybind11::array_t<double, pybind11::array::c_style | pybind11::array::forcecast> Array;
+
+        public:
+            // Wraps the provided (N, nb_blades) array, without copy if it is a C-contiguous
+            // array of doubles
+            MultivectorArray(const std::vector<int> &blades, const Array &data)
+            : _blades(blades), _data(data)
+            {
+                checkBlades();
+
+                if ((_data.ndim() != 2) || (_data.shape(1) != (pybind11::ssize_t) _blades.size()))
+                    throw std::length_error("Invalid number of parameters");
+            }
+
+            // Creates an array of N multivectors with all their parameters set to zero
+            MultivectorArray(const std::vector<int> &blades, size_t n)
+            : _blades(blades), _data(std::vector<pybind11::ssize_t>{ (pybind11::ssize_t) n, (pybind11::ssize_t) blades.size() })
+            {
+                checkBlades();
+                std::fill(_data.mutable_data(), _data.mutable_data() + _data.size(), 0.0);
+            }
+
+            inline size_t size() const
+            {
+                return _data.shape(0);
+            }
+
+            inline const std::vector<int> &blades() const
+            {
+                return _blades;
+            }
+
+            // Returns the underlying (N, nb_blades) array (no copy)
+            inline const Array &vector() const
+            {
+                return _data;
+            }
+
+            MultivectorArray geometricProduct(const MultivectorArray &other) const
+            {
+                return product(other, getProductTable<Product::GEOMETRIC>());
+            }
+
+            MultivectorArray innerProduct(const MultivectorArray &other) const
+            {
+                return product(other, getProductTable<Product::INNER>());
+            }
+
+            MultivectorArray outerProduct(const MultivectorArray &other) const
+            {
+                return product(other, getProductTable<Product::OUTER>());
+            }
+
+            MultivectorArray reverse() const
+            {
+                return unary(getReverseTable());
+            }
+
+            MultivectorArray dual() const
+            {
+                return unary(getDualTable());
+            }
+
+            Array squaredNorm() const
+            {
+                // squaredNorm = scalar part of (mv * mv.reverse())
+                const ProductTable &table = getProductTable<Product::GEOMETRIC>();
+                const UnaryTable &reverse = getReverseTable();
+
+                std::vector<std::tuple<int, int, double>> terms;
+                for (size_t i = 0; i < _blades.size(); ++i)
+                {
+                    for (size_t j = 0; j < _blades.size(); ++j)
+                    {
+                        for (const Term &r : reverse.terms[_blades[j]])
+                        {
+                            for (const Term &t : table.terms[_blades[i]][r.blade])
+                            {
+                                if (t.blade == 0)
+                                    terms.emplace_back(i, j, r.coefficient * t.coefficient);
+                            }
+                        }
+                    }
+                }
+
+                const size_t n = size();
+                const size_t nb_blades = _blades.size();
+
+                Array result(std::vector<pybind11::ssize_t>{ (pybind11::ssize_t) n });
+
+                const double *input = _data.data();
+                double *output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    for (size_t k = 0; k < n; ++k)
+                    {
+                        const double *mv = input + k * nb_blades;
+
+                        double value = 0.0;
+                        for (const auto &[i, j, coefficient] : terms)
+                            value += coefficient * mv[i] * mv[j];
+
+                        output[k] = value;
+                    }
+                }
+
+                return result;
+            }
+
+            Array norm() const
+            {
+                Array result = squaredNorm();
+
+                double *values = result.mutable_data();
+                for (pybind11::ssize_t k = 0; k < result.size(); ++k)
+                    values[k] = std::sqrt(std::abs(values[k]));
+
+                return result;
+            }
+
+            Array signedNorm() const
+            {
+                Array result = squaredNorm();
+
+                double *values = result.mutable_data();
+                for (pybind11::ssize_t k = 0; k < result.size(); ++k)
+                    values[k] = (values[k] < 0.0 ? -1.0 : 1.0) * std::sqrt(std::abs(values[k]));
+
+                return result;
+            }
+
+            // Applies the versors (motors, rotors, translators) of this array to the objects
+            // of another one: objects[k] -> self[k] * objects[k] * self[k].reverse(). The
+            // result has the same blades than the objects.
+            MultivectorArray apply(const MultivectorArray &objects) const
+            {
+                const MultivectorArray result = geometricProduct(objects).geometricProduct(reverse());
+                return result.project(objects._blades);
+            }
+
+            static int getBladeIndex(const std::string &name)
+            {
+                static const char *NAMES[NB_BLADES] = {
+                    "scalar", "e0", "e1", "e01", "e2", "e02", "e12", "e012",
+                    "e3", "e03", "e13", "e013", "e23", "e023", "e123", "e0123",
+                    "ei", "e0i", "e1i", "e01i", "e2i", "e02i", "e12i", "e012i",
+                    "e3i", "e03i", "e13i", "e013i", "e23i", "e023i", "e123i", "e0123i",
+                };
+
+                for (int i = 0; i < NB_BLADES; ++i)
+                {
+                    if (name == NAMES[i])
+                        return i;
+                }
+
+                throw std::invalid_argument("Unknown blade: " + name);
+            }
+
+        private:
+            void checkBlades() const
+            {
+                for (size_t i = 0; i < _blades.size(); ++i)
+                {
+                    if ((_blades[i] < 0) || (_blades[i] >= NB_BLADES))
+                        throw std::invalid_argument("Invalid blade: " + std::to_string(_blades[i]));
+
+                    if ((i > 0) && (_blades[i] <= _blades[i - 1]))
+                        throw std::invalid_argument("The blades must be sorted and unique");
+                }
+            }
+
+            // Returns the number of multivectors of the result of an operation between two
+            // arrays: either both have the same size, or one of them contains only one
+            // multivector (which is used with all the multivectors of the other one)
+            size_t broadcastSize(const MultivectorArray &other) const
+            {
+                if (size() == other.size())
+                    return size();
+                else if (size() == 1)
+                    return other.size();
+                else if (other.size() == 1)
+                    return size();
+
+                throw std::length_error("Incompatible array sizes");
+            }
+
+            MultivectorArray product(const MultivectorArray &other, const ProductTable &table) const
+            {
+                // Determine the blades of the result
+                uint32_t mask = 0;
+                for (int i : _blades)
+                {
+                    for (int j : other._blades)
+                    {
+                        for (const Term &t : table.terms[i][j])
+                            mask |= (1u << t.blade);
+                    }
+                }
+
+                std::vector<int> blades;
+                int positions[NB_BLADES];
+                for (int k = 0; k < NB_BLADES; ++k)
+                {
+                    if (mask & (1u << k))
+                    {
+                        positions[k] = blades.size();
+                        blades.push_back(k);
+                    }
+                }
+
+                // Flatten the table for the blades of both operands
+                std::vector<std::tuple<int, int, int, double>> terms;
+                for (size_t i = 0; i < _blades.size(); ++i)
+                {
+                    for (size_t j = 0; j < other._blades.size(); ++j)
+                    {
+                        for (const Term &t : table.terms[_blades[i]][other._blades[j]])
+                            terms.emplace_back(i, j, positions[t.blade], t.coefficient);
+                    }
+                }
+
+                const size_t n = broadcastSize(other);
+                const size_t nb_blades1 = _blades.size();
+                const size_t nb_blades2 = other._blades.size();
+                const size_t step1 = (size() == 1 ? 0 : nb_blades1);
+                const size_t step2 = (other.size() == 1 ? 0 : nb_blades2);
+
+                MultivectorArray result(blades, n);
+
+                const double *input1 = _data.data();
+                const double *input2 = other._data.data();
+                double *output = result._data.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    for (size_t k = 0; k < n; ++k)
+                    {
+                        const double *a = input1 + k * step1;
+                        const double *b = input2 + k * step2;
+                        double *c = output + k * blades.size();
+
+                        for (const auto &[i, j, pos, coefficient] : terms)
+                            c[pos] += coefficient * a[i] * b[j];
+                    }
+                }
+
+                return result;
+            }
+
+            MultivectorArray unary(const UnaryTable &table) const
+            {
+                uint32_t mask = 0;
+                for (int i : _blades)
+                {
+                    for (const Term &t : table.terms[i])
+                        mask |= (1u << t.blade);
+                }
+
+                std::vector<int> blades;
+                int positions[NB_BLADES];
+                for (int k = 0; k < NB_BLADES; ++k)
+                {
+                    if (mask & (1u << k))
+                    {
+                        positions[k] = blades.size();
+                        blades.push_back(k);
+                    }
+                }
+
+                std::vector<std::tuple<int, int, double>> terms;
+                for (size_t i = 0; i < _blades.size(); ++i)
+                {
+                    for (const Term &t : table.terms[_blades[i]])
+                        terms.emplace_back(i, positions[t.blade], t.coefficient);
+                }
+
+                const size_t n = size();
+                const size_t nb_blades = _blades.size();
+
+                MultivectorArray result(blades, n);
+
+                const double *input = _data.data();
+                double *output = result._data.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    for (size_t k = 0; k < n; ++k)
+                    {
+                        const double *a = input + k * nb_blades;
+                        double *c = output + k * blades.size();
+
+                        for (const auto &[i, pos, coefficient] : terms)
+                            c[pos] += coefficient * a[i];
+                    }
+                }
+
+                return result;
+            }
+
+            // Returns a copy of the array only containing the specified blades
+            MultivectorArray project(const std::vector<int> &blades) const
+            {
+                std::vector<std::pair<int, int>> mapping;
+                for (size_t i = 0; i < blades.size(); ++i)
+                {
+                    auto iter = std::find(_blades.begin(), _blades.end(), blades[i]);
+                    if (iter != _blades.end())
+                        mapping.emplace_back(i, iter - _blades.begin());
+                }
+
+                const size_t n = size();
+                const size_t nb_blades = _blades.size();
+
+                MultivectorArray result(blades, n);
+
+                const double *input = _data.data();
+                double *output = result._data.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    for (size_t k = 0; k < n; ++k)
+                    {
+                        for (const auto &[dst, src] : mapping)
+                            output[k * blades.size() + dst] = input[k * nb_blades + src];
+                    }
+                }
+
+                return result;
+            }
+
+        private:
+            std::vector<int> _blades;
+            Array _data;
+    };
+
+}  // namespace pygafro
@@ -0,0 +1,151 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <array>
+#include <vector>
+
+#include <gafro/gafro.hpp>
+#include "algebra/multivector_utils.hpp"
+#include "algebra/products_utils.hpp"
+
+
+namespace pygafro
+{
+    // Multivector containing all the blades, used to compute the tables below
+    typedef gafro::Multivector<double,
+        gafro::blades::scalar, gafro::blades::e0, gafro::blades::e1, gafro::blades::e01,
+        gafro::blades::e2, gafro::blades::e02, gafro::blades::e12, gafro::blades::e012,
+        gafro::blades::e3, gafro::blades::e03, gafro::blades::e13, gafro::blades::e013,
+        gafro::blades::e23, gafro::blades::e023, gafro::blades::e123, gafro::blades::e0123,
+        gafro::blades::ei, gafro::blades::e0i, gafro::blades::e1i, gafro::blades::e01i,
+        gafro::blades::e2i, gafro::blades::e02i, gafro::blades::e12i, gafro::blades::e012i,
+        gafro::blades::e3i, gafro::blades::e03i, gafro::blades::e13i, gafro::blades::e013i,
+        gafro::blades::e23i, gafro::blades::e023i, gafro::blades::e123i, gafro::blades::e0123i
+    > FullMultivector;
+
+    constexpr int NB_BLADES = 32;
+
+
+    // One term of the result of an operation on basis blades
+    struct Term
+    {
+        int blade;
+        double coefficient;
+    };
+
+    typedef std::vector<Term> Terms;
+
+
+    enum class Product
+    {
+        GEOMETRIC,
+        INNER,
+        OUTER,
+    };
+
+
+    // Coefficients of the product of each pair of basis blades: 'terms[i][j]' contains the
+    // non-zero terms of the product of blade 'i' by blade 'j'
+    struct ProductTable
+    {
+        std::array<std::array<Terms, NB_BLADES>, NB_BLADES> terms;
+    };
+
+
+    // Coefficients of an unary operation (reverse, dual) applied to each basis blade
+    struct UnaryTable
+    {
+        std::array<Terms, NB_BLADES> terms;
+    };
+
+
+    inline FullMultivector createBasisBlade(int blade)
+    {
+        FullMultivector::Parameters parameters = FullMultivector::Parameters::Zero();
+        parameters[blade] = 1.0;
+        return FullMultivector(parameters);
+    }
+
+
+    inline Terms toTerms(const Eigen::Matrix<double, 32, 1> &parameters)
+    {
+        Terms terms;
+
+        for (int k = 0; k < NB_BLADES; ++k)
+        {
+            if (parameters[k] != 0.0)
+                terms.push_back({ k, parameters[k] });
+        }
+
+        return terms;
+    }
+
+
+    template <Product product>
+    ProductTable computeProductTable()
+    {
+        ProductTable table;
+
+        for (int i = 0; i < NB_BLADES; ++i)
+        {
+            const FullMultivector a = createBasisBlade(i);
+
+            for (int j = 0; j < NB_BLADES; ++j)
+            {
+                const FullMultivector b = createBasisBlade(j);
+
+                if constexpr (product == Product::GEOMETRIC)
+                    table.terms[i][j] = toTerms(std::get<1>(geometricProduct(a, b)));
+                else if constexpr (product == Product::INNER)
+                    table.terms[i][j] = toTerms(std::get<1>(innerProduct(a, b)));
+                else
+                    table.terms[i][j] = toTerms(std::get<1>(outerProduct(a, b)));
+            }
+        }
+
+        return table;
+    }
+
+
+    // The tables are computed once, the first time they are needed
+    template <Product product>
+    const ProductTable &getProductTable()
+    {
+        static const ProductTable table = computeProductTable<product>();
+        return table;
+    }
+
+
+    inline const UnaryTable &getReverseTable()
+    {
+        static const UnaryTable table = []() {
+            UnaryTable table;
+            for (int i = 0; i < NB_BLADES; ++i)
+                table.terms[i] = toTerms(std::get<1>(toTuple(evaluated_reverse(createBasisBlade(i)))));
+            return table;
+        }();
+
+        return table;
+    }
+
+
+    inline const UnaryTable &getDualTable()
+    {
+        static const UnaryTable table = []() {
+            UnaryTable table;
+            for (int i = 0; i < NB_BLADES; ++i)
+                table.terms[i] = toTerms(std::get<1>(toTuple(evaluated_dual(createBasisBlade(i)))));
+            return table;
+        }();
+
+        return table;
+    }
+
+}  // namespace pygafro
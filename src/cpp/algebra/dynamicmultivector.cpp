@@ -0,0 +1,80 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#include <pybind11/pybind11.h>
+#include <pybind11/eigen.h>
+#include <pybind11/operators.h>
+#include <pybind11/stl.h>
+
+#include "algebra/DynamicMultivector.hpp"
+#include "algebra/MultivectorArray.hpp"
+
+
+namespace py = pybind11;
+
+using pygafro::DynamicMultivector;
+using pygafro::MultivectorArray;
+
+
+// Converts a blade (either an index or a name) into an index
+static int toBladeIndex(const py::object &blade)
+{
+    if (py::isinstance<py::str>(blade))
+        return MultivectorArray::getBladeIndex(blade.cast<std::string>());
+
+    return blade.cast<int>();
+}
+
+
+void init_dynamicmultivector(py::module &m)
+{
+    py::class_<DynamicMultivector>(m, "DynamicMultivector")
+        .def(py::init<uint32_t>(), py::arg("mask") = 0)
+        .def(py::init<uint32_t, const Eigen::VectorXd&>(), py::arg("mask"), py::arg("parameters"))
+        .def(py::init<const DynamicMultivector&>())
+        .def_static("toMask", &DynamicMultivector::toMask)
+
+        .def("mask", &DynamicMultivector::mask)
+        .def("size", &DynamicMultivector::size)
+        .def("blades", &DynamicMultivector::blades)
+        .def("has", &DynamicMultivector::has)
+        .def("vector", py::overload_cast<>(&DynamicMultivector::vector, py::const_))
+        .def("project", &DynamicMultivector::project)
+        .def("setParameters", &DynamicMultivector::setParameters)
+        .def("__getitem__", [](const DynamicMultivector &mv, const py::object &blade) {
+            return mv.get(toBladeIndex(blade));
+        })
+        .def("__setitem__", [](DynamicMultivector &mv, const py::object &blade, double value) {
+            mv.set(toBladeIndex(blade), value);
+        })
+
+        .def("geometricProduct", &DynamicMultivector::geometricProduct)
+        .def("innerProduct", &DynamicMultivector::innerProduct)
+        .def("outerProduct", &DynamicMultivector::outerProduct)
+        .def("__mul__", &DynamicMultivector::geometricProduct, py::is_operator())
+        .def("__or__", &DynamicMultivector::innerProduct, py::is_operator())
+        .def("__xor__", &DynamicMultivector::outerProduct, py::is_operator())
+
+        .def(py::self + py::self)
+        .def(py::self - py::self)
+        .def(py::self += py::self)
+        .def(py::self -= py::self)
+        .def(py::self * double())
+        .def(py::self / double())
+        .def(py::self *= double())
+        .def(py::self /= double())
+
+        .def("reverse", &DynamicMultivector::reverse)
+        .def("dual", &DynamicMultivector::dual)
+        .def("inverse", &DynamicMultivector::inverse)
+        .def("squaredNorm", &DynamicMultivector::squaredNorm)
+        .def("norm", &DynamicMultivector::norm)
+        .def("signedNorm", &DynamicMultivector::signedNorm)
+        .def("normalize", &DynamicMultivector::normalize)
+        .def("normalized", &DynamicMultivector::normalized);
+}
@@ -16,6 +16,7 @@ namespace py = pybind11;
 
 #include "multivectors.h"
 #include "motor_utils.hpp"
+#include "versor_utils.hpp"
 
 
 void init_motor_apply_methods(py::class_<gafro::Motor<double>, Multivector_scalare12e13e23e1ie2ie3ie123i> &);
@@ -59,7 +60,10 @@ void init_motor(py::module &m)
          .def("apply", &motor_apply<Point>)
          .def("apply", &motor_apply<PointPair>)
          .def("apply", &motor_apply<Sphere>)
-         .def("apply", &motor_apply<Vector>);
+         .def("apply", &motor_apply<Vector>)
+
+         .def("applyToPoints", &versor_apply_to_points<Motor>, py::arg("points"), py::arg("nbThreads") = 1)
+         .def("applyToConformal", &versor_apply_to_conformal<Motor>, py::arg("points"), py::arg("nbThreads") = 1);
 
      init_motor_apply_methods(motor);
 }
@@ -8,6 +8,8 @@
 
 #pragma once
 
+#include <pybind11/numpy.h>
+
 
 // Wrapper for *::reverse() that forces the evaluation of the result
 template<class Object>
@@ -28,3 +30,25 @@ template<class Object>
 auto evaluated_dual(const Object& mv) {
     return mv.dual().evaluate();
 }
+
+
+// Writable NumPy view on the parameters of a multivector, sharing its memory. The
+// multivector is kept alive as long as the view exists.
+template<class Object>
+pybind11::array_t<double> parameters_view(pybind11::object self) {
+    Object& mv = self.cast<Object&>();
+
+    return pybind11::array_t<double>(
+        { (pybind11::ssize_t) Object::size }, { (pybind11::ssize_t) sizeof(double) }, mv.vector().data(), self
+    );
+}
+
+
+// Buffer protocol: exposes the parameters of a multivector without any copy
+template<class Object>
+pybind11::buffer_info parameters_buffer(Object& mv) {
+    return pybind11::buffer_info(
+        mv.vector().data(), sizeof(double), pybind11::format_descriptor<double>::format(), 1,
+        { (pybind11::ssize_t) Object::size }, { (pybind11::ssize_t) sizeof(double) }
+    );
+}
@@ -0,0 +1,69 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <pybind11/stl.h>
+
+#include "algebra/MultivectorArray.hpp"
+
+
+namespace py = pybind11;
+
+using pygafro::MultivectorArray;
+
+
+// Converts a list of blades (either indices or names) into a list of indices
+static std::vector<int> toBladeIndices(const py::list &blades)
+{
+    std::vector<int> indices;
+
+    for (const auto &blade : blades)
+    {
+        if (py::isinstance<py::str>(blade))
+            indices.push_back(MultivectorArray::getBladeIndex(blade.cast<std::string>()));
+        else
+            indices.push_back(blade.cast<int>());
+    }
+
+    return indices;
+}
+
+
+void init_multivectorarray(py::module &m)
+{
+    py::class_<MultivectorArray>(m, "MultivectorArray")
+        .def(py::init([](const py::list &blades, const MultivectorArray::Array &data) {
+            return MultivectorArray(toBladeIndices(blades), data);
+        }), py::arg("blades"), py::arg("data"))
+        .def(py::init([](const py::list &blades, size_t n) {
+            return MultivectorArray(toBladeIndices(blades), n);
+        }), py::arg("blades"), py::arg("size"))
+
+        .def("size", &MultivectorArray::size)
+        .def("__len__", &MultivectorArray::size)
+        .def("blades", &MultivectorArray::blades)
+        .def("vector", &MultivectorArray::vector)
+        .def("__array__", [](const MultivectorArray &mv, py::args, py::kwargs) {
+            return mv.vector();
+        })
+
+        .def("geometricProduct", &MultivectorArray::geometricProduct)
+        .def("innerProduct", &MultivectorArray::innerProduct)
+        .def("outerProduct", &MultivectorArray::outerProduct)
+        .def("__mul__", &MultivectorArray::geometricProduct, py::is_operator())
+        .def("__or__", &MultivectorArray::innerProduct, py::is_operator())
+        .def("__xor__", &MultivectorArray::outerProduct, py::is_operator())
+
+        .def("reverse", &MultivectorArray::reverse)
+        .def("dual", &MultivectorArray::dual)
+        .def("squaredNorm", &MultivectorArray::squaredNorm)
+        .def("norm", &MultivectorArray::norm)
+        .def("signedNorm", &MultivectorArray::signedNorm)
+        .def("apply", &MultivectorArray::apply);
+}
@@ -16,6 +16,7 @@ namespace py = pybind11;
 
 #include "multivectors.h"
 #include "rotor_utils.hpp"
+#include "versor_utils.hpp"
 
 
 void init_rotor_apply_methods(py::class_<gafro::Rotor<double>, Multivector_scalare12e13e23> &);
@@ -61,7 +62,10 @@ void init_rotor(py::module &m)
          .def("apply", &rotor_apply<Point>)
          .def("apply", &rotor_apply<PointPair>)
          .def("apply", &rotor_apply<Sphere>)
-         .def("apply", &rotor_apply<Vector>);
+         .def("apply", &rotor_apply<Vector>)
+
+         .def("applyToPoints", &versor_apply_to_points<Rotor>, py::arg("points"), py::arg("nbThreads") = 1)
+         .def("applyToConformal", &versor_apply_to_conformal<Rotor>, py::arg("points"), py::arg("nbThreads") = 1);
 
      init_rotor_apply_methods(rotor);
 }
@@ -0,0 +1,107 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+
+#include <gafro/gafro.hpp>
+#include "parallel.hpp"
+
+
+typedef pybind11::array_t<double, pybind11::array::c_style | pybind11::array::forcecast> PointsArray;
+
+
+// Returns the 5x5 matrix of the application of a versor (motor, rotor, ...) to a conformal
+// point. Applying a versor is linear in the object, so each column is the result of
+// Versor::apply() on one basis blade of the point (e0, e1, e2, e3, ei).
+template<class Versor>
+Eigen::Matrix<double, 5, 5> versor_point_matrix(const Versor& versor) {
+    Eigen::Matrix<double, 5, 5> matrix;
+
+    for (int i = 0; i < 5; ++i)
+    {
+        gafro::Point<double>::Parameters parameters = gafro::Point<double>::Parameters::Zero();
+        parameters[i] = 1.0;
+
+        const gafro::Point<double> result = versor.apply(gafro::Point<double>(parameters)).evaluate();
+        matrix.col(i) = result.vector();
+    }
+
+    return matrix;
+}
+
+
+// Applies a versor to each row of a (N, 3) array of Euclidean points. Gives the same
+// results than converting each row into a Point, calling Versor::apply() and retrieving
+// the e1, e2 and e3 coefficients.
+template<class Versor>
+PointsArray versor_apply_to_points(const Versor& versor, const PointsArray& points, unsigned int nb_threads) {
+    if ((points.ndim() != 2) || (points.shape(1) != 3))
+        throw std::length_error("Invalid shape, expected (N, 3)");
+
+    const size_t n = points.shape(0);
+    const Eigen::Matrix<double, 5, 5> matrix = versor_point_matrix(versor);
+
+    PointsArray result(std::vector<pybind11::ssize_t>{ (pybind11::ssize_t) n, 3 });
+
+    const double* input = points.data();
+    double* output = result.mutable_data();
+
+    {
+        pybind11::gil_scoped_release release;
+
+        pygafro::parallelForRanges(n, nb_threads, [&](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i)
+            {
+                const Eigen::Map<const Eigen::Vector3d> x(input + i * 3);
+                Eigen::Map<Eigen::Vector3d> y(output + i * 3);
+
+                // Conformal point: e0 + x + 0.5 * |x|^2 * ei
+                y = matrix.block<3, 1>(1, 0) + matrix.block<3, 3>(1, 1) * x +
+                    matrix.block<3, 1>(1, 4) * (0.5 * x.squaredNorm());
+            }
+        });
+    }
+
+    return result;
+}
+
+
+// Applies a versor to each row of a (N, 5) array of conformal points (e0, e1, e2, e3, ei).
+// Gives the same results than calling Versor::apply() on each point.
+template<class Versor>
+PointsArray versor_apply_to_conformal(const Versor& versor, const PointsArray& points, unsigned int nb_threads) {
+    if ((points.ndim() != 2) || (points.shape(1) != 5))
+        throw std::length_error("Invalid shape, expected (N, 5)");
+
+    const size_t n = points.shape(0);
+    const Eigen::Matrix<double, 5, 5> matrix = versor_point_matrix(versor);
+
+    PointsArray result(std::vector<pybind11::ssize_t>{ (pybind11::ssize_t) n, 5 });
+
+    const double* input = points.data();
+    double* output = result.mutable_data();
+
+    {
+        pybind11::gil_scoped_release release;
+
+        pygafro::parallelForRanges(n, nb_threads, [&](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i)
+            {
+                const Eigen::Map<const Eigen::Matrix<double, 5, 1>> x(input + i * 5);
+                Eigen::Map<Eigen::Matrix<double, 5, 1>> y(output + i * 5);
+
+                y.noalias() = matrix * x;
+            }
+        });
+    }
+
+    return result;
+}
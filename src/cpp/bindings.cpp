@@ -9,6 +9,7 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/eigen.h>
 #include <pybind11/stl.h>
+#include <string>
 
 #include <gafro/gafro.hpp>
 
@@ -19,14 +20,20 @@ using namespace gafro;
 
 void init_multivectors(py::module &);
 void init_algebra(py::module &);
+void init_optimization(py::module &);
 void init_singlemanipulatortargets(py::module &);
 void init_singlemanipulatormotorcosts(py::module &);
 void init_singlemanipulatordualtargets(py::module &);
+void init_dynamicsinglemanipulatortarget(py::module &);
+void init_compositecostfunction(py::module &);
 void init_physics(py::module &);
 void init_robots(py::module &);
 void init_geometric_products(py::module &);
 void init_inner_products(py::module &);
 void init_outer_products(py::module &);
+bool init_geometric_products_for(py::module &, const std::string &);
+bool init_inner_products_for(py::module &, const std::string &);
+bool init_outer_products_for(py::module &, const std::string &);
 
 
 int grade(short blade) {
@@ -69,6 +76,48 @@ int grade(short blade) {
 }
 
 
+// Registers all the products of multivectors (normally done on demand, see below)
+void init_products(py::module &m) {
+    init_geometric_products(m);
+    init_inner_products(m);
+    init_outer_products(m);
+}
+
+
+// Module-level __getattr__ of 'internals': the products of multivectors (several
+// thousands of functions, named '<family>_<blades1>_<blades2>') are only registered
+// when first accessed, by groups sharing the same first operand. They are registered in
+// the 'internals.products' submodule, then cached in 'internals'.
+py::object get_internal(py::module &internals, py::module &products, const std::string &name) {
+    py::dict attributes = products.attr("__dict__");
+
+    if (!attributes.contains(name)) {
+        const size_t separator1 = name.find('_');
+        const size_t separator2 = (separator1 != std::string::npos ? name.find('_', separator1 + 1) : std::string::npos);
+
+        if (separator2 != std::string::npos) {
+            const std::string family = name.substr(0, separator1);
+            const std::string blades1 = name.substr(separator1 + 1, separator2 - separator1 - 1);
+
+            if (family == "geometricProduct")
+                init_geometric_products_for(products, blades1);
+            else if (family == "innerProduct")
+                init_inner_products_for(products, blades1);
+            else if (family == "outerProduct")
+                init_outer_products_for(products, blades1);
+        }
+    }
+
+    if (!attributes.contains(name))
+        throw py::attribute_error("module 'internals' has no attribute '" + name + "'");
+
+    py::object function = attributes[py::str(name)];
+    internals.attr(name.c_str()) = function;
+
+    return function;
+}
+
+
 PYBIND11_MODULE(_pygafro, m) {
 
     // blades-related constants
@@ -121,15 +170,25 @@ PYBIND11_MODULE(_pygafro, m) {
     init_algebra(m);
     init_physics(m);
     init_robots(m);
+    init_optimization(m);
 
 
     // Internal functions
     py::module m_internals = m.def_submodule("internals");
 
-    init_geometric_products(m_internals);
-    init_inner_products(m_internals);
-    init_outer_products(m_internals);
+    py::module m_products = m_internals.def_submodule("products");
+
+    m_internals.def("__getattr__", [m_internals, m_products](const std::string &name) mutable {
+        return get_internal(m_internals, m_products, name);
+    });
+
+    m_internals.def("registerProducts", [m_products]() mutable {
+        init_products(m_products);
+    });
+
     init_singlemanipulatortargets(m_internals);
+    init_dynamicsinglemanipulatortarget(m_internals);
     init_singlemanipulatormotorcosts(m_internals);
     init_singlemanipulatordualtargets(m_internals);
+    init_compositecostfunction(m_internals);
 }
@@ -0,0 +1,54 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#include <pybind11/pybind11.h>
+#include <pybind11/eigen.h>
+#include <pybind11/stl.h>
+
+#include "optimization/InverseKinematicsSolver.hpp"
+
+
+namespace py = pybind11;
+
+
+void init_optimization(py::module &m)
+{
+    typedef pygafro::InverseKinematicsOptions<double> InverseKinematicsOptions;
+    typedef pygafro::InverseKinematicsRun<double> InverseKinematicsRun;
+    typedef pygafro::InverseKinematicsResult<double> InverseKinematicsResult;
+
+
+    // InverseKinematicsOptions class
+    py::class_<InverseKinematicsOptions>(m, "InverseKinematicsOptions")
+        .def(py::init<>())
+        .def_readwrite("nbRestarts", &InverseKinematicsOptions::nb_restarts)
+        .def_readwrite("maxIterations", &InverseKinematicsOptions::max_iterations)
+        .def_readwrite("tolerance", &InverseKinematicsOptions::tolerance)
+        .def_readwrite("stepTolerance", &InverseKinematicsOptions::step_tolerance)
+        .def_readwrite("damping", &InverseKinematicsOptions::damping)
+        .def_readwrite("nbThreads", &InverseKinematicsOptions::nb_threads);
+
+
+    // InverseKinematicsRun class
+    py::class_<InverseKinematicsRun>(m, "InverseKinematicsRun")
+        .def(py::init<>())
+        .def_readwrite("initialPosition", &InverseKinematicsRun::initial_position)
+        .def_readwrite("position", &InverseKinematicsRun::position)
+        .def_readwrite("value", &InverseKinematicsRun::value)
+        .def_readwrite("nbIterations", &InverseKinematicsRun::nb_iterations)
+        .def_readwrite("converged", &InverseKinematicsRun::converged);
+
+
+    // InverseKinematicsResult class
+    py::class_<InverseKinematicsResult>(m, "InverseKinematicsResult")
+        .def(py::init<>())
+        .def_readwrite("position", &InverseKinematicsResult::position)
+        .def_readwrite("value", &InverseKinematicsResult::value)
+        .def_readwrite("converged", &InverseKinematicsResult::converged)
+        .def_readwrite("runs", &InverseKinematicsResult::runs);
+}
@@ -0,0 +1,195 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <cmath>
+#include <memory>
+#include <stdexcept>
+#include <tuple>
+#include <vector>
+
+#include <Eigen/Core>
+
+#include "optimization/CostTerms.hpp"
+
+
+namespace pygafro
+{
+    // Weighted sum of several cost terms (targets, motor targets, posture, joint limits...)
+    // on the same manipulator. The kinematics of the manipulator are computed once per
+    // configuration for all the terms.
+    //
+    // The errors of the terms are stacked, each one multiplied by the square root of its
+    // weight, so the value of the cost function is the weighted sum of the squared norms of
+    // the errors.
+    template <class T>
+    class CompositeCostFunction
+    {
+        public:
+            typedef Eigen::Matrix<T, Eigen::Dynamic, 1> Vector;
+            typedef Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic> Matrix;
+
+        public:
+            CompositeCostFunction(const KinematicChain<T> &chain)
+            : chain(chain), error_size(0)
+            {
+            }
+
+            void addTarget(const DynamicMultivector &tool, const DynamicMultivector &target, T weight)
+            {
+                addTerm(std::make_shared<TargetTerm<T>>(tool, target), weight);
+            }
+
+            void addDualTarget(const DynamicMultivector &tool, const DynamicMultivector &target, T weight)
+            {
+                addTerm(std::make_shared<DualTargetTerm<T>>(tool, target), weight);
+            }
+
+            void addMotorTarget(const gafro::Motor<T> &target, T weight)
+            {
+                addTerm(std::make_shared<MotorTargetTerm<T>>(target), weight);
+            }
+
+            void addPosture(const Vector &reference, T weight)
+            {
+                checkDoF(reference);
+                addTerm(std::make_shared<PostureTerm<T>>(reference), weight);
+            }
+
+            void addJointLimits(const Vector &limits_min, const Vector &limits_max, T weight)
+            {
+                checkDoF(limits_min);
+                addTerm(std::make_shared<JointLimitsTerm<T>>(limits_min, limits_max), weight);
+            }
+
+            inline int getDoF() const
+            {
+                return chain.getDoF();
+            }
+
+            inline int getErrorSize() const
+            {
+                return error_size;
+            }
+
+            inline size_t getNbTerms() const
+            {
+                return terms.size();
+            }
+
+            T getValue(const Vector &x) const
+            {
+                return getError(x).squaredNorm();
+            }
+
+            Vector getError(const Vector &x) const
+            {
+                return computeError(computeKinematics(x, false));
+            }
+
+            Matrix getJacobian(const Vector &x) const
+            {
+                return computeJacobian(computeKinematics(x, true));
+            }
+
+            Vector getGradient(const Vector &x) const
+            {
+                const ManipulatorKinematics<T> kinematics = computeKinematics(x, true);
+                return computeJacobian(kinematics).transpose() * computeError(kinematics);
+            }
+
+            std::tuple<Vector, Matrix> getGradientAndHessian(const Vector &x) const
+            {
+                const ManipulatorKinematics<T> kinematics = computeKinematics(x, true);
+                const Matrix jacobian = computeJacobian(kinematics);
+
+                return std::make_tuple(
+                    Vector(jacobian.transpose() * computeError(kinematics)),
+                    Matrix(jacobian.transpose() * jacobian)
+                );
+            }
+
+            // Returns the stacked error, the stacked Jacobian, the gradient and the
+            // Gauss-Newton approximation of the Hessian
+            std::tuple<Vector, Matrix, Vector, Matrix> evaluate(const Vector &x) const
+            {
+                const ManipulatorKinematics<T> kinematics = computeKinematics(x, true);
+
+                const Vector error = computeError(kinematics);
+                const Matrix jacobian = computeJacobian(kinematics);
+
+                return std::make_tuple(
+                    error, jacobian, Vector(jacobian.transpose() * error), Matrix(jacobian.transpose() * jacobian)
+                );
+            }
+
+        private:
+            struct WeightedTerm
+            {
+                std::shared_ptr<CostTerm<T>> term;
+                T scale;
+                int offset;
+            };
+
+            void addTerm(const std::shared_ptr<CostTerm<T>> &term, T weight)
+            {
+                if (weight < 0.0)
+                    throw std::invalid_argument("Invalid weight: must be positive");
+
+                terms.push_back(WeightedTerm{ term, std::sqrt(weight), error_size });
+                error_size += term->getErrorSize();
+            }
+
+            void checkDoF(const Vector &x) const
+            {
+                if (x.size() != getDoF())
+                    throw std::length_error("Invalid number of DOF");
+            }
+
+            ManipulatorKinematics<T> computeKinematics(const Vector &x, bool with_jacobian) const
+            {
+                checkDoF(x);
+                return ManipulatorKinematics<T>(chain, x, with_jacobian);
+            }
+
+            Vector computeError(const ManipulatorKinematics<T> &kinematics) const
+            {
+                Vector error(error_size);
+
+                for (const WeightedTerm &entry : terms)
+                {
+                    auto segment = error.segment(entry.offset, entry.term->getErrorSize());
+                    entry.term->computeError(kinematics, segment);
+                    segment *= entry.scale;
+                }
+
+                return error;
+            }
+
+            Matrix computeJacobian(const ManipulatorKinematics<T> &kinematics) const
+            {
+                Matrix jacobian(error_size, getDoF());
+
+                for (const WeightedTerm &entry : terms)
+                {
+                    auto rows = jacobian.middleRows(entry.offset, entry.term->getErrorSize());
+                    entry.term->computeJacobian(kinematics, rows);
+                    rows *= entry.scale;
+                }
+
+                return jacobian;
+            }
+
+        private:
+            KinematicChain<T> chain;
+            std::vector<WeightedTerm> terms;
+            int error_size;
+    };
+
+}  // namespace pygafro
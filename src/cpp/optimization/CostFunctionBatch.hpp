@@ -0,0 +1,151 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <stdexcept>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+#include <pybind11/numpy.h>
+#include <Eigen/Core>
+
+#include "parallel.hpp"
+
+
+namespace pygafro
+{
+    // Evaluation of a cost function (like gafro::SingleManipulatorTarget) for many
+    // configurations at once, for population-based optimizers. The GIL is released during
+    // the evaluations, which can be spread over several threads (0: as many as the hardware
+    // supports).
+    //
+    // 'dof' can be Eigen::Dynamic for the cost functions whose number of DOF and size of
+    // the error are only known at runtime: they must then provide 'getDoF()' and
+    // 'getErrorSize()' methods.
+    template <class T, int dof, class Cost>
+    class CostFunctionBatch
+    {
+        public:
+            // C-contiguous (N, dof) array of joint configurations
+            typedef pybind11::array_t<T, pybind11::array::c_style | pybind11::array::forcecast> Configurations;
+
+            typedef Eigen::Matrix<T, dof, 1> Vector;
+            typedef std::decay_t<decltype(std::declval<const Cost&>().getError(std::declval<Vector>()))> Error;
+
+        public:
+            // Returns a (N,) array
+            static pybind11::array_t<T> getValues(const Cost &cost, const Configurations &positions,
+                                                  unsigned int nb_threads)
+            {
+                const int nb_dof = getDoF(cost);
+                const pybind11::ssize_t n = checkConfigurations(positions, nb_dof);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n });
+
+                const T* input = positions.data();
+                T* output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    parallelFor(n, nb_threads, [&](size_t i) {
+                        output[i] = cost.getError(toVector(input, i, nb_dof)).squaredNorm();
+                    });
+                }
+
+                return result;
+            }
+
+            // Returns a (N, k) array, with 'k' the size of the error
+            static pybind11::array_t<T> getErrors(const Cost &cost, const Configurations &positions,
+                                                  unsigned int nb_threads)
+            {
+                const int nb_dof = getDoF(cost);
+                const pybind11::ssize_t n = checkConfigurations(positions, nb_dof);
+                const int size = getErrorSize(cost);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n, size });
+
+                const T* input = positions.data();
+                T* output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    parallelFor(n, nb_threads, [&](size_t i) {
+                        Eigen::Map<Eigen::Matrix<T, Error::RowsAtCompileTime, 1>>(output + size * i, size) =
+                            cost.getError(toVector(input, i, nb_dof));
+                    });
+                }
+
+                return result;
+            }
+
+            // Returns a (N, dof) array
+            static pybind11::array_t<T> getGradients(const Cost &cost, const Configurations &positions,
+                                                     unsigned int nb_threads)
+            {
+                const int nb_dof = getDoF(cost);
+                const pybind11::ssize_t n = checkConfigurations(positions, nb_dof);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n, nb_dof });
+
+                const T* input = positions.data();
+                T* output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    parallelFor(n, nb_threads, [&](size_t i) {
+                        const Vector x = toVector(input, i, nb_dof);
+
+                        // Not all the cost functions provide the gradient
+                        if constexpr (requires { cost.getGradient(x); })
+                            Eigen::Map<Vector>(output + nb_dof * i, nb_dof) = cost.getGradient(x);
+                        else
+                            Eigen::Map<Vector>(output + nb_dof * i, nb_dof) = cost.getJacobian(x).transpose() * cost.getError(x);
+                    });
+                }
+
+                return result;
+            }
+
+        private:
+            static int getDoF(const Cost &cost)
+            {
+                if constexpr (dof == Eigen::Dynamic)
+                    return cost.getDoF();
+                else
+                    return dof;
+            }
+
+            static int getErrorSize(const Cost &cost)
+            {
+                if constexpr (Error::RowsAtCompileTime == Eigen::Dynamic)
+                    return cost.getErrorSize();
+                else
+                    return Error::RowsAtCompileTime;
+            }
+
+            static pybind11::ssize_t checkConfigurations(const Configurations &positions, int nb_dof)
+            {
+                if ((positions.ndim() != 2) || (positions.shape(1) != nb_dof))
+                    throw std::length_error("Invalid number of DOF");
+
+                return positions.shape(0);
+            }
+
+            static Vector toVector(const T* input, size_t i, int nb_dof)
+            {
+                return Eigen::Map<const Vector>(input + nb_dof * i, nb_dof);
+            }
+    };
+
+}  // namespace pygafro
@@ -0,0 +1,314 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <bitset>
+#include <stdexcept>
+#include <vector>
+
+#include <Eigen/Core>
+#include <gafro/gafro.hpp>
+
+#include "algebra/DynamicMultivector.hpp"
+#include "robots/KinematicChain.hpp"
+
+
+namespace pygafro
+{
+    // End-effector motor (and optionally analytic Jacobian) of a kinematic chain for one
+    // configuration, computed once and shared by all the terms of a cost function
+    template <class T>
+    struct ManipulatorKinematics
+    {
+        typedef Eigen::Matrix<T, Eigen::Dynamic, 1> Vector;
+
+        ManipulatorKinematics(const KinematicChain<T> &chain, const Vector &x, bool with_jacobian)
+        : x(x), position(x.data(), x.data() + x.size()), motor(chain.computeFullMotor(position)),
+          dynamic_motor(DynamicMultivector::fromMultivector(motor))
+        {
+            if (with_jacobian)
+            {
+                jacobian = chain.computeAnalyticJacobian(position);
+
+                dynamic_jacobian.reserve(jacobian.size());
+                for (const auto &derivative : jacobian)
+                    dynamic_jacobian.push_back(DynamicMultivector::fromMultivector(derivative));
+            }
+        }
+
+        Vector x;
+        std::vector<T> position;
+
+        gafro::Motor<T> motor;
+        std::vector<gafro::Motor<T>> jacobian;
+
+        // Same as above, for the terms whose multivectors are only known at runtime
+        DynamicMultivector dynamic_motor;
+        std::vector<DynamicMultivector> dynamic_jacobian;
+    };
+
+
+    // Base class of the terms of a cost function: each one computes its own error (of
+    // fixed size) and Jacobian from the shared kinematics
+    template <class T>
+    class CostTerm
+    {
+        public:
+            typedef Eigen::Matrix<T, Eigen::Dynamic, 1> Vector;
+            typedef Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic> Matrix;
+
+        public:
+            virtual ~CostTerm() = default;
+
+            virtual int getErrorSize() const = 0;
+
+            virtual void computeError(const ManipulatorKinematics<T> &kinematics, Eigen::Ref<Vector> error) const = 0;
+
+            // Requires the analytic Jacobian in the kinematics
+            virtual void computeJacobian(const ManipulatorKinematics<T> &kinematics, Eigen::Ref<Matrix> jacobian) const = 0;
+    };
+
+
+    // Outer product of the target with the tool moved by the end-effector motor (same as
+    // gafro::SingleManipulatorTarget)
+    template <class T>
+    class TargetTerm : public CostTerm<T>
+    {
+        public:
+            typedef typename CostTerm<T>::Vector Vector;
+            typedef typename CostTerm<T>::Matrix Matrix;
+
+        public:
+            TargetTerm(const DynamicMultivector &tool, const DynamicMultivector &target)
+            : tool(tool), target(target), error_mask(target.outerProduct(tool).mask())
+            {
+            }
+
+            int getErrorSize() const override
+            {
+                return std::bitset<NB_BLADES>(error_mask).count();
+            }
+
+            void computeError(const ManipulatorKinematics<T> &kinematics, Eigen::Ref<Vector> error) const override
+            {
+                const DynamicMultivector &motor = kinematics.dynamic_motor;
+
+                // Like Motor::apply(), the moved tool keeps the blades of the tool
+                const DynamicMultivector moved_tool = motor.geometricProduct(tool)
+                                                          .geometricProduct(motor.reverse())
+                                                          .project(tool.mask());
+
+                error = target.outerProduct(moved_tool).vector(error_mask);
+            }
+
+            void computeJacobian(const ManipulatorKinematics<T> &kinematics, Eigen::Ref<Matrix> jacobian) const override
+            {
+                const DynamicMultivector &motor = kinematics.dynamic_motor;
+
+                const DynamicMultivector motor_tool = motor.geometricProduct(tool);
+                const DynamicMultivector tool_reverse = tool.geometricProduct(motor.reverse());
+
+                for (size_t i = 0; i < kinematics.dynamic_jacobian.size(); ++i)
+                {
+                    const DynamicMultivector &derivative = kinematics.dynamic_jacobian[i];
+
+                    const DynamicMultivector column = target.outerProduct(
+                        derivative.geometricProduct(tool_reverse) + motor_tool.geometricProduct(derivative.reverse())
+                    );
+
+                    jacobian.col(i) = 2.0 * column.vector(error_mask);
+                }
+            }
+
+        private:
+            DynamicMultivector tool;
+            DynamicMultivector target;
+            uint32_t error_mask;
+    };
+
+
+    // Inner product of the dual of the target with the dual of the tool moved by the
+    // end-effector motor (same as gafro::SingleManipulatorDualTarget)
+    template <class T>
+    class DualTargetTerm : public CostTerm<T>
+    {
+        public:
+            typedef typename CostTerm<T>::Vector Vector;
+            typedef typename CostTerm<T>::Matrix Matrix;
+
+        public:
+            DualTargetTerm(const DynamicMultivector &tool, const DynamicMultivector &target)
+            : tool(tool), tool_dual(tool.dual()), target_dual(target.dual()),
+              error_mask(target_dual.innerProduct(tool_dual).mask())
+            {
+            }
+
+            int getErrorSize() const override
+            {
+                return std::bitset<NB_BLADES>(error_mask).count();
+            }
+
+            void computeError(const ManipulatorKinematics<T> &kinematics, Eigen::Ref<Vector> error) const override
+            {
+                const DynamicMultivector &motor = kinematics.dynamic_motor;
+
+                const DynamicMultivector moved_tool = motor.geometricProduct(tool)
+                                                          .geometricProduct(motor.reverse())
+                                                          .project(tool.mask());
+
+                error = target_dual.innerProduct(moved_tool.dual()).vector(error_mask);
+            }
+
+            void computeJacobian(const ManipulatorKinematics<T> &kinematics, Eigen::Ref<Matrix> jacobian) const override
+            {
+                const DynamicMultivector &motor = kinematics.dynamic_motor;
+
+                const DynamicMultivector motor_tool = motor.geometricProduct(tool_dual);
+                const DynamicMultivector tool_reverse = tool_dual.geometricProduct(motor.reverse());
+
+                for (size_t i = 0; i < kinematics.dynamic_jacobian.size(); ++i)
+                {
+                    const DynamicMultivector &derivative = kinematics.dynamic_jacobian[i];
+
+                    const DynamicMultivector column = target_dual.innerProduct(
+                        derivative.geometricProduct(tool_reverse) + motor_tool.geometricProduct(derivative.reverse())
+                    );
+
+                    jacobian.col(i) = 2.0 * column.vector(error_mask);
+                }
+            }
+
+        private:
+            DynamicMultivector tool;
+            DynamicMultivector tool_dual;
+            DynamicMultivector target_dual;
+            uint32_t error_mask;
+    };
+
+
+    // Logarithm of the motor from the target to the end-effector (same as
+    // gafro::SingleManipulatorMotorCost)
+    template <class T>
+    class MotorTargetTerm : public CostTerm<T>
+    {
+        public:
+            typedef typename CostTerm<T>::Vector Vector;
+            typedef typename CostTerm<T>::Matrix Matrix;
+
+        public:
+            MotorTargetTerm(const gafro::Motor<T> &target)
+            : target_reverse(target.reverse())
+            {
+            }
+
+            int getErrorSize() const override
+            {
+                return 6;
+            }
+
+            void computeError(const ManipulatorKinematics<T> &kinematics, Eigen::Ref<Vector> error) const override
+            {
+                const gafro::Motor<T> relative_motor = target_reverse * kinematics.motor;
+                error = relative_motor.log().evaluate().vector();
+            }
+
+            void computeJacobian(const ManipulatorKinematics<T> &kinematics, Eigen::Ref<Matrix> jacobian) const override
+            {
+                const gafro::Motor<T> relative_motor = target_reverse * kinematics.motor;
+
+                Eigen::Matrix<T, 8, Eigen::Dynamic> embedded(8, kinematics.jacobian.size());
+
+                for (size_t i = 0; i < kinematics.jacobian.size(); ++i)
+                    embedded.col(i) = gafro::Motor<T>(target_reverse * kinematics.jacobian[i]).vector();
+
+                jacobian = gafro::Motor<T>::Logarithm::getJacobian(relative_motor) * embedded;
+            }
+
+        private:
+            gafro::Motor<T> target_reverse;
+    };
+
+
+    // Distance to a reference configuration
+    template <class T>
+    class PostureTerm : public CostTerm<T>
+    {
+        public:
+            typedef typename CostTerm<T>::Vector Vector;
+            typedef typename CostTerm<T>::Matrix Matrix;
+
+        public:
+            PostureTerm(const Vector &reference)
+            : reference(reference)
+            {
+            }
+
+            int getErrorSize() const override
+            {
+                return reference.size();
+            }
+
+            void computeError(const ManipulatorKinematics<T> &kinematics, Eigen::Ref<Vector> error) const override
+            {
+                error = kinematics.x - reference;
+            }
+
+            void computeJacobian(const ManipulatorKinematics<T> &kinematics, Eigen::Ref<Matrix> jacobian) const override
+            {
+                jacobian.setIdentity();
+            }
+
+        private:
+            Vector reference;
+    };
+
+
+    // Distance to the joint limits, zero within the limits
+    template <class T>
+    class JointLimitsTerm : public CostTerm<T>
+    {
+        public:
+            typedef typename CostTerm<T>::Vector Vector;
+            typedef typename CostTerm<T>::Matrix Matrix;
+
+        public:
+            JointLimitsTerm(const Vector &limits_min, const Vector &limits_max)
+            : limits_min(limits_min), limits_max(limits_max)
+            {
+                if (limits_min.size() != limits_max.size())
+                    throw std::length_error("Invalid number of DOF");
+            }
+
+            int getErrorSize() const override
+            {
+                return limits_min.size();
+            }
+
+            void computeError(const ManipulatorKinematics<T> &kinematics, Eigen::Ref<Vector> error) const override
+            {
+                error = (kinematics.x - limits_max).cwiseMax(0.0) + (kinematics.x - limits_min).cwiseMin(0.0);
+            }
+
+            void computeJacobian(const ManipulatorKinematics<T> &kinematics, Eigen::Ref<Matrix> jacobian) const override
+            {
+                jacobian.setZero();
+
+                for (int i = 0; i < limits_min.size(); ++i)
+                {
+                    if ((kinematics.x[i] > limits_max[i]) || (kinematics.x[i] < limits_min[i]))
+                        jacobian(i, i) = 1.0;
+                }
+            }
+
+        private:
+            Vector limits_min;
+            Vector limits_max;
+    };
+
+}  // namespace pygafro
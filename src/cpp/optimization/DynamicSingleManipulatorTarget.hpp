@@ -0,0 +1,114 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <stdexcept>
+#include <tuple>
+
+#include <Eigen/Core>
+
+#include "optimization/CostTerms.hpp"
+
+
+namespace pygafro
+{
+    // Same cost function than gafro::SingleManipulatorTarget (the outer product of the target
+    // with the tool moved by the end-effector motor), for any kind of tool and target and
+    // any number of DOF: their blades are only known at runtime.
+    //
+    // Used for the combinations of DOF, tool and target for which no SingleManipulatorTarget
+    // was compiled.
+    template <class T>
+    class DynamicSingleManipulatorTarget
+    {
+        public:
+            typedef Eigen::Matrix<T, Eigen::Dynamic, 1> Vector;
+            typedef Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic> Matrix;
+
+        public:
+            DynamicSingleManipulatorTarget(
+                const KinematicChain<T> &chain, const DynamicMultivector &tool, const DynamicMultivector &target
+            )
+            : chain(chain), term(tool, target)
+            {
+            }
+
+            inline int getDoF() const
+            {
+                return chain.getDoF();
+            }
+
+            inline int getErrorSize() const
+            {
+                return term.getErrorSize();
+            }
+
+            T getValue(const Vector &x) const
+            {
+                return getError(x).squaredNorm();
+            }
+
+            // The motor of the end-effector is computed once for both the error and the
+            // Jacobian
+            Vector getGradient(const Vector &x) const
+            {
+                const ManipulatorKinematics<T> kinematics = computeKinematics(x, true);
+                return computeJacobian(kinematics).transpose() * computeError(kinematics);
+            }
+
+            std::tuple<Vector, Matrix> getGradientAndHessian(const Vector &x) const
+            {
+                const ManipulatorKinematics<T> kinematics = computeKinematics(x, true);
+                const Matrix jacobian = computeJacobian(kinematics);
+
+                return std::make_tuple(
+                    Vector(jacobian.transpose() * computeError(kinematics)),
+                    Matrix(jacobian.transpose() * jacobian)
+                );
+            }
+
+            Vector getError(const Vector &x) const
+            {
+                return computeError(computeKinematics(x, false));
+            }
+
+            Matrix getJacobian(const Vector &x) const
+            {
+                return computeJacobian(computeKinematics(x, true));
+            }
+
+        private:
+            ManipulatorKinematics<T> computeKinematics(const Vector &x, bool with_jacobian) const
+            {
+                if (x.size() != getDoF())
+                    throw std::length_error("Invalid number of DOF");
+
+                return ManipulatorKinematics<T>(chain, x, with_jacobian);
+            }
+
+            Vector computeError(const ManipulatorKinematics<T> &kinematics) const
+            {
+                Vector error(getErrorSize());
+                term.computeError(kinematics, error);
+                return error;
+            }
+
+            Matrix computeJacobian(const ManipulatorKinematics<T> &kinematics) const
+            {
+                Matrix jacobian(getErrorSize(), getDoF());
+                term.computeJacobian(kinematics, jacobian);
+                return jacobian;
+            }
+
+        private:
+            KinematicChain<T> chain;
+            TargetTerm<T> term;
+    };
+
+}  // namespace pygafro
@@ -0,0 +1,182 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <limits>
+#include <stdexcept>
+#include <vector>
+
+#include <gafro/robot/Manipulator.hpp>
+#include "parallel.hpp"
+
+
+namespace pygafro
+{
+    template <class T>
+    struct InverseKinematicsOptions
+    {
+        // Number of random initial configurations to start from
+        unsigned int nb_restarts = 8;
+
+        // Maximum number of iterations of each run
+        unsigned int max_iterations = 100;
+
+        // A run has converged once the squared norm of the error is below this value
+        T tolerance = 1e-10;
+
+        // A run is stopped once the norm of the update is below this value
+        T step_tolerance = 1e-12;
+
+        // Initial damping factor of the Levenberg-Marquardt steps (0: Gauss-Newton)
+        T damping = 1e-3;
+
+        // Number of threads to use (0: as many as the hardware supports)
+        unsigned int nb_threads = 0;
+    };
+
+
+    template <class T>
+    struct InverseKinematicsRun
+    {
+        Eigen::Matrix<T, Eigen::Dynamic, 1> initial_position;
+        Eigen::Matrix<T, Eigen::Dynamic, 1> position;
+        T value = std::numeric_limits<T>::infinity();
+        unsigned int nb_iterations = 0;
+        bool converged = false;
+    };
+
+
+    template <class T>
+    struct InverseKinematicsResult
+    {
+        // Best solution found over all the runs
+        Eigen::Matrix<T, Eigen::Dynamic, 1> position;
+        T value = std::numeric_limits<T>::infinity();
+        bool converged = false;
+
+        // Statistics of each run
+        std::vector<InverseKinematicsRun<T>> runs;
+    };
+
+
+    // Levenberg-Marquardt minimisation of the squared norm of the error of a cost function,
+    // starting from one initial configuration. The configuration is clamped to the joint
+    // limits after each step.
+    template <class T, int dof, class Cost>
+    InverseKinematicsRun<T> runInverseKinematics(
+        const Cost &cost, const Eigen::Matrix<T, dof, 1> &initial_position,
+        const Eigen::Matrix<T, dof, 1> &limits_min, const Eigen::Matrix<T, dof, 1> &limits_max,
+        const InverseKinematicsOptions<T> &options
+    )
+    {
+        typedef Eigen::Matrix<T, dof, 1> Vector;
+        typedef Eigen::Matrix<T, dof, dof> Matrix;
+
+        Vector position = initial_position.cwiseMax(limits_min).cwiseMin(limits_max);
+
+        auto error = cost.getError(position);
+        T value = error.squaredNorm();
+        T damping = options.damping;
+
+        InverseKinematicsRun<T> run;
+        run.initial_position = initial_position;
+
+        while ((value > options.tolerance) && (run.nb_iterations < options.max_iterations))
+        {
+            ++run.nb_iterations;
+
+            const auto jacobian = cost.getJacobian(position);
+            const Vector gradient = jacobian.transpose() * error;
+            const Matrix hessian = jacobian.transpose() * jacobian;
+
+            // Increase the damping until the step decreases the error
+            bool improved = false;
+            T step = 0.0;
+
+            while (!improved && (damping < 1e12))
+            {
+                Matrix damped_hessian = hessian;
+                damped_hessian.diagonal().array() += damping;
+
+                const Vector candidate = (position - damped_hessian.ldlt().solve(gradient))
+                                             .cwiseMax(limits_min)
+                                             .cwiseMin(limits_max);
+
+                const auto candidate_error = cost.getError(candidate);
+                const T candidate_value = candidate_error.squaredNorm();
+
+                if (candidate_value < value)
+                {
+                    step = (candidate - position).norm();
+                    position = candidate;
+                    error = candidate_error;
+                    value = candidate_value;
+                    damping *= 0.1;
+                    improved = true;
+                }
+                else
+                {
+                    damping = (damping > 0.0) ? damping * 10.0 : 1e-6;
+                }
+            }
+
+            if (!improved || (step < options.step_tolerance))
+                break;
+        }
+
+        run.position = position;
+        run.value = value;
+        run.converged = (value <= options.tolerance);
+
+        return run;
+    }
+
+
+    // Runs the inverse kinematics from several random configurations of the manipulator in
+    // parallel, and returns the best solution found. Must be called without holding the GIL.
+    template <class T, int dof, class Cost>
+    InverseKinematicsResult<T> solveInverseKinematics(
+        const Cost &cost, const gafro::Manipulator<T, dof> *manipulator, const InverseKinematicsOptions<T> &options
+    )
+    {
+        typedef Eigen::Matrix<T, dof, 1> Vector;
+
+        if (options.nb_restarts < 1)
+            throw std::invalid_argument("Invalid number of restarts: must be at least 1");
+
+        const Vector limits_min = manipulator->getJointLimitsMin();
+        const Vector limits_max = manipulator->getJointLimitsMax();
+
+        // The random number generator isn't thread-safe, so all the initial configurations
+        // are generated upfront
+        std::vector<Vector> initial_positions(options.nb_restarts);
+        for (unsigned int i = 0; i < options.nb_restarts; ++i)
+            initial_positions[i] = manipulator->getRandomConfiguration();
+
+        InverseKinematicsResult<T> result;
+        result.runs.resize(options.nb_restarts);
+
+        parallelFor(options.nb_restarts, options.nb_threads, [&](size_t i) {
+            result.runs[i] = runInverseKinematics<T, dof>(cost, initial_positions[i], limits_min, limits_max, options);
+        });
+
+        for (const auto &run : result.runs)
+        {
+            if (run.value < result.value)
+            {
+                result.position = run.position;
+                result.value = run.value;
+                result.converged = run.converged;
+            }
+        }
+
+        return result;
+    }
+
+}  // namespace pygafro
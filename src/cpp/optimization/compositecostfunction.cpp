@@ -0,0 +1,44 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#include <pybind11/pybind11.h>
+#include <pybind11/eigen.h>
+#include <pybind11/stl.h>
+
+#include "optimization/CompositeCostFunction.hpp"
+#include "optimization/CostFunctionBatch.hpp"
+
+
+namespace py = pybind11;
+
+typedef pygafro::CompositeCostFunction<double> CompositeCostFunction;
+typedef pygafro::CostFunctionBatch<double, Eigen::Dynamic, CompositeCostFunction> CompositeCostFunctionBatch;
+
+
+void init_compositecostfunction(py::module &m)
+{
+    py::class_<CompositeCostFunction>(m, "CompositeCostFunction")
+        .def(py::init<const pygafro::KinematicChain<double>&>(), py::arg("chain"))
+        .def("addTarget", &CompositeCostFunction::addTarget, py::arg("tool"), py::arg("target"), py::arg("weight") = 1.0)
+        .def("addDualTarget", &CompositeCostFunction::addDualTarget, py::arg("tool"), py::arg("target"), py::arg("weight") = 1.0)
+        .def("addMotorTarget", &CompositeCostFunction::addMotorTarget, py::arg("target"), py::arg("weight") = 1.0)
+        .def("addPosture", &CompositeCostFunction::addPosture, py::arg("reference"), py::arg("weight") = 1.0)
+        .def("addJointLimits", &CompositeCostFunction::addJointLimits, py::arg("limitsMin"), py::arg("limitsMax"), py::arg("weight") = 1.0)
+        .def("getDoF", &CompositeCostFunction::getDoF)
+        .def("getErrorSize", &CompositeCostFunction::getErrorSize)
+        .def("getNbTerms", &CompositeCostFunction::getNbTerms)
+        .def("getValue", &CompositeCostFunction::getValue)
+        .def("getError", &CompositeCostFunction::getError)
+        .def("getJacobian", &CompositeCostFunction::getJacobian)
+        .def("getGradient", &CompositeCostFunction::getGradient)
+        .def("getGradientAndHessian", &CompositeCostFunction::getGradientAndHessian)
+        .def("evaluate", &CompositeCostFunction::evaluate)
+        .def("getValues", &CompositeCostFunctionBatch::getValues, py::arg("positions"), py::arg("nbThreads") = 1)
+        .def("getErrors", &CompositeCostFunctionBatch::getErrors, py::arg("positions"), py::arg("nbThreads") = 1)
+        .def("getGradients", &CompositeCostFunctionBatch::getGradients, py::arg("positions"), py::arg("nbThreads") = 1);
+}
@@ -0,0 +1,36 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#include <pybind11/pybind11.h>
+#include <pybind11/eigen.h>
+#include <pybind11/stl.h>
+
+#include "optimization/CostFunctionBatch.hpp"
+#include "optimization/DynamicSingleManipulatorTarget.hpp"
+
+
+namespace py = pybind11;
+
+typedef pygafro::DynamicSingleManipulatorTarget<double> DynamicSingleManipulatorTarget;
+typedef pygafro::CostFunctionBatch<double, Eigen::Dynamic, DynamicSingleManipulatorTarget> DynamicSingleManipulatorTargetBatch;
+
+
+void init_dynamicsinglemanipulatortarget(py::module &m)
+{
+    py::class_<DynamicSingleManipulatorTarget>(m, "DynamicSingleManipulatorTarget")
+        .def(py::init<const pygafro::KinematicChain<double>&, const pygafro::DynamicMultivector&, const pygafro::DynamicMultivector&>(),
+             py::arg("chain"), py::arg("tool"), py::arg("target"))
+        .def("getValue", &DynamicSingleManipulatorTarget::getValue)
+        .def("getGradient", &DynamicSingleManipulatorTarget::getGradient)
+        .def("getJacobian", &DynamicSingleManipulatorTarget::getJacobian)
+        .def("getGradientAndHessian", &DynamicSingleManipulatorTarget::getGradientAndHessian)
+        .def("getError", &DynamicSingleManipulatorTarget::getError)
+        .def("getValues", &DynamicSingleManipulatorTargetBatch::getValues, py::arg("positions"), py::arg("nbThreads") = 1)
+        .def("getErrors", &DynamicSingleManipulatorTargetBatch::getErrors, py::arg("positions"), py::arg("nbThreads") = 1)
+        .def("getGradients", &DynamicSingleManipulatorTargetBatch::getGradients, py::arg("positions"), py::arg("nbThreads") = 1);
+}
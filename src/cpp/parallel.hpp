@@ -0,0 +1,104 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <algorithm>
+#include <atomic>
+#include <exception>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+
+namespace pygafro
+{
+    // Returns the number of threads to use to process 'n' items: 0 means "as many as
+    // the hardware supports"
+    inline unsigned int getNbThreads(unsigned int nb_threads, size_t n)
+    {
+        if (nb_threads == 0)
+            nb_threads = std::max(std::thread::hardware_concurrency(), 1u);
+
+        return (unsigned int) std::max<size_t>(std::min<size_t>(nb_threads, n), 1);
+    }
+
+
+    // Calls 'function(i)' for each i in [0, n), distributing the calls over several
+    // threads. The first exception thrown by 'function' (if any) is rethrown once all
+    // the threads are done.
+    //
+    // Must be called without holding the GIL if 'function' doesn't need it.
+    template <class Function>
+    void parallelFor(size_t n, unsigned int nb_threads, Function function)
+    {
+        nb_threads = getNbThreads(nb_threads, n);
+
+        if (nb_threads == 1)
+        {
+            for (size_t i = 0; i < n; ++i)
+                function(i);
+
+            return;
+        }
+
+        std::atomic<size_t> next(0);
+        std::exception_ptr error = nullptr;
+        std::mutex mutex;
+
+        auto worker = [&]() {
+            size_t i;
+            while ((i = next++) < n)
+            {
+                try
+                {
+                    function(i);
+                }
+                catch (...)
+                {
+                    std::lock_guard<std::mutex> lock(mutex);
+                    if (!error)
+                        error = std::current_exception();
+
+                    next = n;
+                }
+            }
+        };
+
+        std::vector<std::thread> threads;
+        threads.reserve(nb_threads);
+
+        for (unsigned int t = 0; t < nb_threads; ++t)
+            threads.emplace_back(worker);
+
+        for (auto& thread : threads)
+            thread.join();
+
+        if (error)
+            std::rethrow_exception(error);
+    }
+
+
+    // Calls 'function(begin, end)' on contiguous ranges of [0, n), one per thread. Useful
+    // when each thread needs its own workspace.
+    //
+    // Must be called without holding the GIL if 'function' doesn't need it.
+    template <class Function>
+    void parallelForRanges(size_t n, unsigned int nb_threads, Function function)
+    {
+        nb_threads = getNbThreads(nb_threads, n);
+
+        const size_t chunk_size = (n + nb_threads - 1) / nb_threads;
+
+        parallelFor(nb_threads, nb_threads, [&](size_t i) {
+            const size_t begin = i * chunk_size;
+            function(begin, std::min(begin + chunk_size, n));
+        });
+    }
+
+}  // namespace pygafro
@@ -12,6 +12,7 @@
 
 #include <gafro/gafro.hpp>
 
+#include "robots/DynamicManipulator.hpp"
 #include "robots/FixedJoint.hpp"
 #include "robots/Joint.hpp"
 #include "robots/KinematicChain.hpp"
@@ -27,14 +28,21 @@
 namespace py = pybind11;
 
 
-std::unique_ptr<Atlas> createAtlas()
+// The systems owned by Python forget the wrappers of their joints and links when destroyed
+// (see WrapperCache)
+typedef std::unique_ptr<System, pygafro::SystemDeleter<double>> SystemHolder;
+typedef std::unique_ptr<Atlas, pygafro::SystemDeleter<double, Atlas>> AtlasHolder;
+typedef std::unique_ptr<UnitreeG1, pygafro::SystemDeleter<double, UnitreeG1>> UnitreeG1Holder;
+
+
+AtlasHolder createAtlas()
 {
-    return std::make_unique<gafro::Atlas<double>>(getAssetsPath());
+    return AtlasHolder(new gafro::Atlas<double>(getAssetsPath()));
 }
 
-std::unique_ptr<UnitreeG1> createUnitreeG1()
+UnitreeG1Holder createUnitreeG1()
 {
-    return std::make_unique<gafro::UnitreeG1<double>>(getAssetsPath());
+    return UnitreeG1Holder(new gafro::UnitreeG1<double>(getAssetsPath()));
 }
 
 
@@ -46,7 +54,7 @@ void init_robots(py::module &m)
 
 
     // Link class
-    py::class_<pyLink>(m, "Link")
+    py::class_<pyLink, std::shared_ptr<pyLink>>(m, "Link")
         .def("setMass", &pyLink::setMass)
         .def("setCenterOfMass", &pyLink::setCenterOfMass)
         .def("setInertia", &pyLink::setInertia)
@@ -66,7 +74,7 @@ void init_robots(py::module &m)
 
 
     // Joint class
-    py::class_<pyJoint> joint(m, "Joint");
+    py::class_<pyJoint, std::shared_ptr<pyJoint>> joint(m, "Joint");
     joint.def("setFrame", &pyJoint::setFrame)
          .def("setLimits", &pyJoint::setLimits)
          .def("setParentLink", &pyJoint::setParentLink)
@@ -101,21 +109,30 @@ void init_robots(py::module &m)
 
 
     // RevoluteJoint class
-    py::class_<pyRevoluteJoint, pyJoint>(m, "RevoluteJoint")
+    py::class_<pyRevoluteJoint, pyJoint, std::shared_ptr<pyRevoluteJoint>>(m, "RevoluteJoint")
         .def("setAxis", &pyRevoluteJoint::setAxis)
         .def("getAxis", &pyRevoluteJoint::getAxis)
         .def("getRotor", &pyRevoluteJoint::getRotor);
 
 
     // PrismaticJoint class
-    py::class_<pyPrismaticJoint, pyJoint>(m, "PrismaticJoint")
+    py::class_<pyPrismaticJoint, pyJoint, std::shared_ptr<pyPrismaticJoint>>(m, "PrismaticJoint")
         .def("setAxis", &pyPrismaticJoint::setAxis)
         .def("getAxis", &pyPrismaticJoint::getAxis)
         .def("getTranslator", &pyPrismaticJoint::getTranslator);
 
 
     // FixedJoint class
-    py::class_<pyFixedJoint, pyJoint>(m, "FixedJoint");
+    py::class_<pyFixedJoint, pyJoint, std::shared_ptr<pyFixedJoint>>(m, "FixedJoint");
+
+
+    // ForwardKinematicsCache class
+    py::class_<ForwardKinematicsCache, std::shared_ptr<ForwardKinematicsCache>>(m, "ForwardKinematicsCache")
+        .def("isEnabled", &ForwardKinematicsCache::isEnabled)
+        .def("setEnabled", &ForwardKinematicsCache::setEnabled, py::arg("enabled") = true)
+        .def("clear", &ForwardKinematicsCache::clear)
+        .def("getNbHits", &ForwardKinematicsCache::getNbHits)
+        .def("getNbMisses", &ForwardKinematicsCache::getNbMisses);
 
 
     // KinematicChain class
@@ -126,19 +143,22 @@ void init_robots(py::module &m)
         .def("setFixedMotors", &pyKinematicChain::setFixedMotors)
         .def("getFixedMotors", &pyKinematicChain::getFixedMotors)
         .def("getActuatedJoints", &pyKinematicChain::getActuatedJoints)
-        .def("computeMotor", &pyKinematicChain::computeFullMotor)
-        .def("computeMotor", &pyKinematicChain::computeMotor)
-        .def("computeMotorDerivative", &pyKinematicChain::computeMotorDerivative)
-        .def("computeAnalyticJacobian", &pyKinematicChain::computeAnalyticJacobian)
-        .def("computeGeometricJacobian", &pyKinematicChain::computeGeometricJacobian)
-        .def("computeGeometricJacobianBody", &pyKinematicChain::computeGeometricJacobianBody)
-        .def("computeKinematicChainGeometricJacobianTimeDerivative", &pyKinematicChain::computeKinematicChainGeometricJacobianTimeDerivative)
-        .def("computeMassMatrix", &pyKinematicChain::computeMassMatrix)
+        .def("computeMotor", &pyKinematicChain::computeFullMotor, py::call_guard<py::gil_scoped_release>())
+        .def("computeMotor", &pyKinematicChain::computeMotor, py::call_guard<py::gil_scoped_release>())
+        .def("computeMotorDerivative", &pyKinematicChain::computeMotorDerivative, py::call_guard<py::gil_scoped_release>())
+        .def("computeAnalyticJacobian", &pyKinematicChain::computeAnalyticJacobian, py::call_guard<py::gil_scoped_release>())
+        .def("computeGeometricJacobian", &pyKinematicChain::computeGeometricJacobian, py::call_guard<py::gil_scoped_release>())
+        .def("computeGeometricJacobianBody", &pyKinematicChain::computeGeometricJacobianBody, py::call_guard<py::gil_scoped_release>())
+        .def("computeKinematicChainGeometricJacobianTimeDerivative", &pyKinematicChain::computeKinematicChainGeometricJacobianTimeDerivative, py::call_guard<py::gil_scoped_release>())
+        .def("computeMassMatrix", &pyKinematicChain::computeMassMatrix, py::call_guard<py::gil_scoped_release>())
+        .def("computeInverseDynamics", &pyKinematicChain::computeInverseDynamics, py::arg("position"), py::arg("velocity"), py::arg("acceleration"), py::arg("gravity") = 9.81, py::call_guard<py::gil_scoped_release>())
+        .def("computeForwardDynamics", &pyKinematicChain::computeForwardDynamics, py::arg("position"), py::arg("velocity"), py::arg("torque"), py::arg("gravity") = 9.81, py::call_guard<py::gil_scoped_release>())
+        .def("getForwardKinematicsCache", &pyKinematicChain::getForwardKinematicsCache)
         .def("finalize", &pyKinematicChain::finalize);
 
 
     // System class
-    py::class_<System>(m, "System")
+    py::class_<System, SystemHolder>(m, "System")
         .def(py::init<>())
         .def("createFixedJoint", &pygafro::createFixedJoint<double>)
         .def("createPrismaticJoint", py::overload_cast<System*, const std::string&>(&pygafro::createPrismaticJoint<double>))
@@ -155,6 +175,7 @@ void init_robots(py::module &m)
         .def("getLinks", &pygafro::getLinks<double>)
         .def("getJoint", &pygafro::getJoint<double>)
         .def("getJoints", &pygafro::getJoints<double>)
+        .def("getTopology", &pygafro::getTopology<double>)
         .def("setJointLimits", &System::setJointLimits)
         .def("getJointLimitsMin", &System::getJointLimitsMin)
         .def("getJointLimitsMax", &System::getJointLimitsMax)
@@ -162,20 +183,67 @@ void init_robots(py::module &m)
         .def("getRandomConfiguration", &System::getRandomConfiguration)
         .def("hasKinematicChain", &System::hasKinematicChain)
         .def("getKinematicChain", &pygafro::getKinematicChain<double>)
-        .def("computeKinematicChainMotor", &pygafro::computeKinematicChainMotor<double>)
-        .def("computeKinematicChainAnalyticJacobian", &pygafro::computeKinematicChainAnalyticJacobian<double>)
-        .def("computeKinematicChainGeometricJacobian", &pygafro::computeKinematicChainGeometricJacobian<double>)
-        .def("computeKinematicChainGeometricJacobianBody", &pygafro::computeKinematicChainGeometricJacobianBody<double>)
-        .def("computeInverseDynamics", &pygafro::computeInverseDynamics<double>)
-        .def("computeForwardDynamics", &pygafro::computeForwardDynamics<double>)
+        .def("computeKinematicChainMotor", &pygafro::computeKinematicChainMotor<double>, py::call_guard<py::gil_scoped_release>())
+        .def("computeKinematicChainAnalyticJacobian", &pygafro::computeKinematicChainAnalyticJacobian<double>, py::call_guard<py::gil_scoped_release>())
+        .def("computeKinematicChainGeometricJacobian", &pygafro::computeKinematicChainGeometricJacobian<double>, py::call_guard<py::gil_scoped_release>())
+        .def("computeKinematicChainGeometricJacobianBody", &pygafro::computeKinematicChainGeometricJacobianBody<double>, py::call_guard<py::gil_scoped_release>())
+        .def("computeInverseDynamics", &pygafro::computeInverseDynamics<double>, py::call_guard<py::gil_scoped_release>())
+        .def("computeForwardDynamics", &pygafro::computeForwardDynamics<double>, py::call_guard<py::gil_scoped_release>())
+        .def("computeInverseDynamicsBatch", &pygafro::computeInverseDynamicsBatch<double>, py::arg("positions"), py::arg("velocities"), py::arg("accelerations"), py::arg("gravity") = 9.81, py::arg("nbThreads") = 1)
+        .def("computeForwardDynamicsBatch", &pygafro::computeForwardDynamicsBatch<double>, py::arg("positions"), py::arg("velocities"), py::arg("torques"), py::arg("gravity") = 9.81, py::arg("nbThreads") = 1)
         .def("finalize", &System::finalize);
 
 
+    // SystemCache class
+    py::class_<SystemCache>(m, "SystemCache")
+        .def_static("clear", &SystemCache::clear)
+        .def_static("getSize", &SystemCache::getSize)
+        .def_static("getNbHits", &SystemCache::getNbHits)
+        .def_static("getNbMisses", &SystemCache::getNbMisses);
+
+
     // Manipulator class
     #include "manipulators.h"
     #include "manipulators.hpp"
 
 
+    // DynamicManipulator class
+    py::class_<DynamicManipulator>(m, "DynamicManipulator")
+        .def(py::init<const gafro::System<double>&, const std::string&>())
+        .def(py::init<const std::string&, const std::string&>())
+        .def_static("moveFromSystem", &DynamicManipulator::moveFromSystem, py::arg("system"), py::arg("eeJointName"), py::arg("dof") = -1)
+        .def_property_readonly("dof", &DynamicManipulator::getDoF)
+        .def("getDoF", &DynamicManipulator::getDoF)
+        .def("getSystem", &DynamicManipulator::getSystem, py::return_value_policy::reference_internal)
+        .def("getLink", &DynamicManipulator::getLink)
+        .def("getJoint", &DynamicManipulator::getJoint)
+        .def("getRandomConfiguration", &DynamicManipulator::getRandomConfiguration)
+        .def("getJointLimitsMin", &DynamicManipulator::getJointLimitsMin)
+        .def("getJointLimitsMax", &DynamicManipulator::getJointLimitsMax)
+        .def("getEEKinematicChain", &DynamicManipulator::getEEKinematicChain)
+        .def("getEEMotor", &DynamicManipulator::getEEMotor, py::call_guard<py::gil_scoped_release>())
+        .def("getEEMotorBatch", &DynamicManipulator::getEEMotorBatch, py::arg("positions"))
+        .def("getEETransformationMatrixBatch", &DynamicManipulator::getEETransformationMatrixBatch, py::arg("positions"))
+        .def("getEEAnalyticJacobian", &DynamicManipulator::getEEAnalyticJacobian, py::call_guard<py::gil_scoped_release>())
+        .def("getEEAnalyticJacobianArray", &DynamicManipulator::getEEAnalyticJacobianArray, py::arg("position"))
+        .def("getEEAnalyticJacobianBatch", &DynamicManipulator::getEEAnalyticJacobianBatch, py::arg("positions"))
+        .def("getEEGeometricJacobian", &DynamicManipulator::getEEGeometricJacobian, py::call_guard<py::gil_scoped_release>())
+        .def("getEEGeometricJacobianArray", &DynamicManipulator::getEEGeometricJacobianArray, py::arg("position"))
+        .def("getEEGeometricJacobianBatch", &DynamicManipulator::getEEGeometricJacobianBatch, py::arg("positions"))
+        .def("getGeometricJacobian", &DynamicManipulator::getGeometricJacobian, py::call_guard<py::gil_scoped_release>())
+        .def("getGeometricJacobianTimeDerivative", &DynamicManipulator::getGeometricJacobianTimeDerivative, py::call_guard<py::gil_scoped_release>())
+        .def("getEEFrameJacobian", &DynamicManipulator::getEEFrameJacobian, py::call_guard<py::gil_scoped_release>())
+        .def("getEEVelocityManipulability", &DynamicManipulator::getEEVelocityManipulability, py::call_guard<py::gil_scoped_release>())
+        .def("getEEForceManipulability", &DynamicManipulator::getEEForceManipulability, py::call_guard<py::gil_scoped_release>())
+        .def("getEEDynamicManipulability", &DynamicManipulator::getEEDynamicManipulability, py::call_guard<py::gil_scoped_release>())
+        .def("getEEKinematicNullspaceProjector", &DynamicManipulator::getEEKinematicNullspaceProjector, py::call_guard<py::gil_scoped_release>())
+        .def("getJointTorques", &DynamicManipulator::getJointTorques, py::arg("position"), py::arg("velocity"), py::arg("acceleration"), py::arg("gravity") = 9.81, py::arg("ee_wrench") = Wrench::Zero(), py::call_guard<py::gil_scoped_release>())
+        .def("getJointAccelerations", &DynamicManipulator::getJointAccelerations, py::arg("position"), py::arg("velocity"), py::arg("torque"), py::arg("gravity") = 9.81, py::call_guard<py::gil_scoped_release>())
+        .def("getJointTorquesBatch", &DynamicManipulator::getJointTorquesBatch, py::arg("positions"), py::arg("velocities"), py::arg("accelerations"), py::arg("gravity") = 9.81, py::arg("nbThreads") = 1)
+        .def("getJointAccelerationsBatch", &DynamicManipulator::getJointAccelerationsBatch, py::arg("positions"), py::arg("velocities"), py::arg("torques"), py::arg("gravity") = 9.81, py::arg("nbThreads") = 1)
+        .def("getMassMatrix", &DynamicManipulator::getMassMatrix, py::call_guard<py::gil_scoped_release>());
+
+
     // Quadruped class
     #include "quadrupeds.h"
     #include "quadrupeds.hpp"
@@ -192,7 +260,7 @@ void init_robots(py::module &m)
 
 
     // Atlas class
-    py::class_<Atlas, System>(m, "Atlas")
+    py::class_<Atlas, AtlasHolder, System>(m, "Atlas")
         .def(py::init(&createAtlas));
 
 
@@ -227,7 +295,7 @@ void init_robots(py::module &m)
 
 
     // UnitreeG1 class
-    py::class_<UnitreeG1, System>(m, "UnitreeG1")
+    py::class_<UnitreeG1, UnitreeG1Holder, System>(m, "UnitreeG1")
         .def(py::init(&createUnitreeG1));
 
 
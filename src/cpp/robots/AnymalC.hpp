@@ -8,8 +8,8 @@
 
 #pragma once
 
-#include <gafro_robot_descriptions/AnymalC.hpp>
 #include "robots/Quadruped.hpp"
+#include "robots/SystemCache.hpp"
 #include "utils.h"
 
 namespace pygafro
@@ -19,8 +19,10 @@ namespace pygafro
     {
       public:
         AnymalC()
+        : Quadruped<T, 3>(SystemCache<T>::load(getAssetsPath() + "robots/anymal_c/anymal_c.yaml"),
+                          std::array<std::string, 4>{ "LF_shank_fixed_LF_FOOT", "LH_shank_fixed_LH_FOOT",
+                                                      "RF_shank_fixed_RF_FOOT", "RH_shank_fixed_RH_FOOT" })
         {
-            this->quadruped = new gafro::AnymalC<T>(getAssetsPath());
         }
     };
 }
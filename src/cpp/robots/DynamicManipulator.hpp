@@ -0,0 +1,487 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <pybind11/numpy.h>
+#include <gafro/robot/System.hpp>
+#include "utils.hpp"
+#include "SystemCache.hpp"
+#include "KinematicChain.hpp"
+#include "Dynamics.hpp"
+#include "System.hpp"
+
+
+namespace pygafro
+{
+    // Manipulator whose number of DOF is only known at runtime (from the kinematic chain leading
+    // to the end-effector), so it isn't limited to the precompiled Manipulator_<dof> classes.
+    // Provides the same methods than those classes.
+    template <class T>
+    class DynamicManipulator
+    {
+        public:
+            typedef Eigen::Matrix<T, Eigen::Dynamic, 1> Vector;
+            typedef Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic> Matrix;
+
+            // C-contiguous (N, dof) array of joint configurations
+            typedef pybind11::array_t<T, pybind11::array::c_style | pybind11::array::forcecast> Configurations;
+
+        public:
+            DynamicManipulator(const gafro::System<T>& system, const std::string &ee_joint_name = "endeffector")
+            : system(std::make_unique<gafro::System<T>>())
+            {
+                // Python keeps the ownership of the system, so we have to make a copy of everything...
+                copySystem<T>(system, *this->system);
+                init(ee_joint_name);
+            }
+
+            // Takes the content of the system instead of copying it
+            DynamicManipulator(gafro::System<T>&& system, const std::string &ee_joint_name = "endeffector")
+            : system(std::make_unique<gafro::System<T>>(std::move(system)))
+            {
+                init(ee_joint_name);
+            }
+
+            // Moves the content of a system owned by Python into a new manipulator (see
+            // moveSystem()), leaving the Python object empty. The number of DOF is checked
+            // beforehand if given.
+            static DynamicManipulator* moveFromSystem(const pybind11::handle &system, const std::string &ee_joint_name,
+                                                      int dof = -1)
+            {
+                return new DynamicManipulator(moveSystem<T>(system, { ee_joint_name }, { dof }), ee_joint_name);
+            }
+
+            // The YAML file is only parsed once (see SystemCache)
+            DynamicManipulator(const std::string &yaml_file_path, const std::string &ee_joint_name = "endeffector")
+            : system(std::make_unique<gafro::System<T>>(SystemCache<T>::load(yaml_file_path)))
+            {
+                init(ee_joint_name);
+            }
+
+            ~DynamicManipulator()
+            {
+                WrapperCache<T>::forgetSystem(system.get());
+            }
+
+            inline int getDoF() const
+            {
+                return dof;
+            }
+
+            inline const gafro::System<T> *getSystem() const
+            {
+                return system.get();
+            }
+
+            inline std::shared_ptr<Link<T>> getLink(const std::string &name) const
+            {
+                return WrapperCache<T>::getLink(system.get(), system->getLink(name));
+            }
+
+            inline std::shared_ptr<Joint<T>> getJoint(const std::string &name) const
+            {
+                return WrapperCache<T>::getJoint(system.get(), system->getJoint(name));
+            }
+
+            Vector getRandomConfiguration() const
+            {
+                const Vector random = Vector::Random(dof);
+                return limits_min + (0.5 * (random.array() + 1.0) * (limits_max - limits_min).array()).matrix();
+            }
+
+            inline const Vector &getJointLimitsMin() const
+            {
+                return limits_min;
+            }
+
+            inline const Vector &getJointLimitsMax() const
+            {
+                return limits_max;
+            }
+
+            inline const KinematicChain<T>* getEEKinematicChain() const
+            {
+                return new KinematicChain<T>(system.get(), chain);
+            }
+
+            gafro::Motor<T> getEEMotor(const Vector &position) const
+            {
+                checkConfiguration(position);
+                return computeEEMotor(position.data());
+            }
+
+            pybind11::array_t<T> getEEMotorBatch(const Configurations &positions) const
+            {
+                const pybind11::ssize_t n = checkConfigurations(positions);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n, 8 });
+
+                const T* input = positions.data();
+                T* output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    for (pybind11::ssize_t i = 0; i < n; ++i)
+                        Eigen::Map<Eigen::Matrix<T, 8, 1>>(output + 8 * i) = computeEEMotor(input + dof * i).vector();
+                }
+
+                return result;
+            }
+
+            pybind11::array_t<T> getEETransformationMatrixBatch(const Configurations &positions) const
+            {
+                const pybind11::ssize_t n = checkConfigurations(positions);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n, 4, 4 });
+
+                const T* input = positions.data();
+                T* output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    for (pybind11::ssize_t i = 0; i < n; ++i)
+                    {
+                        Eigen::Map<Eigen::Matrix<T, 4, 4, Eigen::RowMajor>>(output + 16 * i) =
+                            computeEEMotor(input + dof * i).toTransformationMatrix();
+                    }
+                }
+
+                return result;
+            }
+
+            std::vector<gafro::Motor<T>> getEEAnalyticJacobian(const Vector &position) const
+            {
+                checkConfiguration(position);
+                return KinematicChain<T>(system.get(), chain).computeAnalyticJacobian(toStdVector(position.data()));
+            }
+
+            pybind11::array_t<T> getEEAnalyticJacobianArray(const Vector &position) const
+            {
+                checkConfiguration(position);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ dof, gafro::Motor<T>::size });
+                copyJacobian(getEEAnalyticJacobian(position), result.mutable_data());
+                return result;
+            }
+
+            pybind11::array_t<T> getEEAnalyticJacobianBatch(const Configurations &positions) const
+            {
+                const pybind11::ssize_t n = checkConfigurations(positions);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n, dof, gafro::Motor<T>::size });
+
+                const T* input = positions.data();
+                T* output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    KinematicChain<T> kinematic_chain(system.get(), chain);
+
+                    for (pybind11::ssize_t i = 0; i < n; ++i)
+                    {
+                        copyJacobian(
+                            kinematic_chain.computeAnalyticJacobian(toStdVector(input + dof * i)),
+                            output + dof * gafro::Motor<T>::size * i
+                        );
+                    }
+                }
+
+                return result;
+            }
+
+            std::vector<typename gafro::Motor<T>::Generator> getEEGeometricJacobian(const Vector &position) const
+            {
+                checkConfiguration(position);
+                return KinematicChain<T>(system.get(), chain).computeGeometricJacobian(toStdVector(position.data()));
+            }
+
+            pybind11::array_t<T> getEEGeometricJacobianArray(const Vector &position) const
+            {
+                checkConfiguration(position);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ dof, gafro::MotorGenerator<T>::size });
+                copyJacobian(getEEGeometricJacobian(position), result.mutable_data());
+                return result;
+            }
+
+            pybind11::array_t<T> getEEGeometricJacobianBatch(const Configurations &positions) const
+            {
+                const pybind11::ssize_t n = checkConfigurations(positions);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n, dof, gafro::MotorGenerator<T>::size });
+
+                const T* input = positions.data();
+                T* output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    KinematicChain<T> kinematic_chain(system.get(), chain);
+
+                    for (pybind11::ssize_t i = 0; i < n; ++i)
+                    {
+                        copyJacobian(
+                            kinematic_chain.computeGeometricJacobian(toStdVector(input + dof * i)),
+                            output + dof * gafro::MotorGenerator<T>::size * i
+                        );
+                    }
+                }
+
+                return result;
+            }
+
+            std::vector<typename gafro::Motor<T>::Generator> getGeometricJacobian(
+                const Vector &position, const gafro::Motor<T> &reference
+            ) const
+            {
+                std::vector<typename gafro::Motor<T>::Generator> jacobian = getEEGeometricJacobian(position);
+
+                gafro::Motor<T> reversed_motor = reference.reverse();
+
+                for (int i = 0; i < dof; ++i)
+                    jacobian[i] = reversed_motor.apply(jacobian[i]);
+
+                return jacobian;
+            }
+
+            std::vector<typename gafro::Motor<T>::Generator> getGeometricJacobianTimeDerivative(
+                const Vector &position, const Vector &velocity, const gafro::Motor<T> &reference
+            ) const
+            {
+                checkConfiguration(velocity);
+
+                const std::vector<typename gafro::Motor<T>::Generator> jacobian = getEEGeometricJacobian(position);
+                std::vector<typename gafro::Motor<T>::Generator> jacobian_time_derivative(dof);
+
+                // The derivative of each column only depends on the motion of the previous joints
+                typename gafro::Motor<T>::Generator twist;
+
+                gafro::Motor<T> reversed_motor = reference.reverse();
+
+                for (int i = 0; i < dof; ++i)
+                {
+                    jacobian_time_derivative[i] = reversed_motor.apply((jacobian[i].commute(twist)).evaluate());
+                    twist = twist + gafro::Scalar<T>(velocity[i]) * jacobian[i];
+                }
+
+                return jacobian_time_derivative;
+            }
+
+            std::vector<typename gafro::Motor<T>::Generator> getEEFrameJacobian(const Vector &position) const
+            {
+                checkConfiguration(position);
+                return KinematicChain<T>(system.get(), chain).computeGeometricJacobianBody(toStdVector(position.data()));
+            }
+
+            Eigen::Matrix<T, 6, 6> getEEVelocityManipulability(const Vector &position) const
+            {
+                const Eigen::Matrix<T, 6, Eigen::Dynamic> jacobian = getEEGeometricJacobianMatrix(position);
+                return jacobian * jacobian.transpose();
+            }
+
+            Eigen::Matrix<T, 6, 6> getEEForceManipulability(const Vector &position) const
+            {
+                return getEEVelocityManipulability(position).inverse();
+            }
+
+            Eigen::Matrix<T, 6, 6> getEEDynamicManipulability(const Vector &position) const
+            {
+                const Eigen::Matrix<T, 6, Eigen::Dynamic> jacobian = getEEGeometricJacobianMatrix(position);
+                const Matrix mass_matrix = getMassMatrix(position);
+
+                return jacobian * (mass_matrix.transpose() * mass_matrix).inverse() * jacobian.transpose();
+            }
+
+            Matrix getEEKinematicNullspaceProjector(const Vector &position) const
+            {
+                const Eigen::Matrix<T, 6, Eigen::Dynamic> jacobian = getEEGeometricJacobianMatrix(position);
+
+                // Damped pseudo-inverse of the jacobian
+                const Matrix inverse = jacobian.transpose() *
+                    (jacobian * jacobian.transpose() + 1e-5 * Eigen::Matrix<T, 6, 6>::Identity()).inverse();
+
+                return Matrix::Identity(dof, dof) - inverse * jacobian;
+            }
+
+            // The wrench applied on the end-effector is expressed in the world frame, its
+            // contribution is -J^T * ee_wrench
+            Vector getJointTorques(const Vector &position, const Vector &velocity, const Vector &acceleration,
+                                   const T &gravity = 9.81,
+                                   const gafro::Wrench<T> &ee_wrench = gafro::Wrench<T>::Zero()) const
+            {
+                checkConfiguration(position);
+
+                ChainDynamics<T> dynamics(chain, position);
+                return dynamics.computeInverseDynamics(velocity, acceleration, gravity) -
+                       dynamics.computeWrenchTorques(ee_wrench);
+            }
+
+            Vector getJointAccelerations(const Vector &position, const Vector &velocity, const Vector &torque,
+                                         const T &gravity = 9.81) const
+            {
+                checkConfiguration(position);
+                return ChainDynamics<T>(chain, position).computeForwardDynamics(velocity, torque, gravity);
+            }
+
+            pybind11::array_t<T> getJointTorquesBatch(const Configurations &positions, const Configurations &velocities,
+                                                      const Configurations &accelerations, const T &gravity,
+                                                      unsigned int nb_threads) const
+            {
+                return computeDynamicsBatch(positions, velocities, accelerations, gravity, true, nb_threads);
+            }
+
+            pybind11::array_t<T> getJointAccelerationsBatch(const Configurations &positions, const Configurations &velocities,
+                                                            const Configurations &torques, const T &gravity,
+                                                            unsigned int nb_threads) const
+            {
+                return computeDynamicsBatch(positions, velocities, torques, gravity, false, nb_threads);
+            }
+
+            Matrix getMassMatrix(const Vector &position) const
+            {
+                checkConfiguration(position);
+                return ChainDynamics<T>(chain, position).computeMassMatrix();
+            }
+
+        protected:
+            void init(const std::string &ee_joint_name)
+            {
+                system->finalize();
+
+                if (!system->hasKinematicChain(ee_joint_name))
+                    system->createKinematicChain(ee_joint_name);
+
+                chain = system->getKinematicChain(ee_joint_name);
+                if (!chain)
+                    throw std::runtime_error("Failed to create the kinematic chain of the end-effector");
+
+                dof = chain->getDoF();
+
+                const auto& joints = chain->getActuatedJoints();
+
+                limits_min.resize(dof);
+                limits_max.resize(dof);
+
+                for (int i = 0; i < dof; ++i)
+                {
+                    limits_min[i] = joints[i]->getLimits().position_lower;
+                    limits_max[i] = joints[i]->getLimits().position_upper;
+                }
+            }
+
+            gafro::Motor<T> computeEEMotor(const T* position) const
+            {
+                gafro::Motor<T> motor;
+
+                for (int i = 0; i < dof; ++i)
+                    motor = motor * chain->computeMotor(i, position[i]);
+
+                return motor;
+            }
+
+            Eigen::Matrix<T, 6, Eigen::Dynamic> getEEGeometricJacobianMatrix(const Vector &position) const
+            {
+                const std::vector<typename gafro::Motor<T>::Generator> jacobian = getEEGeometricJacobian(position);
+
+                Eigen::Matrix<T, 6, Eigen::Dynamic> result(6, dof);
+                for (int i = 0; i < dof; ++i)
+                    result.col(i) = jacobian[i].vector();
+
+                return result;
+            }
+
+            inline std::vector<T> toStdVector(const T* position) const
+            {
+                return std::vector<T>(position, position + dof);
+            }
+
+            void checkConfiguration(const Vector &position) const
+            {
+                if (position.size() != dof)
+                    throw std::length_error("Invalid number of DOF");
+            }
+
+            pybind11::ssize_t checkConfigurations(const Configurations &positions) const
+            {
+                if ((positions.ndim() != 2) || (positions.shape(1) != dof))
+                    throw std::length_error("Invalid number of DOF");
+
+                return positions.shape(0);
+            }
+
+            pybind11::array_t<T> computeDynamicsBatch(const Configurations &positions, const Configurations &velocities,
+                                                      const Configurations &values, const T &gravity, bool inverse,
+                                                      unsigned int nb_threads) const
+            {
+                const pybind11::ssize_t n = checkConfigurations(positions);
+
+                if ((checkConfigurations(velocities) != n) || (checkConfigurations(values) != n))
+                    throw std::length_error("Invalid number of time steps");
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n, dof });
+
+                const T* q = positions.data();
+                const T* qd = velocities.data();
+                const T* x = values.data();
+                T* output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    parallelForRanges(n, nb_threads, [&](size_t begin, size_t end) {
+                        // One workspace per thread, reused for all its time steps
+                        ChainDynamics<T> dynamics(chain);
+
+                        for (size_t i = begin; i < end; ++i)
+                        {
+                            Eigen::Map<Vector> row(output + dof * i, dof);
+
+                            dynamics.setPosition(Eigen::Map<const Vector>(q + dof * i, dof));
+
+                            if (inverse)
+                            {
+                                dynamics.computeInverseDynamics(
+                                    Eigen::Map<const Vector>(qd + dof * i, dof), Eigen::Map<const Vector>(x + dof * i, dof),
+                                    gravity, row
+                                );
+                            }
+                            else
+                            {
+                                dynamics.computeForwardDynamics(
+                                    Eigen::Map<const Vector>(qd + dof * i, dof), Eigen::Map<const Vector>(x + dof * i, dof),
+                                    gravity, row
+                                );
+                            }
+                        }
+                    });
+                }
+
+                return result;
+            }
+
+            // Writes the coefficients of a jacobian as the rows of a (dof, size) row-major buffer
+            template <class M>
+            static void copyJacobian(const std::vector<M> &jacobian, T *output)
+            {
+                for (size_t i = 0; i < jacobian.size(); ++i)
+                    Eigen::Map<Eigen::Matrix<T, M::size, 1>>(output + M::size * i) = jacobian[i].vector();
+            }
+
+        protected:
+            std::unique_ptr<gafro::System<T>> system;
+            gafro::KinematicChain<T>* chain = nullptr;
+            int dof = 0;
+            Vector limits_min;
+            Vector limits_max;
+    };
+
+}  // namespace pygafro
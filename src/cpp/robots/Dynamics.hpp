@@ -0,0 +1,259 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <gafro/physics/Wrench.hpp>
+#include <gafro/robot/KinematicChain.hpp>
+
+
+namespace pygafro
+{
+
+    // Dynamics of a kinematic chain whose number of DOF is only known at runtime (the
+    // dynamics of gafro are templated on the number of DOF).
+    //
+    // The computations are done in the world frame, using 6D spatial vectors (angular part
+    // first): the motion subspace of joint 'i' is its geometric jacobian column, and the
+    // spatial inertia of body 'i' is its inertia transformed by the motor of its frame.
+    // Those are computed once per configuration (see setPosition()), then:
+    //   - the inverse dynamics use the recursive Newton-Euler algorithm, O(dof)
+    //   - the mass matrix is computed from the composite inertias, O(dof^2)
+    //   - the forward dynamics solve M(q) * acceleration = torque - h(q, velocity)
+    template <class T>
+    class ChainDynamics
+    {
+      public:
+        typedef Eigen::Matrix<T, Eigen::Dynamic, 1> Vector;
+        typedef Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic> Matrix;
+        typedef Eigen::Ref<const Vector> VectorRef;
+        typedef Eigen::Matrix<T, 6, 1> SpatialVector;
+        typedef Eigen::Matrix<T, 6, 6> SpatialMatrix;
+
+      public:
+        ChainDynamics(const gafro::KinematicChain<T>* chain)
+        : chain(chain), dof(chain->getDoF()), axes(dof), inertias(dof), forces(dof),
+          zeros(Vector::Zero(dof)), bias(dof), mass_matrix(dof, dof)
+        {
+        }
+
+        ChainDynamics(const gafro::KinematicChain<T>* chain, const VectorRef &position)
+        : ChainDynamics(chain)
+        {
+            setPosition(position);
+        }
+
+        inline int getDoF() const
+        {
+            return dof;
+        }
+
+        // Computes the motion subspaces and the spatial inertias of the bodies for the given
+        // configuration. The same object can be reused for several configurations without
+        // any new allocation.
+        void setPosition(const VectorRef &position)
+        {
+            checkSize(position);
+
+            const auto& actuated_joints = chain->getActuatedJoints();
+            const auto& bodies = chain->getBodies();
+
+            gafro::Motor<T> joint_motor;
+
+            for (int i = 0; i < dof; ++i)
+            {
+                axes[i] = toSpatialVector(actuated_joints[i]->getCurrentAxis(joint_motor * actuated_joints[i]->getFrame()));
+
+                const gafro::Motor<T> body_motor = joint_motor * actuated_joints[i]->getMotor(position[i]);
+                inertias[i] = toSpatialInertia(
+                    bodies[i]->getInertia().transform(body_motor * bodies[i]->getCenterOfMass())
+                );
+
+                joint_motor *= chain->computeMotor(i, position[i]);
+            }
+        }
+
+        void computeInverseDynamics(const VectorRef &velocity, const VectorRef &acceleration, const T &gravity,
+                                    Eigen::Ref<Vector> torque)
+        {
+            checkSize(velocity);
+            checkSize(acceleration);
+
+            SpatialVector twist = SpatialVector::Zero();
+
+            // The gravity is modelled as an upward acceleration of the base
+            SpatialVector spatial_acceleration = SpatialVector::Zero();
+            spatial_acceleration[5] = gravity;
+
+            for (int i = 0; i < dof; ++i)
+            {
+                spatial_acceleration += axes[i] * acceleration[i] + crossMotion(twist, axes[i]) * velocity[i];
+                twist += axes[i] * velocity[i];
+
+                const SpatialVector momentum = inertias[i] * twist;
+                forces[i] = inertias[i] * spatial_acceleration + crossForce(twist, momentum);
+            }
+
+            SpatialVector force = SpatialVector::Zero();
+
+            for (int i = dof - 1; i >= 0; --i)
+            {
+                force += forces[i];
+                torque[i] = axes[i].dot(force);
+            }
+        }
+
+        Vector computeInverseDynamics(const VectorRef &velocity, const VectorRef &acceleration, const T &gravity = 9.81)
+        {
+            Vector torque(dof);
+            computeInverseDynamics(velocity, acceleration, gravity, torque);
+            return torque;
+        }
+
+        void computeForwardDynamics(const VectorRef &velocity, const VectorRef &torque, const T &gravity,
+                                    Eigen::Ref<Vector> acceleration)
+        {
+            checkSize(torque);
+
+            computeInverseDynamics(velocity, zeros, gravity, bias);
+            computeMassMatrix(mass_matrix);
+
+            ldlt.compute(mass_matrix);
+            acceleration = ldlt.solve(torque - bias);
+        }
+
+        Vector computeForwardDynamics(const VectorRef &velocity, const VectorRef &torque, const T &gravity = 9.81)
+        {
+            Vector acceleration(dof);
+            computeForwardDynamics(velocity, torque, gravity, acceleration);
+            return acceleration;
+        }
+
+        void computeMassMatrix(Eigen::Ref<Matrix> result) const
+        {
+            // Composite inertia of the bodies i..dof-1 (already expressed in the same frame)
+            SpatialMatrix composite_inertia = SpatialMatrix::Zero();
+
+            for (int i = dof - 1; i >= 0; --i)
+            {
+                composite_inertia += inertias[i];
+
+                const SpatialVector force = composite_inertia * axes[i];
+
+                for (int j = 0; j <= i; ++j)
+                {
+                    result(i, j) = axes[j].dot(force);
+                    result(j, i) = result(i, j);
+                }
+            }
+        }
+
+        Matrix computeMassMatrix() const
+        {
+            Matrix result(dof, dof);
+            computeMassMatrix(result);
+            return result;
+        }
+
+        // Joint torques balancing an external wrench applied on the last body, expressed in the
+        // world frame: J^T * wrench, with J the geometric jacobian of the chain
+        Vector computeWrenchTorques(const gafro::Wrench<T> &wrench) const
+        {
+            const SpatialVector force = toSpatialForce(wrench);
+
+            Vector torque(dof);
+            for (int i = 0; i < dof; ++i)
+                torque[i] = axes[i].dot(force);
+
+            return torque;
+        }
+
+      private:
+        inline void checkSize(const VectorRef &vector) const
+        {
+            if (vector.size() != dof)
+                throw std::length_error("Invalid number of DOF");
+        }
+
+        // Twist parameters (e12, e13, e23, e1i, e2i, e3i) -> spatial motion vector
+        static SpatialVector toSpatialVector(const typename gafro::Motor<T>::Generator &generator)
+        {
+            const auto& parameters = generator.vector();
+
+            SpatialVector result;
+            result << parameters[2], -parameters[1], parameters[0], parameters[3], parameters[4], parameters[5];
+
+            return result;
+        }
+
+        // Inertia tensor (indexed by e01, e02, e12, e03, e13, e23) -> spatial inertia, so that
+        // the kinetic energy is 0.5 * v^T * I * v for a spatial motion vector v
+        static SpatialMatrix toSpatialInertia(const gafro::Inertia<T> &inertia)
+        {
+            static const int indices[6] = { 5, 4, 2, 0, 1, 3 };
+            static const T signs[6] = { 1.0, -1.0, 1.0, 1.0, 1.0, 1.0 };
+
+            const Eigen::Matrix<T, 6, 6> tensor = inertia.getTensor();
+
+            SpatialMatrix result;
+            for (int i = 0; i < 6; ++i)
+            {
+                for (int j = 0; j < 6; ++j)
+                    result(i, j) = signs[i] * signs[j] * tensor(indices[i], indices[j]);
+            }
+
+            return result;
+        }
+
+        // Wrench parameters (e01, e02, e12, e03, e13, e23) -> spatial force vector, using the
+        // same pairing with the motion vectors as toSpatialInertia()
+        static SpatialVector toSpatialForce(const gafro::Wrench<T> &wrench)
+        {
+            const auto& parameters = wrench.vector();
+
+            SpatialVector result;
+            result << parameters[5], -parameters[4], parameters[2], parameters[0], parameters[1], parameters[3];
+
+            return result;
+        }
+
+        // Spatial cross product for motion vectors: v x m
+        static SpatialVector crossMotion(const SpatialVector &v, const SpatialVector &m)
+        {
+            SpatialVector result;
+            result.template head<3>() = v.template head<3>().cross(m.template head<3>());
+            result.template tail<3>() = v.template head<3>().cross(m.template tail<3>()) +
+                                        v.template tail<3>().cross(m.template head<3>());
+            return result;
+        }
+
+        // Spatial cross product for force vectors: v x* f
+        static SpatialVector crossForce(const SpatialVector &v, const SpatialVector &f)
+        {
+            SpatialVector result;
+            result.template head<3>() = v.template head<3>().cross(f.template head<3>()) +
+                                        v.template tail<3>().cross(f.template tail<3>());
+            result.template tail<3>() = v.template head<3>().cross(f.template tail<3>());
+            return result;
+        }
+
+      private:
+        const gafro::KinematicChain<T>* chain;
+        int dof;
+
+        // Workspace
+        std::vector<SpatialVector> axes;
+        std::vector<SpatialMatrix> inertias;
+        std::vector<SpatialVector> forces;
+        Vector zeros;
+        Vector bias;
+        Matrix mass_matrix;
+        Eigen::LDLT<Matrix> ldlt;
+    };
+
+}  // namespace pygafro
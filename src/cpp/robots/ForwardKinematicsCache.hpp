@@ -0,0 +1,191 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <atomic>
+#include <mutex>
+#include <vector>
+
+#include <gafro/robot/KinematicChain.hpp>
+
+
+namespace pygafro
+{
+    // Generation of the kinematic parameters of the joints and links of all the systems,
+    // incremented each time one of them is modified through its wrapper (see Joint and
+    // Link): the forward kinematics cached at an older generation are stale
+    inline std::atomic<size_t>& getKinematicsGeneration()
+    {
+        static std::atomic<size_t> generation(0);
+        return generation;
+    }
+
+    inline void invalidateForwardKinematicsCaches()
+    {
+        ++getKinematicsGeneration();
+    }
+
+
+    // Analytic Jacobian of a kinematic chain, from the motors of its joints and their
+    // prefix products (M_0 * ... * M_i), in O(n) motor products:
+    //
+    //     J_i = (M_0 * ... * M_i-1) * dM_i * (M_i+1 * ... * M_n-1)
+    //
+    // the suffix products being accumulated from the last joint
+    template <class T>
+    std::vector<gafro::Motor<T>> computeAnalyticJacobianFromPrefixes(
+        gafro::KinematicChain<T>* chain, const T* position, const std::vector<gafro::Motor<T>> &motors,
+        const std::vector<gafro::Motor<T>> &prefixes)
+    {
+        const int dof = motors.size();
+
+        std::vector<gafro::Motor<T>> jacobian(dof, gafro::Motor<T>());
+        gafro::Motor<T> suffix;
+
+        for (int i = dof - 1; i >= 0; --i)
+        {
+            if (i > 0)
+                jacobian[i] = prefixes[i - 1];
+
+            jacobian[i] *= chain->computeMotorDerivative(i, position[i]);
+            jacobian[i] *= suffix;
+
+            suffix = motors[i] * suffix;
+        }
+
+        return jacobian;
+    }
+
+
+    // Opt-in cache of the forward kinematics of a kinematic chain: the motors of the joints
+    // and their prefix products (M_0 * ... * M_i) are kept for the last configuration, and
+    // only recomputed from the first joint whose position changed (or from the first one
+    // when a joint or a link was modified since, see getKinematicsGeneration()).
+    //
+    // A 'hit' is a prefix product reused from the cache, a 'miss' one that had to be
+    // recomputed. The cache is disabled by default. Once enabled, the calls using it are
+    // serialized, so it can still be shared by several threads.
+    template <class T>
+    class ForwardKinematicsCache
+    {
+        public:
+            ForwardKinematicsCache()
+            : enabled(false), generation(0), nb_hits(0), nb_misses(0)
+            {
+            }
+
+            inline bool isEnabled() const
+            {
+                return enabled;
+            }
+
+            void setEnabled(bool enabled)
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                this->enabled = enabled;
+                reset();
+            }
+
+            // Forgets the last configuration and resets the counters
+            void clear()
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                reset();
+            }
+
+            size_t getNbHits() const
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                return nb_hits;
+            }
+
+            size_t getNbMisses() const
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                return nb_misses;
+            }
+
+            gafro::Motor<T> computeMotor(gafro::KinematicChain<T>* chain, const T* position, size_t dof)
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+
+                update(chain, position, dof);
+
+                return (dof > 0 ? prefixes[dof - 1] : gafro::Motor<T>());
+            }
+
+            std::vector<gafro::Motor<T>> computeAnalyticJacobian(gafro::KinematicChain<T>* chain,
+                                                                 const T* position, size_t dof)
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+
+                update(chain, position, dof);
+
+                return computeAnalyticJacobianFromPrefixes(chain, position, motors, prefixes);
+            }
+
+        private:
+            void reset()
+            {
+                positions.clear();
+                motors.clear();
+                prefixes.clear();
+                nb_hits = 0;
+                nb_misses = 0;
+            }
+
+            void update(gafro::KinematicChain<T>* chain, const T* position, size_t dof)
+            {
+                size_t first = 0;
+
+                const size_t current_generation = getKinematicsGeneration();
+
+                if ((positions.size() != dof) || (generation != current_generation))
+                {
+                    positions.resize(dof);
+                    motors.resize(dof);
+                    prefixes.resize(dof);
+                    generation = current_generation;
+                }
+                else
+                {
+                    while ((first < dof) && (positions[first] == position[first]))
+                        ++first;
+                }
+
+                nb_hits += first;
+                nb_misses += dof - first;
+
+                for (size_t i = first; i < dof; ++i)
+                {
+                    positions[i] = position[i];
+                    motors[i] = chain->computeMotor(i, position[i]);
+
+                    if (i > 0)
+                        prefixes[i] = prefixes[i - 1] * motors[i];
+                    else
+                        prefixes[i] = motors[i];
+                }
+            }
+
+        private:
+            mutable std::mutex mutex;
+            std::atomic<bool> enabled;
+
+            // Guarded by the mutex
+            size_t generation;
+            std::vector<T> positions;
+            std::vector<gafro::Motor<T>> motors;
+            std::vector<gafro::Motor<T>> prefixes;
+
+            size_t nb_hits;
+            size_t nb_misses;
+    };
+
+}  // namespace pygafro
@@ -8,7 +8,6 @@
 
 #pragma once
 
-#include <gafro_robot_descriptions/FrankaEmikaRobot.hpp>
 #include "robots/Manipulator.hpp"
 #include "utils.h"
 
@@ -19,8 +18,8 @@ namespace pygafro
     {
       public:
         FrankaEmikaRobot()
+        : Manipulator<T, 7>(getAssetsPath() + "robots/panda/panda.yaml", "panda_endeffector_joint")
         {
-            this->manipulator = new gafro::FrankaEmikaRobot<T>(getAssetsPath());
         }
     };
 }
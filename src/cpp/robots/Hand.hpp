@@ -45,8 +45,27 @@ namespace pygafro
                 hand = new gafro::Hand<T, fingers...>(std::move(system2), finger_tip_names);
             }
 
+            // Takes the content of the system instead of copying it
+            Hand(gafro::System<T>&& system, const std::array<std::string, n_fingers> &finger_tip_names)
+            : hand(new gafro::Hand<T, fingers...>(std::move(system), finger_tip_names)), finger_tip_names(finger_tip_names)
+            {
+            }
+
+            // Moves the content of a system owned by Python into a new hand (see moveSystem()),
+            // leaving the Python object empty
+            static Hand* moveFromSystem(const pybind11::handle &system, const std::array<std::string, n_fingers> &finger_tip_names)
+            {
+                return new Hand(
+                    moveSystem<T>(system, std::vector<std::string>(finger_tip_names.begin(), finger_tip_names.end()), { fingers... }),
+                    finger_tip_names
+                );
+            }
+
             virtual ~Hand()
             {
+                if (hand)
+                    WrapperCache<T>::forgetSystem(&hand->getSystem());
+
                 delete hand;
             }
 
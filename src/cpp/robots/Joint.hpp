@@ -8,7 +8,10 @@
 
 #pragma once
 
+#include <memory>
+
 #include <gafro/robot/System.hpp>
+#include "ForwardKinematicsCache.hpp"
 
 namespace pygafro
 {
@@ -16,6 +19,9 @@ namespace pygafro
     template <class T>
     class Link;
 
+    template <class T>
+    class WrapperCache;
+
 
     // Allows to access and manipulate joints from Python while avoiding any memory
     // ownership problem (Joints are managed in System using std::unique_ptr)
@@ -33,10 +39,12 @@ namespace pygafro
 
         virtual ~Joint() {}
 
-        // setter functions
+        // setter functions (those modifying the kinematics invalidate the forward kinematics
+        // caches, see ForwardKinematicsCache)
         inline void setFrame(const gafro::Motor<T> &frame)
         {
             joint->setFrame(frame);
+            invalidateForwardKinematicsCaches();
         }
 
         inline void setLimits(const typename gafro::Joint<T>::Limits &limits)
@@ -47,11 +55,13 @@ namespace pygafro
         inline void setParentLink(const Link<T> *parent_link)
         {
             joint->setParentLink(parent_link->getPtr());
+            invalidateForwardKinematicsCaches();
         }
 
         inline void setChildLink(const Link<T> *child_link)
         {
             joint->setChildLink(child_link->getPtr());
+            invalidateForwardKinematicsCaches();
         }
 
         // getter functions
@@ -75,22 +85,14 @@ namespace pygafro
             return joint->getLimits();
         }
 
-        inline Link<T> *getParentLink()
+        inline std::shared_ptr<Link<T>> getParentLink() const
         {
-            const gafro::Link<T>* link = joint->getParentLink();
-            if (!link)
-                return nullptr;
-
-            return new Link<T>(system, link->getName());
+            return WrapperCache<T>::getLink(system, joint->getParentLink());
         }
 
-        inline Link<T> *getChildLink()
+        inline std::shared_ptr<Link<T>> getChildLink() const
         {
-            const gafro::Link<T>* link = joint->getChildLink();
-            if (!link)
-                return nullptr;
-
-            return new Link<T>(system, link->getName());
+            return WrapperCache<T>::getLink(system, joint->getChildLink());
         }
 
         inline const gafro::Joint<T>* getPtr() const
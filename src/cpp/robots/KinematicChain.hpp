@@ -8,9 +8,14 @@
 
 #pragma once
 
+#include <memory>
+
 #include <gafro/robot/KinematicChain.hpp>
+#include "ForwardKinematicsCache.hpp"
 #include "PrismaticJoint.hpp"
 #include "RevoluteJoint.hpp"
+#include "WrapperCache.hpp"
+#include "Dynamics.hpp"
 
 namespace pygafro
 {
@@ -22,11 +27,13 @@ namespace pygafro
     {
       public:
         KinematicChain(gafro::System<T>* system, const std::string& name)
-        : system(system), chain(system->getKinematicChain(name))
+        : system(system), chain(system->getKinematicChain(name)), cache(std::make_shared<ForwardKinematicsCache<T>>())
         {}
 
-        KinematicChain(gafro::System<T>* system, gafro::KinematicChain<T>* chain)
-        : system(system), chain(chain)
+        // The cache of the forward kinematics can be shared with the owner of the chain
+        KinematicChain(gafro::System<T>* system, gafro::KinematicChain<T>* chain,
+                       const std::shared_ptr<ForwardKinematicsCache<T>> &cache = nullptr)
+        : system(system), chain(chain), cache(cache ? cache : std::make_shared<ForwardKinematicsCache<T>>())
         {}
 
         inline int getDoF() const
@@ -37,6 +44,7 @@ namespace pygafro
         inline void addActuatedJoint(const Joint<T>* joint)
         {
             chain->addActuatedJoint(joint->getPtr());
+            cache->clear();
 
             if (system == nullptr)
                 system = joint->getSystem();
@@ -45,11 +53,13 @@ namespace pygafro
         inline void addFixedMotor(const gafro::Motor<T> &motor)
         {
             chain->addFixedMotor(motor);
+            cache->clear();
         }
 
         inline void setFixedMotors(const std::map<int, gafro::Motor<T>> &fixed_motors)
         {
             chain->setFixedMotors(fixed_motors);
+            cache->clear();
         }
 
         inline const std::map<int, gafro::Motor<T>> &getFixedMotors() const
@@ -57,27 +67,15 @@ namespace pygafro
             return chain->getFixedMotors();
         }
 
-        const std::vector<const Joint<T>*> getActuatedJoints() const
+        std::vector<std::shared_ptr<Joint<T>>> getActuatedJoints() const
         {
             const auto& joints = chain->getActuatedJoints();
 
-            std::vector<const Joint<T>*> result;
+            std::vector<std::shared_ptr<Joint<T>>> result;
             result.reserve(joints.size());
 
             for (auto iter = joints.cbegin(), iterEnd = joints.cend(); iter != iterEnd; ++iter)
-            {
-                switch ((*iter)->getType())
-                {
-                    case gafro::Joint<T>::Type::PRISMATIC:
-                        result.emplace_back(new PrismaticJoint<T>(system, (*iter)->getName()));
-
-                    case gafro::Joint<T>::Type::REVOLUTE:
-                        result.emplace_back(new RevoluteJoint<T>(system, (*iter)->getName()));
-
-                    default:
-                        break;
-                }
-            }
+                result.emplace_back(WrapperCache<T>::getJoint(system, *iter));
 
             return result;
         }
@@ -87,6 +85,9 @@ namespace pygafro
             if (position.size() != chain->getActuatedJoints().size())
                 throw std::runtime_error("kinematic chain has not enough dof!");
 
+            if (cache->isEnabled())
+                return cache->computeMotor(chain, position.data(), position.size());
+
             gafro::Motor<T> motor;
 
             for (size_t i = 0; i < position.size(); ++i)
@@ -107,22 +108,23 @@ namespace pygafro
 
         std::vector<gafro::Motor<T>> computeAnalyticJacobian(const std::vector<T> &position) const
         {
-            std::vector<gafro::Motor<T>> jacobian(position.size(), gafro::Motor<T>());
+            if (cache->isEnabled())
+                return cache->computeAnalyticJacobian(chain, position.data(), position.size());
 
-            for (unsigned int i = 0; i < position.size(); ++i)
+            std::vector<gafro::Motor<T>> motors(position.size());
+            std::vector<gafro::Motor<T>> prefixes(position.size());
+
+            for (size_t i = 0; i < position.size(); ++i)
             {
-                gafro::Motor<T> motor = chain->computeMotor(i, position[i]);
-
-                for (unsigned int j = 0; j < position.size(); ++j)
-                {
-                    if (j == i)
-                        jacobian[j] *= chain->computeMotorDerivative(j, position[j]);
-                    else
-                        jacobian[j] *= motor;
-                }
+                motors[i] = chain->computeMotor(i, position[i]);
+
+                if (i > 0)
+                    prefixes[i] = prefixes[i - 1] * motors[i];
+                else
+                    prefixes[i] = motors[i];
             }
 
-            return jacobian;
+            return computeAnalyticJacobianFromPrefixes(chain, position.data(), motors, prefixes);
         }
 
         std::vector<typename gafro::Motor<T>::Generator> computeGeometricJacobian(const std::vector<T> &position) const
@@ -187,39 +189,44 @@ namespace pygafro
             return jacobian_time_derivative;
         }
 
+        // Composite rigid body algorithm, O(dof^2) (see ChainDynamics)
         Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic> computeMassMatrix(const std::vector<T> &position) const
         {
-            const int dof = position.size();
-
-            Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic> mass_matrix = Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic>::Zero(dof, dof);
-
-            std::vector<typename gafro::Motor<T>::Generator> gj = computeGeometricJacobian(position);
-
-            gafro::Motor<T> m;
-            const auto& actuated_joints = chain->getActuatedJoints();
-            const auto& bodies = chain->getBodies();
-
-            for (int j = 0; j < dof; ++j)
-            {
-                m *= actuated_joints[j]->getMotor(position[j]);
-
-                gafro::Inertia<T> inertia = bodies[j]->getInertia().transform(m * bodies[j]->getCenterOfMass());
+            return ChainDynamics<T>(
+                chain, Eigen::Map<const Eigen::Matrix<T, Eigen::Dynamic, 1>>(position.data(), position.size())
+            ).computeMassMatrix();
+        }
 
-                for (int k = 0; k < j + 1; ++k)
-                {
-                    for (int l = 0; l < j + 1; ++l)
-                    {
-                        mass_matrix.coeffRef(k, l) += -(inertia(gj[l]) | gj[k]).template get<gafro::blades::scalar>();
-                    }
-                }
-            }
+        // Runtime-sized dynamics (see ChainDynamics), not limited in number of DOF
+        Eigen::Matrix<T, Eigen::Dynamic, 1> computeInverseDynamics(
+            const Eigen::Ref<const Eigen::Matrix<T, Eigen::Dynamic, 1>> &position,
+            const Eigen::Ref<const Eigen::Matrix<T, Eigen::Dynamic, 1>> &velocity,
+            const Eigen::Ref<const Eigen::Matrix<T, Eigen::Dynamic, 1>> &acceleration,
+            const T &gravity = 9.81) const
+        {
+            return ChainDynamics<T>(chain, position).computeInverseDynamics(velocity, acceleration, gravity);
+        }
 
-            return mass_matrix;
+        Eigen::Matrix<T, Eigen::Dynamic, 1> computeForwardDynamics(
+            const Eigen::Ref<const Eigen::Matrix<T, Eigen::Dynamic, 1>> &position,
+            const Eigen::Ref<const Eigen::Matrix<T, Eigen::Dynamic, 1>> &velocity,
+            const Eigen::Ref<const Eigen::Matrix<T, Eigen::Dynamic, 1>> &torque,
+            const T &gravity = 9.81) const
+        {
+            return ChainDynamics<T>(chain, position).computeForwardDynamics(velocity, torque, gravity);
         }
 
         void finalize()
         {
             chain->finalize();
+            cache->clear();
+        }
+
+        // Opt-in cache of the forward kinematics (see ForwardKinematicsCache), used by
+        // computeFullMotor() and computeAnalyticJacobian()
+        inline std::shared_ptr<ForwardKinematicsCache<T>> getForwardKinematicsCache() const
+        {
+            return cache;
         }
 
         inline gafro::KinematicChain<T>* getPtr() const
@@ -230,6 +237,7 @@ namespace pygafro
     private:
       gafro::System<T>* system;
       gafro::KinematicChain<T>* chain;
+      std::shared_ptr<ForwardKinematicsCache<T>> cache;
     };
 
 }  // namespace pygafro
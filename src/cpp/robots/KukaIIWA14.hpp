@@ -8,7 +8,6 @@
 
 #pragma once
 
-#include <gafro_robot_descriptions/KukaIIWA14.hpp>
 #include "robots/Manipulator.hpp"
 #include "utils.h"
 
@@ -19,8 +18,8 @@ namespace pygafro
     {
       public:
         KukaIIWA14()
+        : Manipulator<T, 7>(getAssetsPath() + "robots/kuka/iiwa14/iiwa14.yaml", "lbr_joint_ee")
         {
-            this->manipulator = new gafro::KukaIIWA14<T>(getAssetsPath());
         }
     };
 }
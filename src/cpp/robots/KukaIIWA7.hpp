@@ -8,7 +8,6 @@
 
 #pragma once
 
-#include <gafro_robot_descriptions/KukaIIWA7.hpp>
 #include "robots/Manipulator.hpp"
 #include "utils.h"
 
@@ -19,8 +18,8 @@ namespace pygafro
     {
       public:
         KukaIIWA7()
+        : Manipulator<T, 7>(getAssetsPath() + "robots/kuka/iiwa7/iiwa7.yaml", "iiwa_joint_ee")
         {
-            this->manipulator = new gafro::KukaIIWA7<T>(getAssetsPath());
         }
     };
 }
@@ -8,8 +8,8 @@
 
 #pragma once
 
-#include <gafro_robot_descriptions/LeapHand.hpp>
 #include "robots/Hand.hpp"
+#include "robots/SystemCache.hpp"
 #include "utils.h"
 
 namespace pygafro
@@ -19,8 +19,10 @@ namespace pygafro
     {
       public:
         LeapHand()
+        : Hand<T, 4, 4, 4, 4>(SystemCache<T>::load(getAssetsPath() + "robots/leap_hand/leap_hand.yaml"),
+                              std::array<std::string, 4>{ "fingertip_center_joint", "fingertip_2_center_joint",
+                                                          "fingertip_3_center_joint", "thumb_center_joint" })
         {
-            this->hand = new gafro::LeapHand<T>(getAssetsPath());
         }
     };
 }
@@ -13,6 +13,7 @@
 #include "RevoluteJoint.hpp"
 #include "FixedJoint.hpp"
 #include "Link.hpp"
+#include "ForwardKinematicsCache.hpp"
 #include <gafro_robot_descriptions/serialization/Visual.hpp>
 
 namespace pygafro
@@ -21,6 +22,9 @@ namespace pygafro
     template <class T>
     class Joint;
 
+    template <class T>
+    class WrapperCache;
+
 
     // Allows to access and manipulate links from Python while avoiding any memory
     // ownership problem (Links are managed in System using std::unique_ptr)
@@ -56,16 +60,19 @@ namespace pygafro
         inline void setParentJoint(const Joint<T> *parent_joint)
         {
             link->setParentJoint(parent_joint->getPtr());
+            invalidateForwardKinematicsCaches();
         }
 
         inline void addChildJoint(const Joint<T> *child_joint)
         {
             link->addChildJoint(child_joint->getPtr());
+            invalidateForwardKinematicsCaches();
         }
 
         inline void setAxis(const typename gafro::Motor<T>::Generator &axis)
         {
             link->setAxis(axis);
+            invalidateForwardKinematicsCaches();
         }
 
         inline const T &getMass() const
@@ -88,48 +95,20 @@ namespace pygafro
             return link->getName();
         }
 
-        inline Joint<T> *getParentJoint() const
+        inline std::shared_ptr<Joint<T>> getParentJoint() const
         {
-            const gafro::Joint<T>* joint = link->getParentJoint();
-            if (!joint)
-                return nullptr;
-
-            switch (joint->getType())
-            {
-                case gafro::Joint<T>::Type::FIXED:
-                    return new pygafro::FixedJoint<T>(system, joint->getName());
-
-                case gafro::Joint<T>::Type::PRISMATIC:
-                    return new pygafro::PrismaticJoint<T>(system, joint->getName());
-
-                case gafro::Joint<T>::Type::REVOLUTE:
-                    return new pygafro::RevoluteJoint<T>(system, joint->getName());
-            }
-
-            return nullptr;
+            return WrapperCache<T>::getJoint(system, link->getParentJoint());
         }
 
-        inline const std::vector<Joint<T> *> getChildJoints() const
+        inline std::vector<std::shared_ptr<Joint<T>>> getChildJoints() const
         {
             const auto& joints = link->getChildJoints();
 
-            std::vector<Joint<T> *> result;
+            std::vector<std::shared_ptr<Joint<T>>> result;
             result.reserve(joints.size());
 
             for (auto iter = joints.cbegin(), iterEnd = joints.cend(); iter != iterEnd; ++iter)
-            {
-                switch ((*iter)->getType())
-                {
-                    case gafro::Joint<T>::Type::FIXED:
-                        result.emplace_back(new pygafro::FixedJoint<T>(system, (*iter)->getName()));
-
-                    case gafro::Joint<T>::Type::PRISMATIC:
-                        result.emplace_back(new pygafro::PrismaticJoint<T>(system, (*iter)->getName()));
-
-                    case gafro::Joint<T>::Type::REVOLUTE:
-                        result.emplace_back(new pygafro::RevoluteJoint<T>(system, (*iter)->getName()));
-                }
-            }
+                result.emplace_back(WrapperCache<T>::getJoint(system, *iter));
 
             return result;
         }
@@ -144,6 +123,11 @@ namespace pygafro
             return link;
         }
 
+        inline gafro::System<T>* getSystem() const
+        {
+            return system;
+        }
+
         inline bool hasVisual() const
         {
             return link->hasVisual();
@@ -8,11 +8,13 @@
 
 #pragma once
 
+#include <pybind11/numpy.h>
 #include <gafro/robot/Manipulator.hpp>
-#include <gafro_robot_descriptions/serialization/FilePath.hpp>
-#include <gafro_robot_descriptions/serialization/SystemSerialization.hpp>
 #include "utils.hpp"
+#include "SystemCache.hpp"
 #include "KinematicChain.hpp"
+#include "Dynamics.hpp"
+#include "parallel.hpp"
 
 
 namespace pygafro
@@ -22,15 +24,19 @@ namespace pygafro
     template <class T, int dof>
     class Manipulator
     {
+        public:
+            // C-contiguous (N, dof) array of joint configurations
+            typedef pybind11::array_t<T, pybind11::array::c_style | pybind11::array::forcecast> Configurations;
+
         protected:
             Manipulator()
-            : manipulator(nullptr)
+            : manipulator(nullptr), cache(std::make_shared<ForwardKinematicsCache<T>>())
             {
             }
 
         public:
             Manipulator(const gafro::System<T>& system, const std::string &ee_joint_name = "endeffector")
-            : manipulator(nullptr)
+            : manipulator(nullptr), cache(std::make_shared<ForwardKinematicsCache<T>>())
             {
                 // Can't create a Manipulator from a System without giving up ownership, which Python can't do, so
                 // we have to make a copy of everything...
@@ -40,16 +46,31 @@ namespace pygafro
                 manipulator = new gafro::Manipulator<T, dof>(std::move(system2), ee_joint_name);
             }
 
+            // Takes the content of the system instead of copying it
+            Manipulator(gafro::System<T>&& system, const std::string &ee_joint_name = "endeffector")
+            : manipulator(new gafro::Manipulator<T, dof>(std::move(system), ee_joint_name)),
+              cache(std::make_shared<ForwardKinematicsCache<T>>())
+            {
+            }
+
+            // Moves the content of a system owned by Python into a new manipulator (see
+            // moveSystem()), leaving the Python object empty
+            static Manipulator* moveFromSystem(const pybind11::handle &system, const std::string &ee_joint_name)
+            {
+                return new Manipulator(moveSystem<T>(system, { ee_joint_name }, { dof }), ee_joint_name);
+            }
+
+            // The YAML file is only parsed once (see SystemCache)
             Manipulator(const std::string &yaml_file_path, const std::string &ee_joint_name = "endeffector")
-            : manipulator(nullptr)
+            : Manipulator(SystemCache<T>::load(yaml_file_path), ee_joint_name)
             {
-                manipulator = new gafro::Manipulator<T, dof>(
-                    std::move(gafro::SystemSerialization(gafro::FilePath(yaml_file_path)).load().cast<T>()), ee_joint_name
-                );
             }
 
             virtual ~Manipulator()
             {
+                if (manipulator)
+                    WrapperCache<T>::forgetSystem(&manipulator->getSystem());
+
                 delete manipulator;
             }
 
@@ -63,22 +84,14 @@ namespace pygafro
                 return &manipulator->getSystem();
             }
 
-            inline const Link<T> *getLink(const std::string &name) const
+            inline std::shared_ptr<Link<T>> getLink(const std::string &name) const
             {
-                gafro::Link<T>* link = manipulator->getLink(name);
-                if (!link)
-                    return nullptr;
-
-                return new Link<T>(&manipulator->getSystem(), link);
+                return WrapperCache<T>::getLink(&manipulator->getSystem(), manipulator->getLink(name));
             }
 
-            inline const Joint<T> *getJoint(const std::string &name) const
+            inline std::shared_ptr<Joint<T>> getJoint(const std::string &name) const
             {
-                gafro::Joint<T>* joint = manipulator->getJoint(name);
-                if (!joint)
-                    return nullptr;
-
-                return new Joint<T>(&manipulator->getSystem(), joint);
+                return WrapperCache<T>::getJoint(&manipulator->getSystem(), manipulator->getJoint(name));
             }
 
             inline typename gafro::Manipulator<T, dof>::Vector getRandomConfiguration() const
@@ -98,16 +111,75 @@ namespace pygafro
 
             inline const KinematicChain<T>* getEEKinematicChain() const
             {
-                return new KinematicChain<T>(&manipulator->getSystem(), manipulator->getEEKinematicChain());
+                return new KinematicChain<T>(&manipulator->getSystem(), manipulator->getEEKinematicChain(), cache);
+            }
+
+            // Opt-in cache of the forward kinematics of the end-effector (see
+            // ForwardKinematicsCache), shared with the kinematic chain of the end-effector
+            inline std::shared_ptr<ForwardKinematicsCache<T>> getForwardKinematicsCache() const
+            {
+                return cache;
             }
 
             inline gafro::Motor<T> getEEMotor(const std::vector<T> &position) const
             {
+                if (cache->isEnabled())
+                    return cache->computeMotor(manipulator->getEEKinematicChain(), position.data(), dof);
+
                 return manipulator->getEEMotor(typename gafro::Manipulator<T, dof>::Vector(position.data()));
             }
 
+            pybind11::array_t<T> getEEMotorBatch(const Configurations &positions) const
+            {
+                const pybind11::ssize_t n = checkConfigurations(positions);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n, 8 });
+
+                const T* input = positions.data();
+                T* output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    for (pybind11::ssize_t i = 0; i < n; ++i)
+                    {
+                        Eigen::Map<Eigen::Matrix<T, 8, 1>>(output + 8 * i) = manipulator->getEEMotor(
+                            typename gafro::Manipulator<T, dof>::Vector(input + dof * i)
+                        ).vector();
+                    }
+                }
+
+                return result;
+            }
+
+            pybind11::array_t<T> getEETransformationMatrixBatch(const Configurations &positions) const
+            {
+                const pybind11::ssize_t n = checkConfigurations(positions);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n, 4, 4 });
+
+                const T* input = positions.data();
+                T* output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    for (pybind11::ssize_t i = 0; i < n; ++i)
+                    {
+                        Eigen::Map<Eigen::Matrix<T, 4, 4, Eigen::RowMajor>>(output + 16 * i) = manipulator->getEEMotor(
+                            typename gafro::Manipulator<T, dof>::Vector(input + dof * i)
+                        ).toTransformationMatrix();
+                    }
+                }
+
+                return result;
+            }
+
             std::vector<gafro::Motor<T>> getEEAnalyticJacobian(const std::vector<T> &position) const
             {
+                if (cache->isEnabled())
+                    return cache->computeAnalyticJacobian(manipulator->getEEKinematicChain(), position.data(), dof);
+
                 gafro::MultivectorMatrix<T, gafro::Motor, 1, dof> jacobian = manipulator->getEEAnalyticJacobian(
                     typename gafro::Manipulator<T, dof>::Vector(position.data())
                 );
@@ -132,6 +204,68 @@ namespace pygafro
                 return result;
             }
 
+            pybind11::array_t<T> getEEAnalyticJacobianArray(const typename gafro::Manipulator<T, dof>::Vector &position) const
+            {
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ dof, gafro::Motor<T>::size });
+                copyJacobian<gafro::Motor>(manipulator->getEEAnalyticJacobian(position), result.mutable_data());
+                return result;
+            }
+
+            pybind11::array_t<T> getEEAnalyticJacobianBatch(const Configurations &positions) const
+            {
+                const pybind11::ssize_t n = checkConfigurations(positions);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n, dof, gafro::Motor<T>::size });
+
+                const T* input = positions.data();
+                T* output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    for (pybind11::ssize_t i = 0; i < n; ++i)
+                    {
+                        copyJacobian<gafro::Motor>(
+                            manipulator->getEEAnalyticJacobian(typename gafro::Manipulator<T, dof>::Vector(input + dof * i)),
+                            output + dof * gafro::Motor<T>::size * i
+                        );
+                    }
+                }
+
+                return result;
+            }
+
+            pybind11::array_t<T> getEEGeometricJacobianArray(const typename gafro::Manipulator<T, dof>::Vector &position) const
+            {
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ dof, gafro::MotorGenerator<T>::size });
+                copyJacobian<gafro::MotorGenerator>(manipulator->getEEGeometricJacobian(position), result.mutable_data());
+                return result;
+            }
+
+            pybind11::array_t<T> getEEGeometricJacobianBatch(const Configurations &positions) const
+            {
+                const pybind11::ssize_t n = checkConfigurations(positions);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n, dof, gafro::MotorGenerator<T>::size });
+
+                const T* input = positions.data();
+                T* output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    for (pybind11::ssize_t i = 0; i < n; ++i)
+                    {
+                        copyJacobian<gafro::MotorGenerator>(
+                            manipulator->getEEGeometricJacobian(typename gafro::Manipulator<T, dof>::Vector(input + dof * i)),
+                            output + dof * gafro::MotorGenerator<T>::size * i
+                        );
+                    }
+                }
+
+                return result;
+            }
+
             std::vector<typename gafro::Motor<T>::Generator> getGeometricJacobian(
                 const std::vector<T> &position, const gafro::Motor<T> &reference
             ) const
@@ -205,6 +339,9 @@ namespace pygafro
                 );
             }
 
+            // The wrench applied on the end-effector is expressed in the world frame, its
+            // contribution is -J^T * ee_wrench (gafro ignores it, so it is computed here like
+            // in DynamicManipulator)
             inline typename gafro::Manipulator<T, dof>::Vector getJointTorques(
                 const typename gafro::Manipulator<T, dof>::Vector &position,
                 const typename gafro::Manipulator<T, dof>::Vector &velocity,
@@ -212,7 +349,17 @@ namespace pygafro
                 const T &gravity = 9.81,
                 const gafro::Wrench<T> ee_wrench = gafro::Wrench<T>::Zero()) const
             {
-                return manipulator->getJointTorques(position, velocity, acceleration, gravity, ee_wrench);
+                typename gafro::Manipulator<T, dof>::Vector torques = manipulator->getJointTorques(
+                    position, velocity, acceleration, gravity, gafro::Wrench<T>::Zero()
+                );
+
+                if (!ee_wrench.vector().isZero(0))
+                {
+                    torques -= ChainDynamics<T>(manipulator->getEEKinematicChain(), position)
+                                   .computeWrenchTorques(ee_wrench);
+                }
+
+                return torques;
             }
 
             inline typename gafro::Manipulator<T, dof>::Vector getJointAccelerations(
@@ -223,6 +370,73 @@ namespace pygafro
                 return manipulator->getJointAccelerations(position, velocity, torque);
             }
 
+            pybind11::array_t<T> getJointTorquesBatch(const Configurations &positions, const Configurations &velocities,
+                                                      const Configurations &accelerations, const T &gravity,
+                                                      unsigned int nb_threads) const
+            {
+                const pybind11::ssize_t n = checkConfigurations(positions, velocities, accelerations);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n, dof });
+
+                const T* q = positions.data();
+                const T* qd = velocities.data();
+                const T* qdd = accelerations.data();
+                T* output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    parallelFor(n, nb_threads, [&](size_t i) {
+                        Eigen::Map<typename gafro::Manipulator<T, dof>::Vector>(output + dof * i) = manipulator->getJointTorques(
+                            typename gafro::Manipulator<T, dof>::Vector(q + dof * i),
+                            typename gafro::Manipulator<T, dof>::Vector(qd + dof * i),
+                            typename gafro::Manipulator<T, dof>::Vector(qdd + dof * i),
+                            gravity, gafro::Wrench<T>::Zero()
+                        );
+                    });
+                }
+
+                return result;
+            }
+
+            // gafro's forward dynamics don't take the gravity into account, so they are computed
+            // here from the inverse dynamics and the mass matrix:
+            //
+            //     acceleration = M(q)^-1 * (torque - h(q, velocity))
+            pybind11::array_t<T> getJointAccelerationsBatch(const Configurations &positions, const Configurations &velocities,
+                                                            const Configurations &torques, const T &gravity,
+                                                            unsigned int nb_threads) const
+            {
+                typedef typename gafro::Manipulator<T, dof>::Vector Vector;
+
+                const pybind11::ssize_t n = checkConfigurations(positions, velocities, torques);
+
+                pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n, dof });
+
+                const T* q = positions.data();
+                const T* qd = velocities.data();
+                const T* tau = torques.data();
+                T* output = result.mutable_data();
+
+                {
+                    pybind11::gil_scoped_release release;
+
+                    parallelFor(n, nb_threads, [&](size_t i) {
+                        const Vector position(q + dof * i);
+
+                        const Vector bias = manipulator->getJointTorques(
+                            position, Vector(qd + dof * i), Vector::Zero(), gravity, gafro::Wrench<T>::Zero()
+                        );
+
+                        Eigen::Map<Vector>(output + dof * i) = manipulator->getMassMatrix(position).ldlt().solve(
+                            Vector(tau + dof * i) - bias
+                        );
+                    });
+                }
+
+                return result;
+            }
+
             Eigen::Matrix<T, dof, dof> getMassMatrix(const std::vector<T> &position) const
             {
                 return manipulator->getMassMatrix(
@@ -230,8 +444,40 @@ namespace pygafro
                 );
             }
 
+        protected:
+            static pybind11::ssize_t checkConfigurations(const Configurations &positions)
+            {
+                if ((positions.ndim() != 2) || (positions.shape(1) != dof))
+                    throw std::length_error("Invalid number of DOF");
+
+                return positions.shape(0);
+            }
+
+            static pybind11::ssize_t checkConfigurations(const Configurations &positions, const Configurations &velocities,
+                                                         const Configurations &values)
+            {
+                const pybind11::ssize_t n = checkConfigurations(positions);
+
+                if ((checkConfigurations(velocities) != n) || (checkConfigurations(values) != n))
+                    throw std::length_error("Invalid number of time steps");
+
+                return n;
+            }
+
+            // Writes the coefficients of a jacobian as the rows of a (dof, size) row-major buffer
+            template <template <class> class M>
+            static void copyJacobian(const gafro::MultivectorMatrix<T, M, 1, dof> &jacobian, T *output)
+            {
+                for (int i = 0; i < dof; ++i)
+                {
+                    Eigen::Map<Eigen::Matrix<T, M<T>::size, 1>>(output + M<T>::size * i) =
+                        jacobian.getCoefficient(0, i).vector();
+                }
+            }
+
         protected:
             gafro::Manipulator<T, dof>* manipulator;
+            std::shared_ptr<ForwardKinematicsCache<T>> cache;
     };
 
 }  // namespace pygafro
@@ -8,7 +8,6 @@
 
 #pragma once
 
-#include <gafro_robot_descriptions/Planar3DoF.hpp>
 #include "robots/Manipulator.hpp"
 #include "utils.h"
 
@@ -19,8 +18,8 @@ namespace pygafro
     {
       public:
         Planar3DoF()
+        : Manipulator<T, 3>(getAssetsPath() + "robots/planar/3dof.yaml", "joint_ee")
         {
-            this->manipulator = new gafro::Planar3DoF<T>(getAssetsPath());
         }
     };
 }
@@ -32,6 +32,7 @@ namespace pygafro
         inline void setAxis(const typename gafro::PrismaticJoint<T>::Axis &axis)
         {
             static_cast<gafro::PrismaticJoint<T>*>(Joint<T>::joint)->setAxis(axis);
+            invalidateForwardKinematicsCaches();
         }
 
         const typename gafro::PrismaticJoint<T>::Axis &getAxis() const
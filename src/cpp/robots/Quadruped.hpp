@@ -37,8 +37,27 @@ namespace pygafro
                 quadruped = new gafro::Quadruped<T, dof>(std::move(system2), foot_tip_names);
             }
 
+            // Takes the content of the system instead of copying it
+            Quadruped(gafro::System<T>&& system, const std::array<std::string, 4>& foot_tip_names)
+            : quadruped(new gafro::Quadruped<T, dof>(std::move(system), foot_tip_names))
+            {
+            }
+
+            // Moves the content of a system owned by Python into a new quadruped (see
+            // moveSystem()), leaving the Python object empty
+            static Quadruped* moveFromSystem(const pybind11::handle &system, const std::array<std::string, 4>& foot_tip_names)
+            {
+                return new Quadruped(
+                    moveSystem<T>(system, std::vector<std::string>(foot_tip_names.begin(), foot_tip_names.end()), { dof, dof, dof, dof }),
+                    foot_tip_names
+                );
+            }
+
             virtual ~Quadruped()
             {
+                if (quadruped)
+                    WrapperCache<T>::forgetSystem(&quadruped->getSystem());
+
                 delete quadruped;
             }
 
@@ -32,6 +32,7 @@ namespace pygafro
         inline void setAxis(const typename gafro::RevoluteJoint<T>::Axis &axis)
         {
             static_cast<gafro::RevoluteJoint<T>*>(Joint<T>::joint)->setAxis(axis);
+            invalidateForwardKinematicsCaches();
         }
 
         const typename gafro::RevoluteJoint<T>::Axis &getAxis() const
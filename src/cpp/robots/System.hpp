@@ -8,91 +8,98 @@
 
 #pragma once
 
+#include <tuple>
+#include <unordered_map>
+
+#include <pybind11/numpy.h>
 #include <gafro/robot/System.hpp>
+#include "parallel.hpp"
 #include "FixedJoint.hpp"
 #include "PrismaticJoint.hpp"
 #include "RevoluteJoint.hpp"
 #include "KinematicChain.hpp"
+#include "Dynamics.hpp"
 #include "Link.hpp"
+#include "WrapperCache.hpp"
 
 namespace pygafro
 {
 
     template <class T>
-    Joint<T>* createFixedJoint(gafro::System<T>* system, const std::string& name)
+    std::shared_ptr<Joint<T>> createFixedJoint(gafro::System<T>* system, const std::string& name)
     {
         std::unique_ptr<gafro::FixedJoint<T>> joint = std::make_unique<gafro::FixedJoint<T>>();
         joint->setName(name);
 
         system->addJoint(std::move(joint));
 
-        return new FixedJoint<T>(system, name);
+        return WrapperCache<T>::getJoint(system, system->getJoint(name));
     }
 
     template <class T>
-    Joint<T>* createPrismaticJoint(gafro::System<T>* system, const std::string& name)
+    std::shared_ptr<Joint<T>> createPrismaticJoint(gafro::System<T>* system, const std::string& name)
     {
         std::unique_ptr<gafro::PrismaticJoint<T>> joint = std::make_unique<gafro::PrismaticJoint<T>>();
         joint->setName(name);
 
         system->addJoint(std::move(joint));
 
-        return new PrismaticJoint<T>(system, name);
+        return WrapperCache<T>::getJoint(system, system->getJoint(name));
     }
 
     template <class T>
-    Joint<T>* createPrismaticJoint(gafro::System<T>* system, const std::string& name, const std::array<T, 6> &parameters, int axis)
+    std::shared_ptr<Joint<T>> createPrismaticJoint(gafro::System<T>* system, const std::string& name, const std::array<T, 6> &parameters, int axis)
     {
         std::unique_ptr<gafro::PrismaticJoint<T>> joint = std::make_unique<gafro::PrismaticJoint<T>>(parameters, axis);
         joint->setName(name);
 
         system->addJoint(std::move(joint));
 
-        return new PrismaticJoint<T>(system, name);
+        return WrapperCache<T>::getJoint(system, system->getJoint(name));
     }
 
     template <class T>
-    Joint<T>* createRevoluteJoint(gafro::System<T>* system, const std::string& name)
+    std::shared_ptr<Joint<T>> createRevoluteJoint(gafro::System<T>* system, const std::string& name)
     {
         std::unique_ptr<gafro::RevoluteJoint<T>> joint = std::make_unique<gafro::RevoluteJoint<T>>();
         joint->setName(name);
 
         system->addJoint(std::move(joint));
 
-        return new RevoluteJoint<T>(system, name);
+        return WrapperCache<T>::getJoint(system, system->getJoint(name));
     }
 
     template <class T>
-    Joint<T>* createRevoluteJoint(gafro::System<T>* system, const std::string& name, const std::array<T, 3> &parameters)
+    std::shared_ptr<Joint<T>> createRevoluteJoint(gafro::System<T>* system, const std::string& name, const std::array<T, 3> &parameters)
     {
         std::unique_ptr<gafro::RevoluteJoint<T>> joint = std::make_unique<gafro::RevoluteJoint<T>>(parameters);
         joint->setName(name);
 
         system->addJoint(std::move(joint));
 
-        return new RevoluteJoint<T>(system, name);
+        return WrapperCache<T>::getJoint(system, system->getJoint(name));
     }
 
     template <class T>
-    Joint<T>* createRevoluteJoint(gafro::System<T>* system, const std::string& name, const std::array<T, 6> &parameters, int axis)
+    std::shared_ptr<Joint<T>> createRevoluteJoint(gafro::System<T>* system, const std::string& name, const std::array<T, 6> &parameters, int axis)
     {
         std::unique_ptr<gafro::RevoluteJoint<T>> joint = std::make_unique<gafro::RevoluteJoint<T>>(parameters, axis);
         joint->setName(name);
 
         system->addJoint(std::move(joint));
 
-        return new RevoluteJoint<T>(system, name);
+        return WrapperCache<T>::getJoint(system, system->getJoint(name));
     }
 
     template <class T>
-    Link<T>* createLink(gafro::System<T>* system, const std::string& name)
+    std::shared_ptr<Link<T>> createLink(gafro::System<T>* system, const std::string& name)
     {
         std::unique_ptr<gafro::Link<T>> link = std::make_unique<gafro::Link<T>>();
         link->setName(name);
 
         system->addLink(std::move(link));
 
-        return new Link<T>(system, name);
+        return WrapperCache<T>::getLink(system, system->getLink(name));
     }
 
     template <class T>
@@ -106,75 +113,92 @@ namespace pygafro
     }
 
     template <class T>
-    Joint<double>* getJoint(gafro::System<T>* system, const std::string& name)
+    std::shared_ptr<Joint<T>> getJoint(gafro::System<T>* system, const std::string& name)
     {
-        gafro::Joint<T>* joint = system->getJoint(name);
-        if (!joint)
-            return nullptr;
-
-        return new Joint<T>(system, joint);
+        return WrapperCache<T>::getJoint(system, system->getJoint(name));
     }
 
     template <class T>
-    inline const std::vector<Joint<T> *> getJoints(gafro::System<T>* system)
+    std::vector<std::shared_ptr<Joint<T>>> getJoints(gafro::System<T>* system)
     {
         const auto& joints = system->getJoints();
 
-        std::vector<Joint<T> *> result;
+        std::vector<std::shared_ptr<Joint<T>>> result;
         result.reserve(joints.size());
 
         for (auto iter = joints.cbegin(), iterEnd = joints.cend(); iter != iterEnd; ++iter)
-        {
-            switch ((*iter)->getType())
-            {
-                case gafro::Joint<T>::Type::FIXED:
-                    result.emplace_back(new FixedJoint<T>(system, (*iter)->getName()));
-
-                case gafro::Joint<T>::Type::PRISMATIC:
-                    result.emplace_back(new PrismaticJoint<T>(system, (*iter)->getName()));
-
-                case gafro::Joint<T>::Type::REVOLUTE:
-                    result.emplace_back(new RevoluteJoint<T>(system, (*iter)->getName()));
-            }
-        }
+            result.emplace_back(WrapperCache<T>::getJoint(system, iter->get()));
 
         return result;
     }
 
     template <class T>
-    Link<double>* getLink(gafro::System<T>* system, const std::string& name)
+    std::shared_ptr<Link<T>> getLink(gafro::System<T>* system, const std::string& name)
     {
-        gafro::Link<T>* link = system->getLink(name);
-        if (!link)
-            return nullptr;
-
-        return new Link<T>(system, link);
+        return WrapperCache<T>::getLink(system, system->getLink(name));
     }
 
     template <class T>
-    Link<double>* getBaseLink(gafro::System<T>* system)
+    std::shared_ptr<Link<T>> getBaseLink(gafro::System<T>* system)
     {
         const auto& links = system->getLinks();
         if (links.empty())
             return nullptr;
 
-        return new Link<T>(system, links.front().get());
+        return WrapperCache<T>::getLink(system, links.front().get());
     }
 
     template <class T>
-    inline const std::vector<Link<T> *> getLinks(gafro::System<T>* system)
+    std::vector<std::shared_ptr<Link<T>>> getLinks(gafro::System<T>* system)
     {
         const auto& links = system->getLinks();
 
-        std::vector<Link<T> *> result;
+        std::vector<std::shared_ptr<Link<T>>> result;
         result.reserve(links.size());
 
         for (auto iter = links.cbegin(), iterEnd = links.cend(); iter != iterEnd; ++iter)
-            result.emplace_back(new Link<T>(system, iter->get()));
+            result.emplace_back(WrapperCache<T>::getLink(system, iter->get()));
 
         return result;
     }
 
+    // Returns the topology of the system in one call: for each joint (in the order of
+    // getJoints()), the indices of its parent and child links (in the order of getLinks()),
+    // -1 if it has none
+    template <class T>
+    std::tuple<pybind11::array_t<int>, pybind11::array_t<int>> getTopology(const gafro::System<T>* system)
+    {
+        const auto& links = system->getLinks();
+        const auto& joints = system->getJoints();
+
+        std::unordered_map<const gafro::Link<T>*, int> indices;
+        indices.reserve(links.size());
+
+        for (size_t i = 0; i < links.size(); ++i)
+            indices[links[i].get()] = i;
+
+        auto getIndex = [&indices](const gafro::Link<T>* link) {
+            auto iter = indices.find(link);
+            return (iter != indices.end() ? iter->second : -1);
+        };
+
+        const pybind11::ssize_t n = joints.size();
+
+        pybind11::array_t<int> parents(std::vector<pybind11::ssize_t>{ n });
+        pybind11::array_t<int> children(std::vector<pybind11::ssize_t>{ n });
+
+        int* parent = parents.mutable_data();
+        int* child = children.mutable_data();
+
+        for (pybind11::ssize_t i = 0; i < n; ++i)
+        {
+            parent[i] = getIndex(joints[i]->getParentLink());
+            child[i] = getIndex(joints[i]->getChildLink());
+        }
+
+        return std::make_tuple(parents, children);
+    }
+
     template <class T>
     KinematicChain<T>* getKinematicChain(gafro::System<T>* system, const std::string& name)
     {
@@ -213,22 +237,39 @@ namespace pygafro
         return KinematicChain<T>(system, system->getKinematicChain(name)).computeGeometricJacobianBody(position);
     }
 
+    // Returns the kinematic chain of the system with the given number of DOF (like the
+    // dynamics of gafro do)
+    template <class T>
+    const gafro::KinematicChain<T>* findKinematicChain(const gafro::System<T>* system, int dof)
+    {
+        const auto& chains = system->getKinematicChains();
+
+        for (auto iter = chains.cbegin(), iterEnd = chains.cend(); iter != iterEnd; ++iter)
+        {
+            if (iter->second->getDoF() == dof)
+                return iter->second.get();
+        }
+
+        throw std::runtime_error("No kinematic chain with that amount of DOF found");
+    }
+
     template <class T>
-    std::vector<T> computeInverseDynamics(gafro::System<T>* system, const std::vector<T> &position, const std::vector<T> &velocity,
-                                          const std::vector<T> &acceleration)
+    Eigen::Matrix<T, Eigen::Dynamic, 1> computeInverseDynamics(
+        gafro::System<T>* system,
+        const Eigen::Ref<const Eigen::Matrix<T, Eigen::Dynamic, 1>> &position,
+        const Eigen::Ref<const Eigen::Matrix<T, Eigen::Dynamic, 1>> &velocity,
+        const Eigen::Ref<const Eigen::Matrix<T, Eigen::Dynamic, 1>> &acceleration)
     {
         #define INVERSEDYNAMICS(DOF) \
             case DOF: \
-                memcpy( \
-                    result.data(), \
-                    system->computeInverseDynamics(Eigen::Vector<T, DOF>(position.data()), Eigen::Vector<T, DOF>(velocity.data()), Eigen::Vector<T, DOF>(acceleration.data())).data(), \
-                    position.size() * sizeof(T) \
-                ); \
-                break;
+                return system->computeInverseDynamics( \
+                    Eigen::Vector<T, DOF>(position.data()), Eigen::Vector<T, DOF>(velocity.data()), Eigen::Vector<T, DOF>(acceleration.data()) \
+                );
 
-        std::vector<T> result(position.size());
+        if ((velocity.size() != position.size()) || (acceleration.size() != position.size()))
+            throw std::length_error("Invalid number of DOF");
 
-        // Downsides: every possibility is compiled even if never used, up to a hard limit that can't be changed by the user
+        // Fast paths for the small systems: every possibility is compiled, up to a hard limit
         switch (position.size())
         {
             INVERSEDYNAMICS(1);
@@ -245,30 +286,30 @@ namespace pygafro
             INVERSEDYNAMICS(12);
 
             default:
-                throw std::runtime_error("can't compute so many dof!");
+                return ChainDynamics<T>(findKinematicChain(system, position.size()), position)
+                    .computeInverseDynamics(velocity, acceleration);
         }
 
-        return result;
-
         #undef INVERSEDYNAMICS
     }
 
     template <class T>
-    std::vector<T> computeForwardDynamics(gafro::System<T>* system, const std::vector<T> &position, const std::vector<T> &velocity,
-                                          const std::vector<T> &torque)
+    Eigen::Matrix<T, Eigen::Dynamic, 1> computeForwardDynamics(
+        gafro::System<T>* system,
+        const Eigen::Ref<const Eigen::Matrix<T, Eigen::Dynamic, 1>> &position,
+        const Eigen::Ref<const Eigen::Matrix<T, Eigen::Dynamic, 1>> &velocity,
+        const Eigen::Ref<const Eigen::Matrix<T, Eigen::Dynamic, 1>> &torque)
     {
         #define FORWARDDYNAMICS(DOF) \
             case DOF: \
-                memcpy( \
-                    result.data(), \
-                    system->computeForwardDynamics(Eigen::Vector<T, DOF>(position.data()), Eigen::Vector<T, DOF>(velocity.data()), Eigen::Vector<T, DOF>(torque.data())).data(), \
-                    position.size() * sizeof(T) \
-                ); \
-                break;
+                return system->computeForwardDynamics( \
+                    Eigen::Vector<T, DOF>(position.data()), Eigen::Vector<T, DOF>(velocity.data()), Eigen::Vector<T, DOF>(torque.data()) \
+                );
 
-        std::vector<T> result(position.size());
+        if ((velocity.size() != position.size()) || (torque.size() != position.size()))
+            throw std::length_error("Invalid number of DOF");
 
-        // Downsides: every possibility is compiled even if never used, up to a hard limit that can't be changed by the user
+        // Fast paths for the small systems: every possibility is compiled, up to a hard limit
         switch (position.size())
         {
             FORWARDDYNAMICS(1);
@@ -285,12 +326,97 @@ namespace pygafro
             FORWARDDYNAMICS(12);
 
             default:
-                throw std::runtime_error("can't compute so many dof!");
+                return ChainDynamics<T>(findKinematicChain(system, position.size()), position)
+                    .computeForwardDynamics(velocity, torque);
+        }
+
+        #undef FORWARDDYNAMICS
+    }
+
+    // C-contiguous (T, dof) array of joint values along a trajectory
+    template <class T>
+    using Trajectory = pybind11::array_t<T, pybind11::array::c_style | pybind11::array::forcecast>;
+
+    template <class T>
+    pybind11::ssize_t checkTrajectories(const Trajectory<T> &positions, const Trajectory<T> &velocities,
+                                        const Trajectory<T> &values)
+    {
+        if ((positions.ndim() != 2) || (velocities.ndim() != 2) || (values.ndim() != 2) ||
+            (velocities.shape(0) != positions.shape(0)) || (velocities.shape(1) != positions.shape(1)) ||
+            (values.shape(0) != positions.shape(0)) || (values.shape(1) != positions.shape(1)))
+        {
+            throw std::length_error("Invalid shapes, expected (T, dof) arrays");
+        }
+
+        return positions.shape(0);
+    }
+
+    // Computes the inverse (torques from accelerations) or forward (accelerations from torques)
+    // dynamics at each time step of a trajectory, the time steps being spread over several
+    // threads (0: as many as the hardware supports). Uses the runtime-sized dynamics of the
+    // kinematic chain with that number of DOF whatever its size, since the ones of gafro
+    // don't take the gravity into account.
+    template <class T>
+    pybind11::array_t<T> computeDynamicsBatch(gafro::System<T>* system, const Trajectory<T> &positions,
+                                              const Trajectory<T> &velocities, const Trajectory<T> &values,
+                                              const T &gravity, bool inverse, unsigned int nb_threads)
+    {
+        typedef Eigen::Map<const Eigen::Matrix<T, Eigen::Dynamic, 1>> Row;
+        typedef Eigen::Map<Eigen::Matrix<T, Eigen::Dynamic, 1>> OutputRow;
+
+        const pybind11::ssize_t n = checkTrajectories<T>(positions, velocities, values);
+        const pybind11::ssize_t dof = positions.shape(1);
+
+        // Look for the kinematic chain only once
+        const gafro::KinematicChain<T>* chain = findKinematicChain(system, dof);
+
+        pybind11::array_t<T> result(std::vector<pybind11::ssize_t>{ n, dof });
+
+        const T* q = positions.data();
+        const T* qd = velocities.data();
+        const T* x = values.data();
+        T* output = result.mutable_data();
+
+        {
+            pybind11::gil_scoped_release release;
+
+            parallelForRanges(n, nb_threads, [&](size_t begin, size_t end) {
+                // One workspace per thread, reused for all its time steps
+                ChainDynamics<T> dynamics(chain);
+
+                for (size_t i = begin; i < end; ++i)
+                {
+                    const Row velocity(qd + dof * i, dof);
+                    const Row value(x + dof * i, dof);
+                    OutputRow row(output + dof * i, dof);
+
+                    dynamics.setPosition(Row(q + dof * i, dof));
+
+                    if (inverse)
+                        dynamics.computeInverseDynamics(velocity, value, gravity, row);
+                    else
+                        dynamics.computeForwardDynamics(velocity, value, gravity, row);
+                }
+            });
         }
 
         return result;
+    }
 
-        #undef FORWARDDYNAMICS
+    template <class T>
+    pybind11::array_t<T> computeInverseDynamicsBatch(gafro::System<T>* system, const Trajectory<T> &positions,
+                                                     const Trajectory<T> &velocities, const Trajectory<T> &accelerations,
+                                                     const T &gravity, unsigned int nb_threads)
+    {
+        return computeDynamicsBatch(system, positions, velocities, accelerations, gravity, true, nb_threads);
+    }
+
+    template <class T>
+    pybind11::array_t<T> computeForwardDynamicsBatch(gafro::System<T>* system, const Trajectory<T> &positions,
+                                                     const Trajectory<T> &velocities, const Trajectory<T> &torques,
+                                                     const T &gravity, unsigned int nb_threads)
+    {
+        return computeDynamicsBatch(system, positions, velocities, torques, gravity, false, nb_threads);
     }
 
 }  // namespace pygafro
@@ -0,0 +1,141 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <atomic>
+#include <filesystem>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+
+#include <gafro/robot/System.hpp>
+#include <gafro_robot_descriptions/serialization/FilePath.hpp>
+#include <gafro_robot_descriptions/serialization/SystemSerialization.hpp>
+#include "utils.hpp"
+
+
+namespace pygafro
+{
+    // Process-wide cache of the systems loaded from YAML files, keyed by the path and the
+    // modification time of the file: each file is only parsed once (or again when modified),
+    // the robots then receive a copy of the parsed system.
+    //
+    // A 'hit' is a system copied from the cache, a 'miss' one that had to be parsed.
+    template <class T>
+    class SystemCache
+    {
+      public:
+        static gafro::System<T> load(const std::string& yaml_file_path)
+        {
+            std::error_code error;
+
+            const std::filesystem::path path = std::filesystem::absolute(yaml_file_path, error).lexically_normal();
+            const std::filesystem::file_time_type mtime = std::filesystem::last_write_time(path, error);
+
+            // Let gafro report the missing or unreadable files
+            if (error)
+                return parse(yaml_file_path);
+
+            std::shared_ptr<const gafro::System<T>> system;
+
+            {
+                std::lock_guard<std::mutex> lock(getMutex());
+
+                auto iter = getEntries().find(path.string());
+                if ((iter != getEntries().end()) && (iter->second.mtime == mtime))
+                    system = iter->second.system;
+            }
+
+            if (!system)
+            {
+                // Parsed without holding the lock, several threads might parse the same file
+                // at the same time (the last one wins)
+                system = std::make_shared<const gafro::System<T>>(parse(yaml_file_path));
+
+                std::lock_guard<std::mutex> lock(getMutex());
+                getEntries()[path.string()] = Entry{ mtime, system };
+                ++getNbMissesCounter();
+            }
+            else
+            {
+                ++getNbHitsCounter();
+            }
+
+            // Copied without holding the lock: the entry might be replaced or cleared in
+            // the meantime, but the system stays alive as long as we reference it
+            gafro::System<T> system2;
+            copySystem<T>(*system, system2);
+            return system2;
+        }
+
+        // Forgets all the parsed systems and resets the counters
+        static void clear()
+        {
+            std::lock_guard<std::mutex> lock(getMutex());
+
+            getEntries().clear();
+            getNbHitsCounter() = 0;
+            getNbMissesCounter() = 0;
+        }
+
+        static size_t getSize()
+        {
+            std::lock_guard<std::mutex> lock(getMutex());
+            return getEntries().size();
+        }
+
+        static size_t getNbHits()
+        {
+            return getNbHitsCounter();
+        }
+
+        static size_t getNbMisses()
+        {
+            return getNbMissesCounter();
+        }
+
+      private:
+        struct Entry
+        {
+            std::filesystem::file_time_type mtime;
+            std::shared_ptr<const gafro::System<T>> system;
+        };
+
+        static gafro::System<T> parse(const std::string& yaml_file_path)
+        {
+            return gafro::SystemSerialization(gafro::FilePath(yaml_file_path)).load().template cast<T>();
+        }
+
+        static std::mutex& getMutex()
+        {
+            static std::mutex mutex;
+            return mutex;
+        }
+
+        static std::unordered_map<std::string, Entry>& getEntries()
+        {
+            static std::unordered_map<std::string, Entry> entries;
+            return entries;
+        }
+
+        static std::atomic<size_t>& getNbHitsCounter()
+        {
+            static std::atomic<size_t> nb_hits(0);
+            return nb_hits;
+        }
+
+        static std::atomic<size_t>& getNbMissesCounter()
+        {
+            static std::atomic<size_t> nb_misses(0);
+            return nb_misses;
+        }
+    };
+
+}  // namespace pygafro
@@ -8,7 +8,6 @@
 
 #pragma once
 
-#include <gafro_robot_descriptions/UFactoryLite6.hpp>
 #include "robots/Manipulator.hpp"
 #include "utils.h"
 
@@ -19,8 +18,8 @@ namespace pygafro
     {
       public:
         UFactoryLite6()
+        : Manipulator<T, 6>(getAssetsPath() + "robots/ufactory/lite6/lite6.yaml", "lite6_joint_eef")
         {
-            this->manipulator = new gafro::UFactoryLite6<T>(getAssetsPath());
         }
     };
 }
@@ -8,7 +8,6 @@
 
 #pragma once
 
-#include <gafro_robot_descriptions/UR5.hpp>
 #include "robots/Manipulator.hpp"
 #include "utils.h"
 
@@ -19,8 +18,8 @@ namespace pygafro
     {
       public:
         UR5()
+        : Manipulator<T, 6>(getAssetsPath() + "robots/ur5/ur5.yaml", "wrist_3_link-tool0_fixed_joint")
         {
-            this->manipulator = new gafro::UR5<T>(getAssetsPath());
         }
     };
 }
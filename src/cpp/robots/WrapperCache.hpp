@@ -0,0 +1,201 @@
+/*
+ * SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+ *
+ * SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+ *
+ * SPDX-License-Identifier: MPL-2.0
+ */
+
+#pragma once
+
+#include <algorithm>
+#include <memory>
+#include <mutex>
+#include <unordered_map>
+
+#include <gafro/robot/System.hpp>
+#include "FixedJoint.hpp"
+#include "Link.hpp"
+#include "PrismaticJoint.hpp"
+#include "RevoluteJoint.hpp"
+
+namespace pygafro
+{
+
+    // Returns the wrapper of a joint or a link of a system, creating it only if none is
+    // alive: the wrappers are shared (so Python sees the same object as long as it holds
+    // a reference to it), and released when not referenced anymore. The joints and links
+    // themselves remain owned by their system.
+    //
+    // The wrappers are indexed by the address of the joint or link, which can be reused
+    // once their system is destroyed: forgetSystem() must be called beforehand (see
+    // SystemDeleter and the destructors of the robots), and the type of the joint is
+    // checked again anyway before reusing a wrapper.
+    template <class T>
+    class WrapperCache
+    {
+      public:
+        static std::shared_ptr<Joint<T>> getJoint(gafro::System<T>* system, const gafro::Joint<T>* joint)
+        {
+            if (!joint)
+                return nullptr;
+
+            std::lock_guard<std::mutex> lock(getMutex());
+
+            auto& wrappers = getJoints();
+
+            std::shared_ptr<Joint<T>> wrapper;
+
+            auto iter = wrappers.find(joint);
+            if ((iter != wrappers.end()) && (iter->second.type == joint->getType()))
+            {
+                wrapper = iter->second.wrapper.lock();
+                if (wrapper && (wrapper->getSystem() == system))
+                    return wrapper;
+            }
+
+            // The system owns the joint, only the wrapper sees it as const
+            gafro::Joint<T>* ptr = const_cast<gafro::Joint<T>*>(joint);
+
+            switch (joint->getType())
+            {
+                case gafro::Joint<T>::Type::FIXED:
+                    wrapper = std::make_shared<FixedJoint<T>>(system, static_cast<gafro::FixedJoint<T>*>(ptr));
+                    break;
+
+                case gafro::Joint<T>::Type::PRISMATIC:
+                    wrapper = std::make_shared<PrismaticJoint<T>>(system, static_cast<gafro::PrismaticJoint<T>*>(ptr));
+                    break;
+
+                case gafro::Joint<T>::Type::REVOLUTE:
+                    wrapper = std::make_shared<RevoluteJoint<T>>(system, static_cast<gafro::RevoluteJoint<T>*>(ptr));
+                    break;
+
+                default:
+                    wrapper = std::make_shared<Joint<T>>(system, ptr);
+                    break;
+            }
+
+            wrappers[joint] = JointEntry{ wrapper, joint->getType() };
+            prune(wrappers);
+
+            return wrapper;
+        }
+
+        static std::shared_ptr<Link<T>> getLink(gafro::System<T>* system, const gafro::Link<T>* link)
+        {
+            if (!link)
+                return nullptr;
+
+            std::lock_guard<std::mutex> lock(getMutex());
+
+            auto& wrappers = getLinks();
+
+            std::shared_ptr<Link<T>> wrapper = wrappers[link].wrapper.lock();
+            if (wrapper && (wrapper->getSystem() == system))
+                return wrapper;
+
+            wrapper = std::make_shared<Link<T>>(system, const_cast<gafro::Link<T>*>(link));
+
+            wrappers[link] = LinkEntry{ wrapper };
+            prune(wrappers);
+
+            return wrapper;
+        }
+
+        // Forgets the wrappers of the joints and links of a system, to call before it is
+        // destroyed or its content moved into another one. The wrappers still referenced
+        // by Python aren't released, but won't be returned anymore.
+        static void forgetSystem(const gafro::System<T>* system)
+        {
+            std::lock_guard<std::mutex> lock(getMutex());
+
+            forget(getJoints(), system);
+            forget(getLinks(), system);
+        }
+
+      private:
+        struct JointEntry
+        {
+            std::weak_ptr<Joint<T>> wrapper;
+
+            // Type of the joint when the wrapper was created
+            typename gafro::Joint<T>::Type type;
+        };
+
+        struct LinkEntry
+        {
+            std::weak_ptr<Link<T>> wrapper;
+        };
+
+        template <class Key, class Entry>
+        using Map = std::unordered_map<const Key*, Entry>;
+
+        static std::mutex& getMutex()
+        {
+            static std::mutex mutex;
+            return mutex;
+        }
+
+        static Map<gafro::Joint<T>, JointEntry>& getJoints()
+        {
+            static Map<gafro::Joint<T>, JointEntry> wrappers;
+            return wrappers;
+        }
+
+        static Map<gafro::Link<T>, LinkEntry>& getLinks()
+        {
+            static Map<gafro::Link<T>, LinkEntry> wrappers;
+            return wrappers;
+        }
+
+        // Forgets the released wrappers, each time the number of entries doubles
+        template <class Key, class Entry>
+        static void prune(Map<Key, Entry>& wrappers)
+        {
+            static size_t threshold = 256;
+
+            if (wrappers.size() < threshold)
+                return;
+
+            for (auto iter = wrappers.begin(); iter != wrappers.end();)
+            {
+                if (iter->second.wrapper.expired())
+                    iter = wrappers.erase(iter);
+                else
+                    ++iter;
+            }
+
+            threshold = std::max(size_t(256), 2 * wrappers.size());
+        }
+
+        // Forgets the released wrappers and the ones of the given system
+        template <class Key, class Entry>
+        static void forget(Map<Key, Entry>& wrappers, const gafro::System<T>* system)
+        {
+            for (auto iter = wrappers.begin(); iter != wrappers.end();)
+            {
+                const auto wrapper = iter->second.wrapper.lock();
+
+                if (!wrapper || (wrapper->getSystem() == system))
+                    iter = wrappers.erase(iter);
+                else
+                    ++iter;
+            }
+        }
+    };
+
+
+    // Deleter of the systems owned by Python (see their holder type in robots.cpp),
+    // forgetting the wrappers of their joints and links
+    template <class T, class S = gafro::System<T>>
+    struct SystemDeleter
+    {
+        void operator()(S* system) const
+        {
+            WrapperCache<T>::forgetSystem(system);
+            delete system;
+        }
+    };
+
+}  // namespace pygafro
@@ -16,8 +16,12 @@
 #include "PrismaticJoint.hpp"
 #include "FixedJoint.hpp"
 #include "Hand.hpp"
+#include "ForwardKinematicsCache.hpp"
 #include "KinematicChain.hpp"
+#include "SystemCache.hpp"
+#include "WrapperCache.hpp"
 #include "Manipulator.hpp"
+#include "DynamicManipulator.hpp"
 #include "Quadruped.hpp"
 #include "AnymalC.hpp"
 #include "FrankaEmikaRobot.hpp"
@@ -39,8 +43,11 @@ typedef pygafro::Joint<double> pyJoint;
 typedef pygafro::RevoluteJoint<double> pyRevoluteJoint;
 typedef pygafro::PrismaticJoint<double> pyPrismaticJoint;
 typedef pygafro::FixedJoint<double> pyFixedJoint;
+typedef pygafro::ForwardKinematicsCache<double> ForwardKinematicsCache;
 typedef pygafro::KinematicChain<double> pyKinematicChain;
 typedef gafro::System<double> System;
+typedef pygafro::SystemCache<double> SystemCache;
+typedef pygafro::DynamicManipulator<double> DynamicManipulator;
 typedef gafro::visual::Visual Visual;
 typedef gafro::visual::Sphere VisualSphere;
 typedef gafro::visual::Mesh VisualMesh;
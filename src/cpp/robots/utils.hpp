@@ -6,9 +6,16 @@
  * SPDX-License-Identifier: MPL-2.0
  */
 
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <pybind11/pybind11.h>
 #include <gafro/robot/System.hpp>
 #include <gafro/robot/Link.hpp>
 #include <gafro/robot/Joint.hpp>
+#include <gafro_robot_descriptions/serialization/Visual.hpp>
+#include "WrapperCache.hpp"
 
 #pragma once
 
@@ -61,6 +68,9 @@ namespace pygafro
             link->setName((*iter)->getName());
             link->setAxis((*iter)->getAxis());
 
+            if ((*iter)->hasVisual())
+                link->setVisual((*iter)->getVisual()->copy());
+
             const gafro::Joint<T>* parentJoint = (*iter)->getParentJoint();
             if (parentJoint)
                 link->setParentJoint(system2.getJoint(parentJoint->getName()));
@@ -79,4 +89,75 @@ namespace pygafro
             joint->setChildLink(system2.getLink((*iter)->getChildLink()->getName()));
         }
     }
+
+
+    // Number of actuated joints between the base of a system and one of its joints (-1 if
+    // the joint doesn't exist)
+    template<class T>
+    int countActuatedJoints(gafro::System<T>& system, const std::string& joint_name)
+    {
+        const gafro::Joint<T>* joint = system.getJoint(joint_name);
+        if (!joint)
+            return -1;
+
+        int count = 0;
+
+        while (joint)
+        {
+            if (joint->isActuated())
+                ++count;
+
+            const gafro::Link<T>* link = joint->getParentLink();
+            joint = (link ? link->getParentJoint() : nullptr);
+        }
+
+        return count;
+    }
+
+    // Indicates if a Python object owns its C++ instance, false for the references returned
+    // with return_value_policy::reference (like the systems of the robots).
+    //
+    // pybind11 doesn't expose this publicly, so this relies on the 'owned' flag of its
+    // instances, a private detail: check that it still exists when upgrading pybind11
+    // (see cmake/dependencies.cmake).
+    inline bool isOwnedByPython(const pybind11::handle& handle)
+    {
+        static_assert((PYBIND11_VERSION_MAJOR == 2) && (PYBIND11_VERSION_MINOR == 13),
+                      "pybind11::detail::instance::owned was only checked with pybind11 2.13");
+
+        return reinterpret_cast<const pybind11::detail::instance*>(handle.ptr())->owned;
+    }
+
+    // Moves the content of a system held by Python into a new one, leaving the Python object
+    // empty: much faster than copySystem(), but only possible for the systems owned by Python
+    // (not the ones returned by the getSystem() method of the robots).
+    //
+    // The kinematic chains leading to the given joints are checked beforehand (expected number
+    // of DOF, -1 to skip the check), so the system is left untouched if the robot can't be
+    // created.
+    template<class T>
+    gafro::System<T> moveSystem(const pybind11::handle& handle, const std::vector<std::string>& joint_names,
+                                const std::vector<int>& dofs)
+    {
+        gafro::System<T>& system = handle.cast<gafro::System<T>&>();
+
+        if (!isOwnedByPython(handle))
+            throw std::invalid_argument("The system isn't owned by Python and can't be moved");
+
+        for (size_t i = 0; i < joint_names.size(); ++i)
+        {
+            const int count = countActuatedJoints(system, joint_names[i]);
+
+            if (count < 0)
+                throw std::invalid_argument("Unknown joint: " + joint_names[i]);
+
+            if ((dofs[i] >= 0) && (count != dofs[i]))
+                throw std::length_error("Invalid number of DOF");
+        }
+
+        // The joints and links now belong to the new system
+        WrapperCache<T>::forgetSystem(&system);
+
+        return gafro::System<T>(std::move(system));
+    }
 }
@@ -0,0 +1,113 @@
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+import numpy as np
+
+from ._pygafro import InverseKinematicsOptions
+from ._pygafro import InverseKinematicsResult
+from ._pygafro import InverseKinematicsRun
+
+
+def _runInverseKinematics(cost, initial_position, limits_min, limits_max, options):
+    position = np.clip(initial_position, limits_min, limits_max)
+
+    error = cost.getError(position)
+    value = np.inner(error, error)
+    damping = options.damping
+
+    run = InverseKinematicsRun()
+    run.initialPosition = initial_position
+
+    while (value > options.tolerance) and (run.nbIterations < options.maxIterations):
+        run.nbIterations += 1
+
+        jacobian = cost.getJacobian(position)
+        gradient = jacobian.T @ error
+        hessian = jacobian.T @ jacobian
+
+        # Increase the damping until the step decreases the error
+        improved = False
+        step = 0.0
+
+        while not improved and (damping < 1e12):
+            damped_hessian = hessian + damping * np.eye(hessian.shape[0])
+
+            # A singular system (no damping and a rank-deficient Jacobian) counts as a
+            # failed step
+            try:
+                delta = np.linalg.solve(damped_hessian, gradient)
+            except np.linalg.LinAlgError:
+                damping = damping * 10.0 if damping > 0.0 else 1e-6
+                continue
+
+            candidate = np.clip(position - delta, limits_min, limits_max)
+
+            candidate_error = cost.getError(candidate)
+            candidate_value = np.inner(candidate_error, candidate_error)
+
+            if candidate_value < value:
+                step = np.linalg.norm(candidate - position)
+                position = candidate
+                error = candidate_error
+                value = candidate_value
+                damping *= 0.1
+                improved = True
+            else:
+                damping = damping * 10.0 if damping > 0.0 else 1e-6
+
+        if not improved or (step < options.stepTolerance):
+            break
+
+    run.position = position
+    run.value = value
+    run.converged = bool(value <= options.tolerance)
+
+    return run
+
+
+def _solveInverseKinematics(arm, cost, options):
+    limits_min = arm.getJointLimitsMin()
+    limits_max = arm.getJointLimitsMax()
+
+    runs = [
+        _runInverseKinematics(
+            cost, arm.getRandomConfiguration(), limits_min, limits_max, options
+        )
+        for _ in range(options.nbRestarts)
+    ]
+
+    result = InverseKinematicsResult()
+    result.runs = runs
+
+    for run in runs:
+        if run.value < result.value:
+            result.position = run.position
+            result.value = run.value
+            result.converged = run.converged
+
+    return result
+
+
+# Minimise the error of a cost function (like SingleManipulatorTarget or
+# SingleManipulatorMotorCost) using Levenberg-Marquardt steps, starting from several
+# random configurations of the manipulator. Returns the best solution found along with
+# the statistics of each run.
+#
+# Natively compiled cost functions run all the restarts in parallel threads, cost
+# functions implemented in Python run them sequentially.
+def solveInverseKinematics(arm, cost, options=None):
+    if options is None:
+        options = InverseKinematicsOptions()
+
+    if options.nbRestarts < 1:
+        raise ValueError("Invalid number of restarts: must be at least 1")
+
+    if hasattr(cost, "solve"):
+        return cost.solve(arm, options)
+
+    return _solveInverseKinematics(arm, cost, options)
@@ -8,26 +8,39 @@
 
 from ._pygafro import *  # noqa: we need to discover at runtime which Manipulator classes were compiled
 from .multivector import Multivector
+import numbers
 import os
 
 
+# Create a manipulator with the specified number of DOF. If no Manipulator class was
+# compiled for that number of DOF, a DynamicManipulator is returned instead.
 def createManipulator(system, dof, ee_joint_name):
     if isinstance(system, str):
         if not os.path.exists(system):
             raise ValueError(f"Invalid file name: {system}")
 
-    class_name = f"Manipulator_{dof}"
-
-    try:
-        manipulator_class = globals()[class_name]
-    except Exception:
+    if not isinstance(dof, numbers.Integral) or (dof <= 0):
         raise TypeError(f"Invalid number of DOF for Manipulator: {dof}")
 
+    dof = int(dof)
+
+    manipulator_class = globals().get(f"Manipulator_{dof}")
+    if manipulator_class is None:
+        manipulator_class = globals()["DynamicManipulator"]
+
     try:
-        return manipulator_class(system, ee_joint_name)
+        manipulator = manipulator_class(system, ee_joint_name)
     except Exception as e:
         raise RuntimeError(f"Failed to create the manipulator: {e}")
 
+    if manipulator.dof != dof:
+        raise RuntimeError(
+            f"Invalid number of DOF for Manipulator: {dof} (the kinematic chain has "
+            f"{manipulator.dof})"
+        )
+
+    return manipulator
+
 
 def _getEEPrimitiveJacobian(manipulator, position, primitive):
     ee_motor = manipulator.getEEMotor(position)
@@ -47,13 +60,16 @@ def _getEEPrimitiveJacobian(manipulator, position, primitive):
         )
 
         if isinstance(mv, Multivector):
-            mv.blades = blades
-            mv.mask = [b in blades for b in mv._mv.blades()]
+            mv = Multivector(blades, mv=mv)
 
         jacobian.append(mv)
 
     return jacobian
 
 
-for name in [x for x in globals().keys() if x.startswith("Manipulator_")]:
+for name in [
+    x
+    for x in globals().keys()
+    if x.startswith("Manipulator_") or (x == "DynamicManipulator")
+]:
     globals()[name].getEEPrimitiveJacobian = _getEEPrimitiveJacobian
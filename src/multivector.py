@@ -9,13 +9,10 @@
 import numpy as np
 
 from ._pygafro import *  # noqa: we need to discover at runtime which Multivector classes were compiled
+from ._pygafro import DynamicMultivector
 from ._pygafro import internals
-from .geometricproductcayleytable import table as geometricproductcayleytable
-from .innerproductcayleytable import table as innerproductcayleytable
-from .mv_combinations import combinations as mv_combinations
-from .outerproductcayleytable import table as outerproductcayleytable
-from .utils import _fillParameters
-from .utils import _getProductBlades
+from .utils import _getCayleyTable
+from .utils import _getProductMask
 
 all_blades = [
     "scalar",
@@ -52,6 +49,57 @@ all_blades = [
     "e0123i",
 ]
 
+# Index of each blade, by name
+_blade_indices = {name: idx for idx, name in enumerate(all_blades)}
+
+
+# Sets of blades are represented by 32-bit masks: bit 'i' is set if the blade 'i' is in
+# the set
+def _getBladesMask(blades):
+    mask = 0
+    for blade in blades:
+        mask |= 1 << blade
+    return mask
+
+
+# Cache of the sorted lists of blades, indexed by mask
+_blades_lists = {}
+
+
+def _getBladesList(mask):
+    blades = _blades_lists.get(mask)
+    if blades is None:
+        blades = [b for b in range(len(all_blades)) if mask & (1 << b)]
+        _blades_lists[mask] = blades
+    return blades
+
+
+# Getters and setters of the blades of a C++ multivector class, indexed by blade (None
+# if the class doesn't have the blade), along with the mask of its blades
+class _ClassAccessors:
+
+    def __init__(self, cls, blades):
+        self.mask = _getBladesMask(blades)
+        self.getters = [
+            getattr(cls, f"get_{name}") if idx in blades else None
+            for idx, name in enumerate(all_blades)
+        ]
+        self.setters = [
+            getattr(cls, f"set_{name}") if idx in blades else None
+            for idx, name in enumerate(all_blades)
+        ]
+
+
+_class_accessors = {}
+
+
+def _getClassAccessors(mv):
+    accessors = _class_accessors.get(type(mv))
+    if accessors is None:
+        accessors = _ClassAccessors(type(mv), mv.blades())
+        _class_accessors[type(mv)] = accessors
+    return accessors
+
 
 # gafro being based on C++ templates, only the classes and operations you are effectively
 # using are compiled into your software.
@@ -62,8 +110,9 @@ all_blades = [
 #
 # A compromise was choosen: a subset of multivectors (using sensible blades combinations)
 # are instantiated and compiled, and other blades combinations are supported through this
-# Python class that internally use a C++ multivector with more blades and transparently
-# use a mask to only expose the blades requested by the user.
+# Python class that internally use a C++ multivector whose blades are only known at
+# runtime (DynamicMultivector), with its products computed from the tables of the products
+# of basis blades.
 #
 # It is expected that multivectors are created through the Multivector.create()
 # method, which will either return a C++ multivector (if the required combination of blades
@@ -71,50 +120,39 @@ all_blades = [
 class Multivector:
 
     def __init__(self, blades, parameters=None, mv=None):
-        if (len(blades) > 0) and isinstance(blades[0], str):
-            blades = [all_blades.index(b) for b in blades]
-
-        self._blades = sorted(list(set(blades)))
-        self._mv = (
-            _createTemplatedMultivector(blades, parameters=parameters)
-            if mv is None
-            else mv
-        )
-        self._mask = [b in blades for b in self._mv.blades()]
+        blades = _toBladeIndices(blades)
+
+        self._mv = DynamicMultivector(_getBladesMask(blades))
+
+        if mv is not None:
+            for blade in blades:
+                self._mv[blade] = mv[blade]
+        elif parameters is not None:
+            self._mv.setParameters(_sortParameters(blades, parameters))
 
     def size(self):
-        return len(self._blades)
+        return self._mv.size()
 
     def blades(self):
-        return self._blades
+        return self._mv.blades()
 
     def has(self, blade):
-        return blade in self._blades
+        return self._mv.has(blade)
 
     def setParameters(self, parameters):
-        full_parameters = np.zeros((len(self._mask),))
-        full_parameters[self._mask] = parameters
-        self._mv.setParameters(full_parameters)
+        self._mv.setParameters(parameters)
 
     def vector(self):
-        return self._mv.vector()[self._mask]
+        return self._mv.vector()
 
     def reverse(self):
-        result = self._mv.reverse()
-        parameters = result.vector()[self._mask]
-        return Multivector(self._blades, parameters=parameters)
+        return Multivector._wrap(self._mv.reverse())
 
     def dual(self):
-        result = self._mv.dual()
-        blades = _getProductBlades(
-            self._blades, [all_blades.index("e0123i")], geometricproductcayleytable
-        )
-        return Multivector(blades, mv=result)
+        return Multivector._wrap(self._mv.dual())
 
     def inverse(self):
-        result = self._mv.inverse()
-        parameters = result.vector()[self._mask]
-        return Multivector(self._blades, parameters=parameters)
+        return Multivector._wrap(self._mv.inverse())
 
     def norm(self):
         return self._mv.norm()
@@ -129,30 +167,13 @@ class Multivector:
         self._mv.normalize()
 
     def normalized(self):
-        result = self._mv.normalized()
-        return Multivector(self._blades, mv=result)
+        return Multivector._wrap(self._mv.normalized())
 
     def __getitem__(self, blade):
-        if isinstance(blade, str):
-            blade_name = blade
-            blade = all_blades.index(blade)
-        else:
-            blade_name = all_blades[blade]
-
-        if blade in self._blades:
-            return getattr(self._mv, f"get_{blade_name}")()
-
-        return 0.0
+        return self._mv[blade]
 
     def __setitem__(self, blade, value):
-        if isinstance(blade, str):
-            blade_name = blade
-            blade = all_blades.index(blade)
-        else:
-            blade_name = all_blades[blade]
-
-        if blade in self._blades:
-            getattr(self._mv, f"set_{blade_name}")(value)
+        self._mv[blade] = value
 
     def __imul__(self, v):
         self._mv *= v
@@ -163,7 +184,8 @@ class Multivector:
         return self
 
     def __iadd__(self, v):
-        self._mv += v
+        # The blades of 'v' are added to the ones of this multivector
+        self._mv += _toDynamicMultivector(v)
         return self
 
     def __repr__(self):
@@ -172,7 +194,7 @@ class Multivector:
 
         vector = self.vector()
 
-        for b, v in zip(self._blades, vector):
+        for b, v in zip(self._mv.blades(), vector):
             if abs(v) < 1e-10:
                 continue
 
@@ -207,119 +229,116 @@ class Multivector:
 
         mv = _createTemplatedMultivector(blades, parameters=parameters)
 
-        if (len(blades) > 0) and isinstance(blades[0], str):
-            blades = [all_blades.index(b) for b in blades]
-            blades.sort()
-
-        if mv.blades() != blades:
-            return Multivector(blades, mv=mv)
+        if mv is None:
+            return Multivector(blades, parameters=parameters)
         elif mvclass is not None:
             return mvclass(mv)
 
         return mv
 
+    @staticmethod
+    def _wrap(mv):
+        # Faster than the constructor, for an already computed DynamicMultivector
+        result = Multivector.__new__(Multivector)
+        result._mv = mv
+        return result
+
     @staticmethod
     def clone(mv):
         if isinstance(mv, Multivector):
-            return Multivector(mv.blades(), mv=type(mv._mv)(mv._mv))
+            return Multivector._wrap(DynamicMultivector(mv._mv))
 
         return type(mv)(mv)
 
 
-def _createTemplatedMultivector(blades, parameters=None):
-    if not (isinstance(blades, list)):
-        raise TypeError("A list of blades must be provided")
+def _toBladeIndices(blades):
+    if (len(blades) > 0) and isinstance(blades[0], str):
+        return [_blade_indices[b] for b in blades]
 
-    if not all([isinstance(x, int) for x in blades]) and not all(
-        [isinstance(x, str) for x in blades]
-    ):
-        raise TypeError("All blades must be of the same type (int or str)")
+    return blades
 
-    global_blades = globals()["blades"]
 
-    if (len(blades) > 0) and isinstance(blades[0], int):
-        blades_dict = {
-            getattr(global_blades, x): x
-            for x in all_blades
-            if getattr(global_blades, x) in blades
-        }
-        blades = [blades_dict[x] for x in blades]
+# Returns the parameters sorted like the blades
+def _sortParameters(blades, parameters):
+    sorted_blades = sorted(list(set(blades)))
 
-    indexed_blades = [(getattr(global_blades, x), x) for x in blades]
+    if isinstance(parameters, float):
+        return [int(parameters)] * len(sorted_blades)
 
-    sorted_blades = [x[1] for x in sorted(list(set(indexed_blades)))]
+    elif isinstance(parameters, int):
+        return [parameters] * len(sorted_blades)
 
-    if parameters is not None:
-        if isinstance(parameters, float):
-            parameters = [int(parameters)] * len(sorted_blades)
+    try:
+        nb = len(parameters)
+    except TypeError:
+        raise TypeError(f"Invalid parameters type: {parameters}")
 
-        elif isinstance(parameters, int):
-            parameters = [parameters] * len(sorted_blades)
+    if nb != len(sorted_blades):
+        raise TypeError(
+            f"Invalid number of parameters: {nb} instead of {len(sorted_blades)}"
+        )
 
-        else:
-            try:
-                nb = len(parameters)
-            except TypeError:
-                raise TypeError(f"Invalid parameters type: {parameters}")
+    return [parameters[blades.index(x)] for x in sorted_blades]
 
-            if nb != len(sorted_blades):
-                raise TypeError(
-                    f"Invalid number of parameters: {nb} instead of {len(sorted_blades)}"
-                )
 
-            unsorted_blades = [x[1] for x in indexed_blades]
-            parameters = [parameters[unsorted_blades.index(x)] for x in sorted_blades]
+# Cache of the compiled classes, indexed by mask (None if the combination of blades
+# wasn't compiled)
+_compiled_classes = {}
 
-    class_name = "Multivector_" + "".join([x for x in sorted_blades])
 
+def _getCompiledClass(mask):
     try:
-        multivector_class = globals()[class_name]
-        if parameters is not None:
-            return multivector_class(parameters)
-        else:
-            return multivector_class()
+        return _compiled_classes[mask]
     except KeyError:
         pass
 
-    for mv_blades in mv_combinations:
-        if not all([b in mv_blades for b in sorted_blades]):
-            continue
+    class_name = "Multivector_" + "".join([all_blades[b] for b in _getBladesList(mask)])
+    multivector_class = globals().get(class_name)
 
-        class_name = "Multivector_" + "".join([x for x in mv_blades])
+    _compiled_classes[mask] = multivector_class
+    return multivector_class
 
-        multivector_class = globals()[class_name]
-        if parameters is not None:
-            full_parameters = []
-            for i in range(len(mv_blades)):
-                if mv_blades[i] in blades:
-                    full_parameters.append(
-                        parameters[sorted_blades.index(mv_blades[i])]
-                    )
-                else:
-                    full_parameters.append(0.0)
 
-            return multivector_class(full_parameters)
-        else:
-            return multivector_class()
+# Returns an instance of the compiled class having exactly the provided blades, or None
+def _createTemplatedMultivector(blades, parameters=None):
+    if not (isinstance(blades, list)):
+        raise TypeError("A list of blades must be provided")
 
+    if not all([isinstance(x, int) for x in blades]) and not all(
+        [isinstance(x, str) for x in blades]
+    ):
+        raise TypeError("All blades must be of the same type (int or str)")
 
-def _addMultivectors(a, b):
-    blades1 = a.blades()
-    blades2 = b.blades()
+    blades = _toBladeIndices(blades)
+
+    if parameters is not None:
+        parameters = _sortParameters(blades, parameters)
+
+    multivector_class = _getCompiledClass(_getBladesMask(blades))
+    if multivector_class is None:
+        return None
 
-    blades = blades1.copy()
-    blades.extend(blades2)
+    if parameters is not None:
+        return multivector_class(parameters)
+    else:
+        return multivector_class()
+
+
+def _addMultivectors(a, b):
+    mask1 = _getMask(a)
+    mask2 = _getMask(b)
 
-    blades = sorted(list(set(blades)))
+    blades = _getBladesList(mask1 | mask2)
 
-    vector1 = _fillParameters(a.vector(), blades1, blades)
-    vector2 = _fillParameters(b.vector(), blades2, blades)
+    parameters = np.zeros((len(all_blades),))
+    parameters[_getBladesList(mask1)] = a.vector()
+    parameters[_getBladesList(mask2)] += b.vector()
 
-    parameters = vector1 + vector2
+    parameters = parameters[blades]
 
     mvclass = None
     if (
-        (blades1 == blades2)
+        (mask1 == mask2)
         and not (isinstance(a, Multivector))
         and not (a.__class__.__name__.startswith("Multivector_"))
     ):
@@ -329,22 +348,20 @@ def _addMultivectors(a, b):
 
 
 def _subMultivectors(a, b):
-    blades1 = a.blades()
-    blades2 = b.blades()
+    mask1 = _getMask(a)
+    mask2 = _getMask(b)
 
-    blades = blades1.copy()
-    blades.extend(blades2)
+    blades = _getBladesList(mask1 | mask2)
 
-    blades = sorted(list(set(blades)))
+    parameters = np.zeros((len(all_blades),))
+    parameters[_getBladesList(mask1)] = a.vector()
+    parameters[_getBladesList(mask2)] -= b.vector()
 
-    vector1 = _fillParameters(a.vector(), blades1, blades)
-    vector2 = _fillParameters(b.vector(), blades2, blades)
-
-    parameters = vector1 - vector2
+    parameters = parameters[blades]
 
     mvclass = None
     if (
-        (blades1 == blades2)
+        (mask1 == mask2)
         and not (isinstance(a, Multivector))
         and not (a.__class__.__name__.startswith("Multivector_"))
     ):
@@ -353,86 +370,121 @@ def _subMultivectors(a, b):
     return Multivector.create(blades, parameters=parameters, mvclass=mvclass)
 
 
-def _getClassName(mv):
+def _getMask(mv):
     if isinstance(mv, Multivector):
-        return mv._mv.__class__.__name__
-    else:
-        return (
-            mv.__class__.__name__
-            if mv.__class__.__name__.startswith("Multivector_")
-            else mv.__class__.__bases__[0].__name__
-        )
+        return mv._mv.mask()
+    return _getClassAccessors(mv).mask
+
+
+def _toDynamicMultivector(mv):
+    if isinstance(mv, Multivector):
+        return mv._mv
+    return DynamicMultivector(_getClassAccessors(mv).mask, mv.vector())
+
+
+def _getClassName(mv):
+    return (
+        mv.__class__.__name__
+        if mv.__class__.__name__.startswith("Multivector_")
+        else mv.__class__.__bases__[0].__name__
+    )
 
 
-def _product(a, b, prefix, table):
-    class1 = _getClassName(a)
-    class2 = _getClassName(b)
+# Cache of the resolved products, indexed by (type(a), type(b), product name). For the
+# Python-based multivectors, the mask of the blades is part of the type.
+_products_cache = {}
 
-    blades1 = class1.replace("Multivector_", "")
-    blades2 = class2.replace("Multivector_", "")
 
-    function_name = f"{prefix}_{blades1}_{blades2}"
-    if hasattr(internals, function_name):
-        func = getattr(internals, function_name)
-        _, params = func(
-            a._mv if isinstance(a, Multivector) else a,
-            b._mv if isinstance(b, Multivector) else b,
+class _ResolvedProduct:
+
+    def __init__(self, function, mask, mvclass):
+        self.function = function  # the compiled product (None: use DynamicMultivector)
+        self.mask = mask  # the mask of the blades of the result
+        self.blades = np.array(_getBladesList(mask), dtype=int)  # the same, as indices
+        self.mvclass = (
+            mvclass  # the compiled class of the result (None if there is none)
         )
-    else:
-        blades = "".join(all_blades)
-        function_name = f"{prefix}_{blades}_{blades}"
 
-        mv1 = _fillParameters(a.vector(), a.blades(), list(range(len(all_blades))))
-        mv2 = _fillParameters(b.vector(), b.blades(), list(range(len(all_blades))))
 
-        func = getattr(internals, function_name)
-        _, params = func(
-            Multivector.create(all_blades, mv1), Multivector.create(all_blades, mv2)
+def _getProductKey(mv):
+    if isinstance(mv, Multivector):
+        return (Multivector, mv._mv.mask())
+
+    return type(mv)
+
+
+def _resolveProduct(a, b, prefix):
+    function = None
+
+    # Products between two compiled multivectors might have been compiled too
+    if not isinstance(a, Multivector) and not isinstance(b, Multivector):
+        blades1 = _getClassName(a).replace("Multivector_", "")
+        blades2 = _getClassName(b).replace("Multivector_", "")
+
+        function = getattr(internals, f"{prefix}_{blades1}_{blades2}", None)
+
+    result_mask = _getProductMask(
+        _getBladesList(_getMask(a)),
+        _getBladesList(_getMask(b)),
+        _getCayleyTable(prefix),
+    )
+
+    return _ResolvedProduct(function, result_mask, _getCompiledClass(result_mask))
+
+
+def _product(a, b, prefix):
+    key = (_getProductKey(a), _getProductKey(b), prefix)
+
+    product = _products_cache.get(key)
+    if product is None:
+        product = _resolveProduct(a, b, prefix)
+        _products_cache[key] = product
+
+    if product.function is not None:
+        _, params = product.function(a, b)
+
+        if product.mvclass is not None:
+            return product.mvclass(params[product.blades])
+
+        return Multivector._wrap(
+            DynamicMultivector(product.mask, params[product.blades])
         )
 
-    result_blades = _getProductBlades(a.blades(), b.blades(), table)
-    bits = [x in result_blades for x in range(len(params))]
+    result = getattr(_toDynamicMultivector(a), prefix)(_toDynamicMultivector(b))
 
-    blades = [idx for idx, v in enumerate(bits) if v]
-    parameters = [params[idx] for idx, v in enumerate(bits) if v]
+    if product.mvclass is not None:
+        return product.mvclass(result.vector())
 
-    return Multivector.create(blades, parameters)
+    return Multivector._wrap(result)
 
 
 def _geometricProduct(a, b):
-    return _product(a, b, "geometricProduct", geometricproductcayleytable)
+    return _product(a, b, "geometricProduct")
 
 
 def _innerProduct(a, b):
-    return _product(a, b, "innerProduct", innerproductcayleytable)
+    return _product(a, b, "innerProduct")
 
 
 def _outerProduct(a, b):
-    return _product(a, b, "outerProduct", outerproductcayleytable)
+    return _product(a, b, "outerProduct")
 
 
 def _getitem(mv, blade):
     if isinstance(blade, str):
-        blade_name = blade
-        blade = all_blades.index(blade)
-    else:
-        blade_name = all_blades[blade]
+        blade = _blade_indices[blade]
 
-    if blade in mv.blades():
-        return getattr(mv, f"get_{blade_name}")()
-
-    return 0.0
+    getter = _getClassAccessors(mv).getters[blade]
+    return getter(mv) if getter is not None else 0.0
 
 
 def _setitem(mv, blade, value):
     if isinstance(blade, str):
-        blade_name = blade
-        blade = all_blades.index(blade)
-    else:
-        blade_name = all_blades[blade]
+        blade = _blade_indices[blade]
 
-    if blade in mv.blades():
-        getattr(mv, f"set_{blade_name}")(value)
+    setter = _getClassAccessors(mv).setters[blade]
+    if setter is not None:
+        setter(mv, value)
 
 
 # Add additional methods to the C++-based multivector classes
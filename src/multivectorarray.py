@@ -0,0 +1,149 @@
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+import numpy as np
+
+from ._pygafro import Circle
+from ._pygafro import DirectionVector
+from ._pygafro import Line
+from ._pygafro import Motor
+from ._pygafro import MultivectorArray
+from ._pygafro import Plane
+from ._pygafro import Point
+from ._pygafro import PointPair
+from ._pygafro import Rotor
+from ._pygafro import Sphere
+from ._pygafro import Vector
+from .multivector import Multivector
+from .multivector import all_blades
+
+
+# Base class of the arrays of objects of a specific type (points, motors, ...). The
+# subclasses must define '_mvclass' (the type of the objects) and '_blades' (the blades
+# of that type).
+#
+# The array can be created either from a (N, nb_blades) NumPy array (without copy if it
+# is a C-contiguous array of doubles), a number of objects (all set to zero) or a list
+# of objects.
+class _TypedMultivectorArray(MultivectorArray):
+    _mvclass = None
+    _blades = None
+
+    def __init__(self, data):
+        if isinstance(data, int):
+            MultivectorArray.__init__(self, self._blades, data)
+        elif isinstance(data, (list, tuple)):
+            MultivectorArray.__init__(
+                self, self._blades, np.array([x.vector() for x in data], dtype=float)
+            )
+        else:
+            MultivectorArray.__init__(self, self._blades, data)
+
+    # Cast an untyped array (for instance the result of a product) into this type. The
+    # data isn't copied.
+    @classmethod
+    def cast(cls, mvarray):
+        if mvarray.blades() != [all_blades.index(b) for b in cls._blades]:
+            raise TypeError(f"Can't cast the array into a {cls.__name__}")
+
+        return cls(mvarray.vector())
+
+    def __getitem__(self, index):
+        return Multivector.create(
+            self.blades(),
+            parameters=self.vector()[index].copy(),
+            mvclass=self._mvclass,
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class PointArray(_TypedMultivectorArray):
+    _mvclass = Point
+    _blades = ["e0", "e1", "e2", "e3", "ei"]
+
+
+class VectorArray(_TypedMultivectorArray):
+    _mvclass = Vector
+    _blades = ["e1", "e2", "e3"]
+
+
+class DirectionVectorArray(_TypedMultivectorArray):
+    _mvclass = DirectionVector
+    _blades = ["e1i", "e2i", "e3i"]
+
+
+class LineArray(_TypedMultivectorArray):
+    _mvclass = Line
+    _blades = ["e01i", "e02i", "e12i", "e03i", "e13i", "e23i"]
+
+
+class PlaneArray(_TypedMultivectorArray):
+    _mvclass = Plane
+    _blades = ["e012i", "e013i", "e023i", "e123i"]
+
+
+class SphereArray(_TypedMultivectorArray):
+    _mvclass = Sphere
+    _blades = ["e0123", "e012i", "e013i", "e023i", "e123i"]
+
+
+class CircleArray(_TypedMultivectorArray):
+    _mvclass = Circle
+    _blades = [
+        "e012",
+        "e013",
+        "e023",
+        "e123",
+        "e01i",
+        "e02i",
+        "e12i",
+        "e03i",
+        "e13i",
+        "e23i",
+    ]
+
+
+class PointPairArray(_TypedMultivectorArray):
+    _mvclass = PointPair
+    _blades = [
+        "e01",
+        "e02",
+        "e12",
+        "e03",
+        "e13",
+        "e23",
+        "e0i",
+        "e1i",
+        "e2i",
+        "e3i",
+    ]
+
+
+# Arrays of versors: 'apply()' returns an array of the same type than the objects
+class _VersorArray(_TypedMultivectorArray):
+
+    def apply(self, objects):
+        result = MultivectorArray.apply(self, objects)
+
+        if isinstance(objects, _TypedMultivectorArray):
+            return type(objects)(result.vector())
+
+        return result
+
+
+class MotorArray(_VersorArray):
+    _mvclass = Motor
+    _blades = ["scalar", "e12", "e13", "e23", "e1i", "e2i", "e3i", "e123i"]
+
+
+class RotorArray(_VersorArray):
+    _mvclass = Rotor
+    _blades = ["scalar", "e12", "e13", "e23"]
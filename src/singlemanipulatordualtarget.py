@@ -8,80 +8,53 @@
 
 import numpy as np
 
-from .innerproductcayleytable import table as innerproductcayleytable
+from .costfunction import _CostFunction
+from .utils import _getCayleyTable
 from .utils import _getProductBlades
 from ._pygafro import internals
 
 
-class _SingleManipulatorDualTarget:
+class _SingleManipulatorDualTarget(_CostFunction):
 
     def __init__(self, arm, tool, target):
-        self.arm = arm
+        _CostFunction.__init__(self, arm)
         self.tool = tool
         self.target = target
 
-    def getValue(self, x):
-        error = self.getError(x)
-        return np.inner(error, error)
-
-    def getGradient(self, x):
-        jacobian = self.getJacobian(x)
-        return jacobian.T @ self.getError(x)
-
-    def getGradientAndHessian(self, x):
-        jacobian = self.getJacobian(x)
-
-        gradient = jacobian.T @ self.getError(x)
-        hessian = jacobian.T @ jacobian
-
-        return (gradient, hessian)
-
-    def getError(self, x):
-        try:
-            x = x.tolist()
-        except AttributeError:
-            pass
-
+    def _computeError(self, evaluation):
         return (
-            self.target.dual() | self.arm.getEEMotor(x).apply(self.tool).dual()
+            self.target.dual() | evaluation.motor().apply(self.tool).dual()
         ).vector()
 
-    def getJacobian(self, x):
-        try:
-            x = x.tolist()
-        except AttributeError:
-            pass
+    def _computeJacobian(self, evaluation):
+        motor = evaluation.motor()
+        motor_reverse = motor.reverse()
+        jacobian_ee = evaluation.jacobianEE()
 
-        motor = self.arm.getEEMotor(x)
-        jacobian_ee = self.arm.getEEAnalyticJacobian(x)
+        target_dual = self.target.dual()
+        tool_dual = self.tool.dual()
 
         blades = _getProductBlades(
-            self.target.blades(), self.tool.blades(), innerproductcayleytable
+            self.target.blades(), self.tool.blades(), _getCayleyTable("innerProduct")
         )
 
         jacobian = np.ndarray((len(blades), self.arm.dof))
 
-        mv = self.target.dual() | (
-            jacobian_ee[0] * self.tool.dual() * motor.reverse()
-            + motor * self.tool.dual() * jacobian_ee[0].reverse()
-        )
-
-        mask = [b in blades for b in mv.blades()]
+        motor_tool = motor * tool_dual
+        tool_reverse = tool_dual * motor_reverse
 
-        jacobian[:, 0] = 2.0 * mv.vector()[mask]
+        mask = None
 
-        for i in range(1, self.arm.dof):
-            jacobian[:, i] = (
-                2.0
-                * (
-                    self.target.dual()
-                    | (
-                        jacobian_ee[i] * self.tool.dual() * motor.reverse()
-                        + motor * self.tool.dual() * jacobian_ee[i].reverse()
-                    )
-                ).vector()[mask]
+        for i in range(0, self.arm.dof):
+            mv = target_dual | (
+                jacobian_ee[i] * tool_reverse + motor_tool * jacobian_ee[i].reverse()
             )
 
+            if mask is None:
+                mask = [b in blades for b in mv.blades()]
+
+            jacobian[:, i] = 2.0 * mv.vector()[mask]
+
         return jacobian
 
 
@@ -11,59 +11,38 @@ import numpy as np
 from ._pygafro import Motor
 from ._pygafro import MotorLogarithm
 from ._pygafro import internals
+from .costfunction import _CostFunction
 
 
-class _SingleManipulatorMotorCost:
+class _SingleManipulatorMotorCost(_CostFunction):
 
     def __init__(self, arm, target):
-        self.arm = arm
+        _CostFunction.__init__(self, arm)
         self.target = target
 
-    def getError(self, x):
-        try:
-            x = x.tolist()
-        except AttributeError:
-            pass
+    def _computeError(self, evaluation):
+        return self._getRelativeMotor(evaluation).log().evaluate().vector()
 
-        return (
-            Motor(self.target.reverse() * self.arm.getEEMotor(x))
-            .log()
-            .evaluate()
-            .vector()
-        )
+    def _computeJacobian(self, evaluation):
+        jacobian_log = MotorLogarithm.jacobian(self._getRelativeMotor(evaluation))
+        jacobian_ee = evaluation.jacobianEE()
 
-    def getGradientAndHessian(self, x):
-        try:
-            x = x.tolist()
-        except AttributeError:
-            pass
-
-        error = self.getError(x)
-
-        jacobian = self.getJacobian(x);
-        gradient = jacobian.T @ error
-        hessian = jacobian.T @ jacobian
-
-        return (gradient, hessian)
-
-    def getJacobian(self, x):
-        try:
-            x = x.tolist()
-        except AttributeError:
-            pass
-
-        jacobian_log = MotorLogarithm.jacobian(Motor(
-            self.target.reverse() * self.arm.getEEMotor(x)
-        ))
-        jacobian_ee = self.arm.getEEAnalyticJacobian(x)
+        target_reverse = self.target.reverse()
 
         embedded = np.ndarray((jacobian_log.shape[1], self.arm.dof))
 
         for i in range(0, self.arm.dof):
-            embedded[:, i] = (self.target.reverse() * jacobian_ee[i]).vector()
+            embedded[:, i] = (target_reverse * jacobian_ee[i]).vector()
 
         return jacobian_log @ embedded
 
+    # Motor from the target to the end-effector, shared by the error and the Jacobian
+    def _getRelativeMotor(self, evaluation):
+        if evaluation.relative_motor is None:
+            evaluation.relative_motor = Motor(
+                self.target.reverse() * evaluation.motor()
+            )
+        return evaluation.relative_motor
 
 
 def SingleManipulatorMotorCost(arm, target):
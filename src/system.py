@@ -0,0 +1,67 @@
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+from ._pygafro import *  # noqa: we need to discover at runtime which robot classes were compiled
+import numbers
+
+
+# The robots created from a System (like 'Manipulator_7(system, ...)') work on a copy of
+# it, since Python keeps the ownership of the system. The following methods move the
+# content of the system into the robot instead, which is much faster for big systems: the
+# system is left empty afterwards (and the joints, links and kinematic chains retrieved
+# from it before shouldn't be used anymore).
+#
+# Only possible for the systems created from Python (not the ones returned by the
+# 'getSystem()' method of the robots). The system is left untouched if the robot can't be
+# created.
+
+
+# Move the content of the system into a manipulator with the specified number of DOF. If
+# no Manipulator class was compiled for that number of DOF, a DynamicManipulator is
+# returned instead.
+def _intoManipulator(system, dof, ee_joint_name="endeffector"):
+    if not isinstance(dof, numbers.Integral) or (dof <= 0):
+        raise TypeError(f"Invalid number of DOF for Manipulator: {dof}")
+
+    dof = int(dof)
+
+    manipulator_class = globals().get(f"Manipulator_{dof}")
+
+    if manipulator_class is None:
+        return DynamicManipulator.moveFromSystem(system, ee_joint_name, dof)  # noqa
+
+    return manipulator_class.moveFromSystem(system, ee_joint_name)
+
+
+# Move the content of the system into a quadruped with the specified number of DOF per leg
+def _intoQuadruped(system, dof, foot_tip_names):
+    quadruped_class = globals().get(f"Quadruped_{dof}")
+
+    if quadruped_class is None:
+        raise TypeError(f"Invalid number of DOF for Quadruped: {dof}")
+
+    return quadruped_class.moveFromSystem(system, foot_tip_names)
+
+
+# Move the content of the system into a hand with the specified number of DOF per finger
+def _intoHand(system, dof, finger_tip_names):
+    suffix = "_".join([str(dof)] * len(finger_tip_names))
+    hand_class = globals().get(f"Hand_{suffix}")
+
+    if hand_class is None:
+        raise TypeError(
+            f"Invalid number of fingers or DOF for Hand: {len(finger_tip_names)} fingers, "
+            f"{dof} DOF"
+        )
+
+    return hand_class.moveFromSystem(system, finger_tip_names)
+
+
+System.intoManipulator = _intoManipulator  # noqa
+System.intoQuadruped = _intoQuadruped  # noqa
+System.intoHand = _intoHand  # noqa
@@ -6,8 +6,15 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 
+import os
+
 import numpy as np
 
+# Cayley tables, only loaded when first needed. Each one is a (32, 32) array of bitmasks:
+# bit 'i' of table[blade1, blade2] is set if the blade 'i' is in the product of 'blade1'
+# and 'blade2'.
+_cayley_tables = {}
+
 
 def _fillParameters(parameters, src_blades, dst_blades):
     result = np.zeros((len(dst_blades),))
@@ -30,10 +37,24 @@ def _selectParameters(parameters, src_blades, dst_blades):
 
 
 def _getProductBlades(blades1, blades2, table):
-    result_blades = []
+    mask = _getProductMask(blades1, blades2, table)
+    return [b for b in range(table.shape[0]) if mask & (1 << b)]
+
+
+# Bitmask of the blades of the product of two multivectors
+def _getProductMask(blades1, blades2, table):
+    return int(np.bitwise_or.reduce(table[np.ix_(blades1, blades2)], axis=None))
+
+
+# 'product' is either "geometricProduct", "innerProduct" or "outerProduct"
+def _getCayleyTable(product):
+    table = _cayley_tables.get(product)
 
-    for b1 in blades1:
-        for b2 in blades2:
-            result_blades.extend(table[(b1, b2)])
+    if table is None:
+        filename = os.path.join(
+            os.path.dirname(__file__), f"{product.lower()}cayleytable.npy"
+        )
+        table = np.load(filename)
+        _cayley_tables[product] = table
 
-    return sorted(list(set(result_blades)))
+    return table
@@ -0,0 +1,145 @@
+#! /usr/bin/env python3
+
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+import unittest
+
+import numpy as np
+
+from pygafro import DynamicMultivector
+from pygafro import Motor
+from pygafro import Multivector
+from pygafro import Point
+from pygafro import Sphere
+from pygafro import blades
+
+
+# Returns the parameters of a multivector as a vector of size 32, to compare results that
+# might not have the same blades
+def toFullParameters(mv):
+    parameters = np.zeros((32,))
+    parameters[mv.blades()] = mv.vector()
+    return parameters
+
+
+def toDynamicMultivector(mv):
+    return DynamicMultivector(DynamicMultivector.toMask(mv.blades()), mv.vector())
+
+
+class TestDynamicMultivector(unittest.TestCase):
+
+    def test_creation(self):
+        mv = DynamicMultivector(DynamicMultivector.toMask([blades.e1, blades.e123]))
+
+        self.assertEqual(mv.mask(), (1 << blades.e1) | (1 << blades.e123))
+        self.assertEqual(mv.size(), 2)
+        self.assertEqual(mv.blades(), [blades.e1, blades.e123])
+        self.assertTrue(mv.has(blades.e1))
+        self.assertTrue(mv.has(blades.e123))
+        self.assertFalse(mv.has(blades.e2))
+        self.assertTrue(np.array_equal(mv.vector(), [0.0, 0.0]))
+
+    def test_creationFromParameters(self):
+        mv = DynamicMultivector(
+            DynamicMultivector.toMask([blades.e1, blades.e123]), [1.0, 2.0]
+        )
+
+        self.assertAlmostEqual(mv["e1"], 1.0)
+        self.assertAlmostEqual(mv[blades.e123], 2.0)
+        self.assertAlmostEqual(mv["e2"], 0.0)
+
+    def test_creationFromIncorrectNumberOfParameters(self):
+        with self.assertRaises(ValueError):
+            DynamicMultivector(DynamicMultivector.toMask([blades.e1]), [1.0, 2.0])
+
+    def test_setBlade(self):
+        mv = DynamicMultivector(DynamicMultivector.toMask([blades.e1, blades.e123]))
+
+        mv["e1"] = 1.0
+        mv[blades.e2] = 2.0
+
+        self.assertAlmostEqual(mv["e1"], 1.0)
+        self.assertAlmostEqual(mv["e2"], 0.0)
+        self.assertEqual(mv.size(), 2)
+
+    def test_products(self):
+        point = Point(1.0, 2.0, 3.0)
+        sphere = Sphere(Point(0.5, 0.2, 0.1), 2.0)
+
+        mv1 = toDynamicMultivector(point)
+        mv2 = toDynamicMultivector(sphere)
+
+        for result, expected in [
+            (mv1 * mv2, point * sphere),
+            (mv1 | mv2, point | sphere),
+            (mv1 ^ mv2, point ^ sphere),
+        ]:
+            self.assertEqual(result.blades(), expected.blades())
+            self.assertTrue(np.allclose(result.vector(), expected.vector()))
+
+    def test_unaryOperations(self):
+        motor = Motor(np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]))
+
+        mv = toDynamicMultivector(motor)
+
+        self.assertTrue(
+            np.allclose(
+                toFullParameters(mv.reverse()), toFullParameters(motor.reverse())
+            )
+        )
+        self.assertTrue(
+            np.allclose(toFullParameters(mv.dual()), toFullParameters(motor.dual()))
+        )
+        self.assertTrue(
+            np.allclose(
+                toFullParameters(mv.inverse()), toFullParameters(motor.inverse())
+            )
+        )
+        self.assertAlmostEqual(mv.squaredNorm(), motor.squaredNorm())
+        self.assertAlmostEqual(mv.norm(), motor.norm())
+        self.assertAlmostEqual(mv.signedNorm(), motor.signedNorm())
+        self.assertAlmostEqual(mv.normalized().norm(), 1.0)
+
+    def test_addition(self):
+        mv1 = DynamicMultivector(DynamicMultivector.toMask([blades.e1]), [1.0])
+        mv2 = DynamicMultivector(
+            DynamicMultivector.toMask([blades.e1, blades.e2]), [2.0, 3.0]
+        )
+
+        result = mv1 + mv2
+        self.assertEqual(result.blades(), [blades.e1, blades.e2])
+        self.assertTrue(np.allclose(result.vector(), [3.0, 3.0]))
+
+        result = mv1 - mv2
+        self.assertEqual(result.blades(), [blades.e1, blades.e2])
+        self.assertTrue(np.allclose(result.vector(), [-1.0, -3.0]))
+
+    def test_multiplicationByScalar(self):
+        mv = DynamicMultivector(
+            DynamicMultivector.toMask([blades.e1, blades.e2]), [1.0, 2.0]
+        )
+
+        self.assertTrue(np.allclose((mv * 2.0).vector(), [2.0, 4.0]))
+        self.assertTrue(np.allclose((mv / 2.0).vector(), [0.5, 1.0]))
+
+    def test_multivectorWrapper(self):
+        mv = Multivector.create(["e1", "e2", "e3", "e123"], [1.0, 2.0, 3.0, 4.0])
+        point = Point(1.0, 2.0, 3.0)
+
+        self.assertTrue(isinstance(mv._mv, DynamicMultivector))
+
+        expected = toDynamicMultivector(mv) * toDynamicMultivector(point)
+        result = mv * point
+
+        self.assertEqual(result.blades(), expected.blades())
+        self.assertTrue(np.allclose(result.vector(), expected.vector()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -933,5 +933,50 @@ class TestMotorsCombination(unittest.TestCase):
         self.assertAlmostEqual(translator["e3i"], 0.0)
 
 
+class TestMotorApplyToPointArrays(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.motor = Motor(Motor.Random())
+        cls.points = np.random.uniform(-1.0, 1.0, (100, 3))
+
+    def test_applyToPoints(self):
+        result = self.motor.applyToPoints(self.points)
+
+        self.assertEqual(result.shape, (100, 3))
+
+        for i in range(100):
+            expected = self.motor.apply(Point(*self.points[i]))
+            self.assertTrue(np.allclose(result[i], expected.vector()[1:4]))
+
+    def test_applyToConformal(self):
+        conformal = np.array([Point(*x).vector() for x in self.points])
+
+        result = self.motor.applyToConformal(conformal)
+
+        self.assertEqual(result.shape, (100, 5))
+
+        for i in range(100):
+            expected = self.motor.apply(Point(*self.points[i]))
+            self.assertTrue(np.allclose(result[i], expected.vector()))
+
+    def test_applyToPointsWithThreads(self):
+        result = self.motor.applyToPoints(self.points)
+        result2 = self.motor.applyToPoints(self.points, nbThreads=4)
+
+        self.assertTrue(np.array_equal(result, result2))
+
+    def test_applyToEmptyArray(self):
+        result = self.motor.applyToPoints(np.zeros((0, 3)))
+        self.assertEqual(result.shape, (0, 3))
+
+    def test_applyToInvalidArray(self):
+        with self.assertRaises(ValueError):
+            self.motor.applyToPoints(np.zeros((10, 4)))
+
+        with self.assertRaises(ValueError):
+            self.motor.applyToConformal(np.zeros((10, 3)))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -16,6 +16,8 @@ from pygafro import E1
 from pygafro import Multivector
 from pygafro import Multivector_
 from pygafro import Multivector_e0
+from pygafro import Multivector_e1
+from pygafro import Multivector_e2
 from pygafro import Multivector_e0e1e2e3ei
 from pygafro import Multivector_e1ie2ie3i
 from pygafro import Multivector_e12e13e23
@@ -23,6 +25,9 @@ from pygafro import Multivector_e123i
 from pygafro import Multivector_e0123e012ie013ie023ie123i
 from pygafro import Multivector_scalar
 from pygafro import blades
+from pygafro import internals
+from pygafro.utils import _getCayleyTable
+from pygafro.utils import _getProductBlades
 
 
 class TestMultivector(unittest.TestCase):
@@ -253,6 +258,21 @@ class TestMultivector(unittest.TestCase):
         self.assertAlmostEqual(v["e23i"], -6.0)
         self.assertAlmostEqual(v["e0123i"], 30.0)
 
+    def test_repeatedMultiplicationOfCppMultivectors(self):
+        mv2 = Multivector_e123i([6.0])
+
+        for i in range(3):
+            mv = Multivector_e0e1e2e3ei([5.0, 1.0 + i, 2.0, 3.0, 4.0])
+
+            v = mv * mv2
+
+            self.assertEqual(v.size(), 5)
+            self.assertAlmostEqual(v["e123"], 30.0)
+            self.assertAlmostEqual(v["e12i"], 18.0)
+            self.assertAlmostEqual(v["e13i"], -12.0)
+            self.assertAlmostEqual(v["e23i"], 6.0 * (1.0 + i))
+            self.assertAlmostEqual(v["e0123i"], 30.0)
+
     def test_innerProductOfCppMultivectors(self):
         mv = Multivector_e0e1e2e3ei([5.0, 1.0, 2.0, 3.0, 4.0])
         mv2 = Multivector_e123i([6.0])
@@ -447,6 +467,49 @@ class TestMultivector(unittest.TestCase):
         self.assertAlmostEqual(vector[3], 4.0)
         self.assertAlmostEqual(vector[4], 5.0)
 
+    def test_getData(self):
+        mv = Multivector_e0e1e2e3ei([1.0, 2.0, 3.0, 4.0, 5.0])
+
+        data = mv.data
+
+        self.assertTrue(isinstance(data, np.ndarray))
+        self.assertEqual(data.shape, (5,))
+        self.assertTrue(np.allclose(data, [1.0, 2.0, 3.0, 4.0, 5.0]))
+
+        # The memory is shared with the multivector
+        data[1] = 10.0
+        self.assertAlmostEqual(mv["e1"], 10.0)
+
+        mv["e2"] = 20.0
+        self.assertAlmostEqual(data[2], 20.0)
+
+    def test_getDataOfDeletedMultivector(self):
+        data = Multivector_e0e1e2e3ei([1.0, 2.0, 3.0, 4.0, 5.0]).data
+
+        self.assertTrue(np.allclose(data, [1.0, 2.0, 3.0, 4.0, 5.0]))
+
+    def test_bufferProtocol(self):
+        mv = Multivector_e12e13e23([1.0, 2.0, 3.0])
+
+        view = memoryview(mv)
+        self.assertEqual(view.shape, (3,))
+
+        array = np.asarray(mv)
+        self.assertTrue(np.allclose(array, [1.0, 2.0, 3.0]))
+
+        array[0] = 4.0
+        self.assertAlmostEqual(mv["e12"], 4.0)
+
+    def test_setParametersOfPythonMultivector(self):
+        mv = Multivector.create(["e1", "e3"], [1.0, 2.0])
+
+        mv.setParameters([3.0, 4.0])
+
+        self.assertTrue(np.allclose(mv.vector(), [3.0, 4.0]))
+        self.assertAlmostEqual(mv["e1"], 3.0)
+        self.assertAlmostEqual(mv["e2"], 0.0)
+        self.assertAlmostEqual(mv["e3"], 4.0)
+
     def test_getReverse(self):
         mv = Multivector_e12e13e23([1.0, 2.0, 3.0])
 
@@ -572,6 +635,26 @@ class TestMultivectorWrapper(unittest.TestCase):
         self.assertTrue(mv.has(blades.e123))
         self.assertFalse(mv.has(blades.e0))
 
+    def test_bladesNotShared(self):
+        mv = Multivector.create(["e1", "e2", "e3", "e123"])
+        mv.blades().append(blades.e0)
+
+        self.assertEqual(mv.size(), 4)
+        self.assertFalse(mv.has(blades.e0))
+
+        mv2 = Multivector.create(["e1", "e2", "e3", "e123"])
+        self.assertEqual(len(mv2.blades()), 4)
+
+    def test_setUnknownBlade(self):
+        mv = Multivector.create(["e1", "e2", "e3", "e123"], [1.0, 2.0, 3.0, 4.0])
+
+        mv["e0"] = 5.0
+        mv[blades.e12] = 6.0
+
+        self.assertAlmostEqual(mv["e0"], 0.0)
+        self.assertAlmostEqual(mv[blades.e12], 0.0)
+        np.testing.assert_array_equal(mv.vector(), [1.0, 2.0, 3.0, 4.0])
+
     def test_creation(self):
         mv = Multivector.create(["e1", "e2", "e3", "e123"])
 
@@ -681,6 +764,28 @@ class TestMultivectorWrapper(unittest.TestCase):
         self.assertAlmostEqual(v["e13i"], 12.0)
         self.assertAlmostEqual(v["e23i"], -6.0)
 
+    def test_repeatedMultiplication(self):
+        mv2 = Multivector_e123i([6.0])
+
+        for i in range(3):
+            mv = Multivector.create(
+                ["e1", "e2", "e3", "e123"], [1.0 + i, 2.0, 3.0, 4.0]
+            )
+
+            v = mv * mv2
+
+            self.assertTrue(isinstance(v, Multivector))
+            self.assertEqual(v.blades(), [16, 22, 26, 28])
+            self.assertEqual(v.size(), 4)
+            self.assertAlmostEqual(v["ei"], -24.0)
+            self.assertAlmostEqual(v["e12i"], 18.0)
+            self.assertAlmostEqual(v["e13i"], -12.0)
+            self.assertAlmostEqual(v["e23i"], 6.0 * (1.0 + i))
+
+            # The result must not share its state with the previous ones
+            v["e23i"] = 0.0
+            self.assertAlmostEqual(v["e23i"], 0.0)
+
     def test_multiplicationWithEmptyMultivector(self):
         mv = Multivector.create(["e1", "e2", "e3", "e123"], [1.0, 2.0, 3.0, 4.0])
         mv2 = Multivector_()
@@ -943,5 +1048,54 @@ class TestMultivectorWrapper(unittest.TestCase):
         v = mv["e1"]  # noqa
 
 
+class TestProductFunctions(unittest.TestCase):
+
+    def test_existingProduct(self):
+        for name in [
+            "geometricProduct_e1e2e3_e0e1e2e3ei",
+            "innerProduct_e12e13e23_scalar",
+            "outerProduct_e0123i_e1",
+        ]:
+            self.assertTrue(hasattr(internals, name), name)
+            self.assertTrue(callable(getattr(internals, name)), name)
+
+    def test_unknownProduct(self):
+        for name in [
+            "geometricProduct_e1e2_e3",
+            "unknownProduct_e1_e2",
+            "geometricProduct",
+        ]:
+            self.assertFalse(hasattr(internals, name), name)
+
+    def test_productResult(self):
+        _, parameters = internals.geometricProduct_e1_e2(
+            Multivector_e1([2.0]), Multivector_e2([3.0])
+        )
+
+        self.assertAlmostEqual(parameters[blades.e12], 6.0)
+
+
+class TestCayleyTables(unittest.TestCase):
+
+    def test_productBlades(self):
+        geometric = _getCayleyTable("geometricProduct")
+        outer = _getCayleyTable("outerProduct")
+
+        self.assertEqual(geometric.shape, (32, 32))
+
+        self.assertEqual(
+            _getProductBlades([blades.e0], [blades.ei], geometric),
+            [blades.scalar, blades.e0i],
+        )
+
+        self.assertEqual(
+            _getProductBlades([blades.e1, blades.e2], [blades.e1], geometric),
+            [blades.scalar, blades.e12],
+        )
+
+        self.assertEqual(_getProductBlades([blades.e1], [blades.e1], outer), [])
+        self.assertEqual(_getProductBlades([], [blades.e1], outer), [])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,250 @@
+#! /usr/bin/env python3
+
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+import unittest
+
+import numpy as np
+
+from pygafro import Motor
+from pygafro import MotorArray
+from pygafro import Multivector
+from pygafro import MultivectorArray
+from pygafro import Point
+from pygafro import PointArray
+from pygafro import Rotor
+from pygafro import RotorArray
+from pygafro import Sphere
+from pygafro import SphereArray
+
+
+# Returns the parameters of a multivector (or of each multivector of an array) as a
+# vector of size 32, to compare results that might not have the same blades
+def toFullParameters(mv):
+    if isinstance(mv, MultivectorArray):
+        parameters = np.zeros((len(mv), 32))
+        parameters[:, mv.blades()] = mv.vector()
+    else:
+        parameters = np.zeros((32,))
+        parameters[mv.blades()] = mv.vector()
+
+    return parameters
+
+
+class TestMultivectorArray(unittest.TestCase):
+
+    def test_creation(self):
+        array = MultivectorArray(["e1", "e2", "e3"], 4)
+
+        self.assertEqual(len(array), 4)
+        self.assertEqual(array.size(), 4)
+        self.assertEqual(array.blades(), [2, 4, 8])
+        self.assertEqual(array.vector().shape, (4, 3))
+        self.assertTrue(np.all(array.vector() == 0.0))
+
+    def test_creationFromArray(self):
+        data = np.random.random((10, 3))
+        array = MultivectorArray([2, 4, 8], data)
+
+        self.assertEqual(len(array), 10)
+        self.assertTrue(np.shares_memory(array.vector(), data))
+        self.assertTrue(np.array_equal(np.asarray(array), data))
+
+    def test_creationFromIncorrectArray(self):
+        with self.assertRaises(ValueError):
+            MultivectorArray([2, 4, 8], np.zeros((10, 4)))
+
+    def test_creationFromUnsortedBlades(self):
+        with self.assertRaises(ValueError):
+            MultivectorArray([4, 2, 8], np.zeros((10, 3)))
+
+    def test_geometricProduct(self):
+        a = MultivectorArray(["e1", "e2", "e3"], np.random.random((10, 3)))
+        b = MultivectorArray(["scalar", "e12", "e13"], np.random.random((10, 3)))
+
+        result = a * b
+
+        self.assertEqual(len(result), 10)
+
+        expected = np.array(
+            [
+                toFullParameters(
+                    Multivector.create(a.blades(), x)
+                    * Multivector.create(b.blades(), y)
+                )
+                for x, y in zip(a.vector(), b.vector())
+            ]
+        )
+
+        self.assertTrue(np.allclose(toFullParameters(result), expected))
+
+    def test_innerProduct(self):
+        a = MultivectorArray(["e1", "e2", "e3"], np.random.random((10, 3)))
+        b = MultivectorArray(["e12", "e13", "e23"], np.random.random((10, 3)))
+
+        result = a | b
+
+        expected = np.array(
+            [
+                toFullParameters(
+                    Multivector.create(a.blades(), x)
+                    | Multivector.create(b.blades(), y)
+                )
+                for x, y in zip(a.vector(), b.vector())
+            ]
+        )
+
+        self.assertTrue(np.allclose(toFullParameters(result), expected))
+
+    def test_outerProduct(self):
+        a = MultivectorArray(["e1", "e2", "e3"], np.random.random((10, 3)))
+        b = MultivectorArray(["e1", "e2", "e3"], np.random.random((10, 3)))
+
+        result = a ^ b
+
+        expected = np.array(
+            [
+                toFullParameters(
+                    Multivector.create(a.blades(), x)
+                    ^ Multivector.create(b.blades(), y)
+                )
+                for x, y in zip(a.vector(), b.vector())
+            ]
+        )
+
+        self.assertTrue(np.allclose(toFullParameters(result), expected))
+
+    def test_productWithSingleMultivector(self):
+        a = MultivectorArray(["e1", "e2", "e3"], np.random.random((10, 3)))
+        b = MultivectorArray(["e1", "e2", "e3"], np.random.random((1, 3)))
+
+        result = a * b
+        self.assertEqual(len(result), 10)
+
+        result = b * a
+        self.assertEqual(len(result), 10)
+
+    def test_productWithIncompatibleSizes(self):
+        a = MultivectorArray(["e1", "e2", "e3"], 10)
+        b = MultivectorArray(["e1", "e2", "e3"], 5)
+
+        with self.assertRaises(ValueError):
+            a * b
+
+    def test_reverse(self):
+        a = MultivectorArray(["scalar", "e12", "e13", "e23"], np.random.random((10, 4)))
+
+        result = a.reverse()
+
+        expected = np.array(
+            [
+                toFullParameters(Multivector.create(a.blades(), x).reverse())
+                for x in a.vector()
+            ]
+        )
+
+        self.assertTrue(np.allclose(toFullParameters(result), expected))
+
+    def test_dual(self):
+        a = MultivectorArray(["e1", "e2", "e3"], np.random.random((10, 3)))
+
+        result = a.dual()
+
+        expected = np.array(
+            [
+                toFullParameters(Multivector.create(a.blades(), x).dual())
+                for x in a.vector()
+            ]
+        )
+
+        self.assertTrue(np.allclose(toFullParameters(result), expected))
+
+    def test_norms(self):
+        a = MultivectorArray(["e12", "e13", "e23"], np.random.random((10, 3)))
+
+        mvs = [Multivector.create(a.blades(), x) for x in a.vector()]
+
+        self.assertEqual(a.squaredNorm().shape, (10,))
+        self.assertTrue(np.allclose(a.squaredNorm(), [mv.squaredNorm() for mv in mvs]))
+        self.assertTrue(np.allclose(a.norm(), [mv.norm() for mv in mvs]))
+        self.assertTrue(np.allclose(a.signedNorm(), [mv.signedNorm() for mv in mvs]))
+
+
+class TestTypedMultivectorArrays(unittest.TestCase):
+
+    def test_pointArrayCreation(self):
+        points = PointArray(5)
+
+        self.assertEqual(len(points), 5)
+        self.assertEqual(points.blades(), Point().blades())
+        self.assertEqual(points.vector().shape, (5, 5))
+
+    def test_pointArrayFromList(self):
+        points = [Point(1.0, 2.0, 3.0), Point(4.0, 5.0, 6.0)]
+        array = PointArray(points)
+
+        self.assertEqual(len(array), 2)
+
+        for i, point in enumerate(array):
+            self.assertTrue(isinstance(point, Point))
+            self.assertTrue(np.allclose(point.vector(), points[i].vector()))
+
+    def test_pointNorms(self):
+        array = PointArray([Point(1.0, 2.0, 3.0), Point(4.0, 5.0, 6.0)])
+        self.assertTrue(np.allclose(array.norm(), [0.0, 0.0]))
+
+    def test_cast(self):
+        a = PointArray([Point(1.0, 2.0, 3.0)])
+        b = MultivectorArray(a.blades(), a.vector())
+
+        result = PointArray.cast(b)
+        self.assertTrue(isinstance(result, PointArray))
+
+        with self.assertRaises(TypeError):
+            SphereArray.cast(b)
+
+    def test_motorApply(self):
+        motors = [Motor.Random() for _ in range(10)]
+        points = [Point.Random() for _ in range(10)]
+
+        result = MotorArray(motors).apply(PointArray(points))
+
+        self.assertTrue(isinstance(result, PointArray))
+        self.assertEqual(len(result), 10)
+
+        for i in range(10):
+            expected = motors[i].apply(points[i])
+            self.assertTrue(np.allclose(result[i].vector(), expected.vector()))
+
+    def test_motorApplyToSpheres(self):
+        motor = Motor.Random()
+        spheres = [Sphere(Point.Random(), 0.5) for _ in range(10)]
+
+        result = MotorArray([motor]).apply(SphereArray(spheres))
+
+        self.assertTrue(isinstance(result, SphereArray))
+        self.assertEqual(len(result), 10)
+
+        for i in range(10):
+            expected = motor.apply(spheres[i])
+            self.assertTrue(np.allclose(result[i].vector(), expected.vector()))
+
+    def test_rotorApply(self):
+        rotors = [Rotor(Rotor.Random()) for _ in range(10)]
+        points = [Point.Random() for _ in range(10)]
+
+        result = RotorArray(rotors).apply(PointArray(points))
+
+        for i in range(10):
+            expected = rotors[i].apply(points[i])
+            self.assertTrue(np.allclose(result[i].vector(), expected.vector()))
+
+
+if __name__ == "__main__":
+    unittest.main()
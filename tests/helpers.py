@@ -8,6 +8,8 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 
+import math
+
 import numpy as np
 
 from pygafro import Inertia
@@ -209,3 +211,76 @@ def createSystemWith3JointsB():
     link4.setParentJoint(joint3)
 
     return system
+
+
+# Create a planar chain of revolute joints (around the same axis than in
+# createSystemWith3Joints()), each one translated by 1 along the Y axis from the
+# previous one. The joints are named "joint1", "joint2", ...
+def createSerialSystem(nb_joints):
+    system = System()
+
+    com = Translator(TranslatorGenerator([0.0, 0.0, 0.0]))
+    t = Translator(TranslatorGenerator([0.0, 1.0, 0.0]))
+
+    links = []
+    for i in range(nb_joints + 1):
+        link = system.createLink(f"link{i + 1}")
+        link.setMass(0.1)
+        link.setCenterOfMass(com)
+        link.setInertia(Inertia(0.1, np.eye(3)))
+        link.setAxis(MotorGenerator([1.0, 0.0, 0.0, 0.0, 0.0, 0.0]))
+        links.append(link)
+
+    for i in range(nb_joints):
+        joint = system.createRevoluteJoint(f"joint{i + 1}")
+        joint.setAxis(RotorGenerator([1.0, 0.0, 0.0]))
+        joint.setFrame(Motor(t))
+
+        limits = Joint.Limits()
+        limits.positionLower = -0.8
+        limits.positionUpper = 0.8
+        limits.velocity = 1.0
+        limits.torque = 1.0
+
+        joint.setLimits(limits)
+
+        joint.setParentLink(links[i])
+        links[i].addChildJoint(joint)
+
+        joint.setChildLink(links[i + 1])
+        links[i + 1].setParentJoint(joint)
+
+    return system
+
+
+# Checks the batched evaluation of a cost function of a 3-DOF manipulator (getValues(),
+# getErrors() and getGradients()) against the evaluation of each configuration, and
+# returns the batched errors
+def checkBatchEvaluation(test, cost_function):
+    positions = np.array([[0.0, 0.0, 0.0], [0.2, -0.5, 1.0], [0.0, math.pi / 2.0, 0.0]])
+
+    values = cost_function.getValues(positions, nbThreads=2)
+    errors = cost_function.getErrors(positions)
+    gradients = cost_function.getGradients(positions, nbThreads=0)
+
+    test.assertEqual(values.shape, (3,))
+    test.assertEqual(errors.shape[0], 3)
+    test.assertEqual(gradients.shape, (3, 3))
+
+    for i, x in enumerate(positions):
+        test.assertTrue(np.allclose(errors[i, :], cost_function.getError(x)))
+        test.assertAlmostEqual(values[i], np.inner(errors[i, :], errors[i, :]))
+        test.assertTrue(
+            np.allclose(gradients[i, :], cost_function.getGradientAndHessian(x)[0])
+        )
+
+    empty = np.zeros((0, 3))
+
+    test.assertEqual(cost_function.getValues(empty).shape, (0,))
+    test.assertEqual(cost_function.getErrors(empty).shape, (0, errors.shape[1]))
+    test.assertEqual(cost_function.getGradients(empty).shape, (0, 3))
+
+    with test.assertRaises(ValueError):
+        cost_function.getValues(np.zeros((2, 4)))
+
+    return errors
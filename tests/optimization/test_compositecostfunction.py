@@ -0,0 +1,202 @@
+#! /usr/bin/env python3
+
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+import math
+import unittest
+
+import helpers
+import numpy as np
+
+from pygafro import CompositeCostFunction
+from pygafro import InverseKinematicsOptions
+from pygafro import Point
+from pygafro import SingleManipulatorDualTarget
+from pygafro import SingleManipulatorMotorCost
+from pygafro import SingleManipulatorTarget
+from pygafro import Sphere
+from pygafro import solveInverseKinematics
+
+
+class TestCompositeCostFunction(unittest.TestCase):
+
+    def setUp(self):
+        self.manipulator = helpers.createManipulatorWith3JointsB()
+
+        target_position = [0.0, math.pi / 2.0, 0.0]
+        self.target_motor = self.manipulator.getEEMotor(target_position)
+        self.target_sphere = self.target_motor.apply(Sphere(Point(), 0.1))
+
+        self.positions = [[0.0, 0.0, 0.0], [0.2, -0.5, 1.0]]
+
+    def tearDown(self):
+        self.manipulator = None
+
+    def testTarget(self):
+        cost_function = CompositeCostFunction(self.manipulator)
+        cost_function.addTarget(Point(), self.target_sphere)
+
+        expected = SingleManipulatorTarget(
+            self.manipulator, Point(), self.target_sphere
+        )
+
+        for x in self.positions:
+            self.assertTrue(
+                np.allclose(cost_function.getError(x), expected.getError(x))
+            )
+            self.assertTrue(
+                np.allclose(
+                    cost_function.getJacobian(x),
+                    np.reshape(expected.getJacobian(x), (-1, 3)),
+                )
+            )
+
+    def testDualTarget(self):
+        cost_function = CompositeCostFunction(self.manipulator)
+        cost_function.addDualTarget(Point(), self.target_sphere)
+
+        expected = SingleManipulatorDualTarget(
+            self.manipulator, Point(), self.target_sphere
+        )
+
+        for x in self.positions:
+            self.assertTrue(
+                np.allclose(cost_function.getError(x), expected.getError(x))
+            )
+            self.assertTrue(
+                np.allclose(
+                    cost_function.getJacobian(x),
+                    np.reshape(expected.getJacobian(x), (-1, 3)),
+                )
+            )
+
+    def testMotorTarget(self):
+        cost_function = CompositeCostFunction(self.manipulator)
+        cost_function.addMotorTarget(self.target_motor)
+
+        expected = SingleManipulatorMotorCost(self.manipulator, self.target_motor)
+
+        for x in self.positions:
+            self.assertTrue(
+                np.allclose(cost_function.getError(x), expected.getError(x))
+            )
+            self.assertTrue(
+                np.allclose(cost_function.getJacobian(x), expected.getJacobian(x))
+            )
+
+    def testWeightedSum(self):
+        cost_function = CompositeCostFunction(self.manipulator)
+        cost_function.addTarget(Point(), self.target_sphere, weight=2.0)
+        cost_function.addMotorTarget(self.target_motor, weight=0.5)
+
+        self.assertEqual(cost_function.getNbTerms(), 2)
+
+        target = SingleManipulatorTarget(self.manipulator, Point(), self.target_sphere)
+        motor_cost = SingleManipulatorMotorCost(self.manipulator, self.target_motor)
+
+        for x in self.positions:
+            motor_error = motor_cost.getError(x)
+
+            self.assertAlmostEqual(
+                cost_function.getValue(x),
+                2.0 * target.getValue(x) + 0.5 * np.inner(motor_error, motor_error),
+            )
+
+            self.assertEqual(
+                cost_function.getError(x).shape, (cost_function.getErrorSize(),)
+            )
+
+    def testEvaluate(self):
+        cost_function = CompositeCostFunction(self.manipulator)
+        cost_function.addTarget(Point(), self.target_sphere)
+        cost_function.addMotorTarget(self.target_motor, weight=0.1)
+        cost_function.addPosture([0.1, 0.2, 0.3], weight=0.01)
+
+        x = [0.2, -0.5, 1.0]
+
+        error, jacobian, gradient, hessian = cost_function.evaluate(x)
+
+        self.assertEqual(error.shape, (cost_function.getErrorSize(),))
+        self.assertEqual(jacobian.shape, (cost_function.getErrorSize(), 3))
+
+        self.assertTrue(np.allclose(error, cost_function.getError(x)))
+        self.assertTrue(np.allclose(jacobian, cost_function.getJacobian(x)))
+        self.assertTrue(np.allclose(gradient, jacobian.T @ error))
+        self.assertTrue(np.allclose(hessian, jacobian.T @ jacobian))
+
+        gradient2, hessian2 = cost_function.getGradientAndHessian(x)
+        self.assertTrue(np.allclose(gradient2, gradient))
+        self.assertTrue(np.allclose(hessian2, hessian))
+
+    def testPostureAndJointLimits(self):
+        cost_function = CompositeCostFunction(self.manipulator)
+        cost_function.addPosture([0.1, 0.2, 0.3], weight=4.0)
+        cost_function.addJointLimits()
+
+        limits_max = self.manipulator.getJointLimitsMax()
+
+        x = [0.0, 0.0, limits_max[2] + 0.5]
+
+        error = cost_function.getError(x)
+        jacobian = cost_function.getJacobian(x)
+
+        self.assertTrue(np.allclose(error[:3], 2.0 * (np.array(x) - [0.1, 0.2, 0.3])))
+        self.assertTrue(np.allclose(error[3:], [0.0, 0.0, 0.5]))
+
+        self.assertTrue(np.allclose(jacobian[:3, :], 2.0 * np.eye(3)))
+        self.assertTrue(np.allclose(jacobian[3:, :], np.diag([0.0, 0.0, 1.0])))
+
+    def testBatchEvaluation(self):
+        cost_function = CompositeCostFunction(self.manipulator)
+        cost_function.addTarget(Point(), self.target_sphere)
+        cost_function.addMotorTarget(self.target_motor, weight=0.1)
+
+        values = cost_function.getValues(np.array(self.positions))
+
+        for i, x in enumerate(self.positions):
+            self.assertAlmostEqual(values[i], cost_function.getValue(x))
+
+    def testInverseKinematics(self):
+        target_motor = self.manipulator.getEEMotor([0.2, 0.3, -0.4])
+
+        cost_function = CompositeCostFunction(self.manipulator)
+        cost_function.addMotorTarget(target_motor)
+        cost_function.addJointLimits(weight=10.0)
+
+        options = InverseKinematicsOptions()
+        options.nbRestarts = 4
+        options.maxIterations = 200
+
+        result = solveInverseKinematics(self.manipulator, cost_function, options)
+
+        self.assertTrue(result.converged)
+
+        np.testing.assert_allclose(
+            self.manipulator.getEEMotor(result.position.tolist()).vector(),
+            target_motor.vector(),
+            atol=1e-4,
+        )
+
+    def testInvalidParameters(self):
+        cost_function = CompositeCostFunction(self.manipulator)
+
+        with self.assertRaises(ValueError):
+            cost_function.addPosture([0.0, 0.0])
+
+        with self.assertRaises(ValueError):
+            cost_function.addTarget(Point(), self.target_sphere, weight=-1.0)
+
+        cost_function.addTarget(Point(), self.target_sphere)
+
+        with self.assertRaises(ValueError):
+            cost_function.getValue([0.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+#! /usr/bin/env python3
+
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+import unittest
+
+import helpers
+import numpy as np
+
+from pygafro import InverseKinematicsOptions
+from pygafro import Point
+from pygafro import SingleManipulatorMotorCost
+from pygafro import SingleManipulatorTarget
+from pygafro import solveInverseKinematics
+from pygafro.inversekinematics import _runInverseKinematics
+from pygafro.singlemanipulatormotorcost import _SingleManipulatorMotorCost
+
+
+class TestInverseKinematics(unittest.TestCase):
+
+    def setUp(self):
+        self.manipulator = helpers.createManipulatorWith3JointsB()
+        self.target_position = [0.2, 0.3, -0.4]
+
+        self.options = InverseKinematicsOptions()
+        self.options.nbRestarts = 4
+        self.options.maxIterations = 200
+
+    def tearDown(self):
+        self.manipulator = None
+
+    def checkResult(self, result, expected_ee_motor):
+        self.assertTrue(result.converged)
+        self.assertEqual(len(result.runs), 4)
+        self.assertEqual(result.position.shape, (3,))
+
+        self.assertTrue(np.all(result.position >= self.manipulator.getJointLimitsMin()))
+        self.assertTrue(np.all(result.position <= self.manipulator.getJointLimitsMax()))
+
+        self.assertEqual(result.value, min([run.value for run in result.runs]))
+
+        for run in result.runs:
+            self.assertEqual(run.initialPosition.shape, (3,))
+            self.assertEqual(run.position.shape, (3,))
+            self.assertTrue(run.nbIterations <= self.options.maxIterations)
+
+        ee_motor = self.manipulator.getEEMotor(result.position.tolist())
+        np.testing.assert_allclose(
+            ee_motor.vector(), expected_ee_motor.vector(), atol=1e-4
+        )
+
+    def testMotorCost(self):
+        ee_target_motor = self.manipulator.getEEMotor(self.target_position)
+        cost_function = SingleManipulatorMotorCost(self.manipulator, ee_target_motor)
+
+        result = solveInverseKinematics(self.manipulator, cost_function, self.options)
+
+        self.checkResult(result, ee_target_motor)
+
+    def testMotorCostWithPythonImplementation(self):
+        ee_target_motor = self.manipulator.getEEMotor(self.target_position)
+        cost_function = _SingleManipulatorMotorCost(self.manipulator, ee_target_motor)
+
+        result = solveInverseKinematics(self.manipulator, cost_function, self.options)
+
+        self.checkResult(result, ee_target_motor)
+
+    def testPointTarget(self):
+        ee_target_motor = self.manipulator.getEEMotor(self.target_position)
+        ee_target_point = ee_target_motor.apply(Point())
+
+        cost_function = SingleManipulatorTarget(
+            self.manipulator, Point(), ee_target_point
+        )
+
+        result = solveInverseKinematics(self.manipulator, cost_function, self.options)
+
+        self.assertTrue(result.converged)
+        self.assertEqual(len(result.runs), 4)
+
+        ee_point = self.manipulator.getEEMotor(result.position.tolist()).apply(Point())
+        np.testing.assert_allclose(
+            ee_point.vector(), ee_target_point.vector(), atol=1e-4
+        )
+
+    def testDefaultOptions(self):
+        ee_target_motor = self.manipulator.getEEMotor(self.target_position)
+        cost_function = SingleManipulatorMotorCost(self.manipulator, ee_target_motor)
+
+        result = solveInverseKinematics(self.manipulator, cost_function)
+
+        self.assertEqual(len(result.runs), InverseKinematicsOptions().nbRestarts)
+
+    def testSingularStepWithoutDamping(self):
+        # Rank-deficient Jacobian: J^T.J is singular when there is no damping
+        class RankDeficientCost:
+            def getError(self, x):
+                return np.array([x[0] + x[1] - 1.0])
+
+            def getJacobian(self, x):
+                return np.array([[1.0, 1.0, 0.0]])
+
+        self.options.damping = 0.0
+
+        run = _runInverseKinematics(
+            RankDeficientCost(),
+            np.zeros(3),
+            np.full(3, -10.0),
+            np.full(3, 10.0),
+            self.options,
+        )
+
+        self.assertTrue(run.converged)
+        self.assertAlmostEqual(run.position[0] + run.position[1], 1.0, places=4)
+
+    def testInvalidNumberOfRestarts(self):
+        ee_target_motor = self.manipulator.getEEMotor(self.target_position)
+
+        self.options.nbRestarts = 0
+
+        for cost_function in [
+            SingleManipulatorMotorCost(self.manipulator, ee_target_motor),
+            _SingleManipulatorMotorCost(self.manipulator, ee_target_motor),
+        ]:
+            with self.assertRaises(ValueError):
+                solveInverseKinematics(self.manipulator, cost_function, self.options)
+
+
+if __name__ == "__main__":
+    unittest.main()
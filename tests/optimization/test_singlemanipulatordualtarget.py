@@ -12,10 +12,12 @@ import math
 import unittest
 
 import helpers
+import numpy as np
 
 from pygafro import Point
 from pygafro import SingleManipulatorDualTarget
 from pygafro import Sphere
+from pygafro.singlemanipulatordualtarget import _SingleManipulatorDualTarget
 
 
 class TestSingleManipulatorDualTargetPointToolPointTarget(unittest.TestCase):
@@ -83,6 +85,10 @@ class TestSingleManipulatorDualTargetPointToolPointTarget(unittest.TestCase):
         self.assertAlmostEqual(gradient[1], -2.0)
         self.assertAlmostEqual(gradient[2], 0.0)
 
+    def testBatchEvaluation(self):
+        errors = helpers.checkBatchEvaluation(self, self.cost_function)
+        self.assertEqual(errors.shape, (3, 1))
+
     def testGetGradientAndHessian(self):
         gradient, hessian = self.cost_function.getGradientAndHessian([0.0, 0.0, 0.0])
 
@@ -370,5 +376,47 @@ class TestSingleManipulatorDualTargetPointToolSphereTarget(unittest.TestCase):
         self.assertAlmostEqual(hessian[2, 2], 0.0)
 
 
+class TestSingleManipulatorDualTargetFallback(unittest.TestCase):
+
+    def setUp(self):
+        self.manipulator = helpers.createManipulatorWith3JointsB()
+
+        target_position = [0.0, math.pi / 2.0, 0.0]
+        self.target = self.manipulator.getEEMotor(target_position).apply(
+            Sphere(Point(), 0.1)
+        )
+
+    def tearDown(self):
+        self.manipulator = None
+
+    def testSameResultsThanCompiledCostFunction(self):
+        for tool, target in [(Point(), self.target), (Point(), Point(1.0, 2.0, 0.0))]:
+            compiled = SingleManipulatorDualTarget(self.manipulator, tool, target)
+            fallback = _SingleManipulatorDualTarget(self.manipulator, tool, target)
+
+            for x in [[0.0, 0.0, 0.0], [0.2, -0.5, 1.0]]:
+                self.assertAlmostEqual(fallback.getValue(x), compiled.getValue(x))
+
+                self.assertTrue(np.allclose(fallback.getError(x), compiled.getError(x)))
+                self.assertTrue(
+                    np.allclose(
+                        fallback.getJacobian(x),
+                        np.reshape(compiled.getJacobian(x), (-1, 3)),
+                    )
+                )
+
+                gradient1, hessian1 = fallback.getGradientAndHessian(x)
+                gradient2, hessian2 = compiled.getGradientAndHessian(x)
+
+                self.assertTrue(np.allclose(gradient1, gradient2))
+                self.assertTrue(np.allclose(hessian1, hessian2))
+
+    def testBatchEvaluation(self):
+        fallback = _SingleManipulatorDualTarget(self.manipulator, Point(), self.target)
+
+        errors = helpers.checkBatchEvaluation(self, fallback)
+        self.assertEqual(errors.shape, (3, 10))
+
+
 if __name__ == "__main__":
     unittest.main()
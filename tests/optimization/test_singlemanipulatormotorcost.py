@@ -12,8 +12,10 @@ import math
 import unittest
 
 import helpers
+import numpy as np
 
 from pygafro import SingleManipulatorMotorCost
+from pygafro.singlemanipulatormotorcost import _SingleManipulatorMotorCost
 
 
 class TestSingleManipulatorMotorCost(unittest.TestCase):
@@ -92,6 +94,65 @@ class TestSingleManipulatorMotorCost(unittest.TestCase):
         self.assertAlmostEqual(hessian[1, 2], 1.0)
         self.assertAlmostEqual(hessian[2, 2], 1.0)
 
+    def testBatchEvaluation(self):
+        errors = helpers.checkBatchEvaluation(self, self.cost_function)
+        self.assertEqual(errors.shape, (3, 6))
+
+
+class TestSingleManipulatorMotorCostFallback(unittest.TestCase):
+
+    def setUp(self):
+        self.manipulator = helpers.createManipulatorWith3JointsB()
+
+        target_position = [0.0, math.pi / 2.0, 0.0]
+        ee_target_motor = self.manipulator.getEEMotor(target_position)
+
+        self.compiled = SingleManipulatorMotorCost(self.manipulator, ee_target_motor)
+        self.fallback = _SingleManipulatorMotorCost(self.manipulator, ee_target_motor)
+
+    def tearDown(self):
+        self.compiled = None
+        self.fallback = None
+        self.manipulator = None
+
+    def testSameResultsThanCompiledCostFunction(self):
+        for x in [[0.0, 0.0, 0.0], [0.2, -0.5, 1.0]]:
+            self.assertTrue(
+                np.allclose(self.fallback.getError(x), self.compiled.getError(x))
+            )
+
+            gradient1, hessian1 = self.fallback.getGradientAndHessian(x)
+            gradient2, hessian2 = self.compiled.getGradientAndHessian(x)
+
+            self.assertTrue(np.allclose(gradient1, gradient2))
+            self.assertTrue(np.allclose(hessian1, hessian2))
+
+    def testEvaluationOfLastConfigurationIsReused(self):
+        error = self.fallback.getError(np.array([0.2, -0.5, 1.0]))
+        evaluation = self.fallback._last_evaluation
+        gradient, hessian = self.fallback.getGradientAndHessian([0.2, -0.5, 1.0])
+
+        self.assertIs(self.fallback._last_evaluation, evaluation)
+
+        # The caller gets its own copy of the results
+        self.assertTrue(error.flags.writeable)
+
+        error *= -1.0
+        gradient *= -1.0
+
+        self.assertTrue(np.allclose(self.fallback.getError([0.2, -0.5, 1.0]), -error))
+        self.assertTrue(
+            np.allclose(self.fallback.getGradient([0.2, -0.5, 1.0]), -gradient)
+        )
+        self.assertIs(self.fallback._last_evaluation, evaluation)
+
+        self.fallback.getError([0.0, 0.0, 0.0])
+        self.assertIsNot(self.fallback._last_evaluation, evaluation)
+
+    def testBatchEvaluation(self):
+        errors = helpers.checkBatchEvaluation(self, self.fallback)
+        self.assertEqual(errors.shape, (3, 6))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,10 +12,14 @@ import math
 import unittest
 
 import helpers
+import numpy as np
 
+from pygafro import Circle
+from pygafro import Multivector
 from pygafro import Point
 from pygafro import SingleManipulatorTarget
 from pygafro import Sphere
+from pygafro.singlemanipulatortarget import _SingleManipulatorTarget
 
 
 class TestSingleManipulatorTargetPointToolPointTarget(unittest.TestCase):
@@ -139,6 +143,10 @@ class TestSingleManipulatorTargetPointToolPointTarget(unittest.TestCase):
         self.assertAlmostEqual(gradient[1], -36.5)
         self.assertAlmostEqual(gradient[2], 0.0)
 
+    def testBatchEvaluation(self):
+        errors = helpers.checkBatchEvaluation(self, self.cost_function)
+        self.assertEqual(errors.shape, (3, 10))
+
     def testGetGradientAndHessian(self):
         gradient, hessian = self.cost_function.getGradientAndHessian([0.0, 0.0, 0.0])
 
@@ -304,5 +312,79 @@ class TestSingleManipulatorTargetPointToolSphereTarget(unittest.TestCase):
         self.assertAlmostEqual(hessian[2, 2], 0.0)
 
 
+class TestSingleManipulatorTargetFallback(unittest.TestCase):
+
+    def setUp(self):
+        self.manipulator = helpers.createManipulatorWith3JointsB()
+
+        target_position = [0.0, math.pi / 2.0, 0.0]
+        motor = self.manipulator.getEEMotor(target_position)
+
+        self.tool = Point()
+        self.target = motor.apply(Sphere(Point(), 0.1))
+
+    def tearDown(self):
+        self.manipulator = None
+
+    def testSameResultsThanCompiledCostFunction(self):
+        for tool, target in [
+            (Point(), self.target),
+            (Point(1.0, 0.0, 0.0), Point(0.0, 1.0, 2.0)),
+            (
+                Circle(
+                    Point(1.0, 0.0, 0.0), Point(0.0, 1.0, 0.0), Point(0.0, 0.0, 1.0)
+                ),
+                self.target,
+            ),
+        ]:
+            compiled = SingleManipulatorTarget(self.manipulator, tool, target)
+            fallback = _SingleManipulatorTarget(self.manipulator, tool, target)
+
+            for x in [[0.0, 0.0, 0.0], [0.2, -0.5, 1.0], [0.0, math.pi / 2.0, 0.0]]:
+                self.assertAlmostEqual(fallback.getValue(x), compiled.getValue(x))
+
+                self.assertTrue(np.allclose(fallback.getError(x), compiled.getError(x)))
+                self.assertTrue(
+                    np.allclose(
+                        fallback.getJacobian(x),
+                        np.reshape(compiled.getJacobian(x), (-1, 3)),
+                    )
+                )
+                self.assertTrue(
+                    np.allclose(fallback.getGradient(x), compiled.getGradient(x))
+                )
+
+                gradient1, hessian1 = fallback.getGradientAndHessian(x)
+                gradient2, hessian2 = compiled.getGradientAndHessian(x)
+
+                self.assertTrue(np.allclose(gradient1, gradient2))
+                self.assertTrue(np.allclose(hessian1, hessian2))
+
+    def testToolWithoutCompiledClass(self):
+        tool = Multivector.create(["e1", "e2", "e3", "e123"], [1.0, 0.0, 0.0, 0.0])
+
+        cost_function = SingleManipulatorTarget(self.manipulator, tool, self.target)
+
+        self.assertTrue(isinstance(cost_function, _SingleManipulatorTarget))
+        self.assertEqual(cost_function.getJacobian([0.0, 0.0, 0.0]).shape[1], 3)
+
+    def testInvalidNumberOfDOF(self):
+        cost_function = _SingleManipulatorTarget(
+            self.manipulator, self.tool, self.target
+        )
+
+        with self.assertRaises(ValueError):
+            cost_function.getValue([0.0, 0.0])
+
+        with self.assertRaises(ValueError):
+            cost_function.getValues(np.zeros((4, 2)))
+
+    def testBatchEvaluation(self):
+        fallback = _SingleManipulatorTarget(self.manipulator, self.tool, self.target)
+
+        errors = helpers.checkBatchEvaluation(self, fallback)
+        self.assertEqual(errors.shape, (3, 1))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,431 @@
+#! /usr/bin/env python3
+
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+import os
+import unittest
+
+import numpy as np
+from helpers import createSerialSystem
+
+from pygafro import DynamicManipulator
+from pygafro import Motor
+from pygafro import Point
+from pygafro import Wrench
+from pygafro import createManipulator
+from pygafro import __path__ as pygafro_path
+
+PANDA_YAML = os.path.join(pygafro_path[0], "assets", "robots", "panda", "panda.yaml")
+
+
+# Euclidean position of the end-effector of the chains created by createSerialSystem()
+def getSerialChainEEPosition(position):
+    angles = np.concatenate([[0.0], np.cumsum(position)])[:-1]
+    return np.array([-np.sum(np.sin(angles)), np.sum(np.cos(angles)), 0.0])
+
+
+def assertMultivectorListsEqual(test, list1, list2):
+    test.assertEqual(len(list1), len(list2))
+
+    for mv1, mv2 in zip(list1, list2):
+        test.assertTrue(np.allclose(mv1.vector(), mv2.vector()))
+
+
+class TestDynamicManipulatorAgainstFixedManipulator(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fixed = createManipulator(PANDA_YAML, 7, "panda_endeffector_joint")
+        cls.dynamic = DynamicManipulator(PANDA_YAML, "panda_endeffector_joint")
+
+    def setUp(self):
+        self.position = self.fixed.getRandomConfiguration()
+        self.velocity = np.random.uniform(-1.0, 1.0, 7)
+
+    def test_dof(self):
+        self.assertEqual(self.dynamic.dof, 7)
+        self.assertEqual(self.dynamic.getDoF(), 7)
+
+    def test_jointLimits(self):
+        self.assertTrue(
+            np.allclose(
+                self.dynamic.getJointLimitsMin(), self.fixed.getJointLimitsMin()
+            )
+        )
+        self.assertTrue(
+            np.allclose(
+                self.dynamic.getJointLimitsMax(), self.fixed.getJointLimitsMax()
+            )
+        )
+
+    def test_randomConfiguration(self):
+        position = self.dynamic.getRandomConfiguration()
+
+        self.assertEqual(position.shape, (7,))
+        self.assertTrue(np.all(position >= self.dynamic.getJointLimitsMin()))
+        self.assertTrue(np.all(position <= self.dynamic.getJointLimitsMax()))
+
+    def test_getEEMotor(self):
+        self.assertTrue(
+            np.allclose(
+                self.dynamic.getEEMotor(self.position).vector(),
+                self.fixed.getEEMotor(self.position).vector(),
+            )
+        )
+
+    def test_getEEMotorBatch(self):
+        positions = np.array([self.fixed.getRandomConfiguration() for _ in range(5)])
+
+        self.assertTrue(
+            np.allclose(
+                self.dynamic.getEEMotorBatch(positions),
+                self.fixed.getEEMotorBatch(positions),
+            )
+        )
+
+        self.assertTrue(
+            np.allclose(
+                self.dynamic.getEETransformationMatrixBatch(positions),
+                self.fixed.getEETransformationMatrixBatch(positions),
+            )
+        )
+
+    def test_getEEAnalyticJacobian(self):
+        assertMultivectorListsEqual(
+            self,
+            self.dynamic.getEEAnalyticJacobian(self.position),
+            self.fixed.getEEAnalyticJacobian(self.position),
+        )
+
+        self.assertTrue(
+            np.allclose(
+                self.dynamic.getEEAnalyticJacobianArray(self.position),
+                self.fixed.getEEAnalyticJacobianArray(self.position),
+            )
+        )
+
+    def test_getEEGeometricJacobian(self):
+        assertMultivectorListsEqual(
+            self,
+            self.dynamic.getEEGeometricJacobian(self.position),
+            self.fixed.getEEGeometricJacobian(self.position),
+        )
+
+        self.assertTrue(
+            np.allclose(
+                self.dynamic.getEEGeometricJacobianArray(self.position),
+                self.fixed.getEEGeometricJacobianArray(self.position),
+            )
+        )
+
+    def test_getGeometricJacobian(self):
+        reference = Motor.Random()
+
+        assertMultivectorListsEqual(
+            self,
+            self.dynamic.getGeometricJacobian(self.position, reference),
+            self.fixed.getGeometricJacobian(self.position, reference),
+        )
+
+    def test_getGeometricJacobianTimeDerivative(self):
+        reference = Motor.Random()
+
+        assertMultivectorListsEqual(
+            self,
+            self.dynamic.getGeometricJacobianTimeDerivative(
+                self.position, self.velocity, reference
+            ),
+            self.fixed.getGeometricJacobianTimeDerivative(
+                self.position, self.velocity, reference
+            ),
+        )
+
+    def test_getEEFrameJacobian(self):
+        assertMultivectorListsEqual(
+            self,
+            self.dynamic.getEEFrameJacobian(self.position),
+            self.fixed.getEEFrameJacobian(self.position),
+        )
+
+    def test_manipulabilities(self):
+        for name in [
+            "getEEVelocityManipulability",
+            "getEEForceManipulability",
+            "getEEDynamicManipulability",
+            "getEEKinematicNullspaceProjector",
+        ]:
+            self.assertTrue(
+                np.allclose(
+                    getattr(self.dynamic, name)(self.position),
+                    getattr(self.fixed, name)(self.position),
+                ),
+                name,
+            )
+
+    def test_getMassMatrix(self):
+        self.assertTrue(
+            np.allclose(
+                self.dynamic.getMassMatrix(self.position),
+                self.fixed.getMassMatrix(self.position),
+            )
+        )
+
+    def test_dynamics(self):
+        acceleration = np.random.uniform(-1.0, 1.0, 7)
+
+        torques = self.dynamic.getJointTorques(
+            self.position, self.velocity, acceleration
+        )
+
+        self.assertTrue(
+            np.allclose(
+                torques,
+                self.fixed.getJointTorques(self.position, self.velocity, acceleration),
+            )
+        )
+
+        self.assertTrue(
+            np.allclose(
+                self.dynamic.getJointAccelerations(
+                    self.position, self.velocity, torques
+                ),
+                self.fixed.getJointAccelerations(self.position, self.velocity, torques),
+            )
+        )
+
+    def test_dynamicsWithWrench(self):
+        acceleration = np.random.uniform(-1.0, 1.0, 7)
+        wrench = Wrench(np.random.uniform(-1.0, 1.0, 6))
+
+        torques = self.dynamic.getJointTorques(
+            self.position, self.velocity, acceleration, 9.81, wrench
+        )
+
+        self.assertTrue(
+            np.allclose(
+                torques,
+                self.fixed.getJointTorques(
+                    self.position, self.velocity, acceleration, 9.81, wrench
+                ),
+            )
+        )
+
+        self.assertFalse(
+            np.allclose(
+                torques,
+                self.dynamic.getJointTorques(
+                    self.position, self.velocity, acceleration
+                ),
+            )
+        )
+
+    def test_dynamicsBatch(self):
+        positions = np.array([self.fixed.getRandomConfiguration() for _ in range(5)])
+        velocities = np.random.uniform(-1.0, 1.0, (5, 7))
+        accelerations = np.random.uniform(-1.0, 1.0, (5, 7))
+
+        torques = self.dynamic.getJointTorquesBatch(
+            positions, velocities, accelerations, nbThreads=2
+        )
+
+        self.assertTrue(
+            np.allclose(
+                torques,
+                self.fixed.getJointTorquesBatch(positions, velocities, accelerations),
+            )
+        )
+
+        self.assertTrue(
+            np.allclose(
+                self.dynamic.getJointAccelerationsBatch(positions, velocities, torques),
+                accelerations,
+            )
+        )
+
+        # Same signature for both classes: (..., gravity, nbThreads)
+        torques = self.fixed.getJointTorquesBatch(
+            positions, velocities, accelerations, 0.0, 2
+        )
+
+        self.assertTrue(
+            np.allclose(
+                self.fixed.getJointAccelerationsBatch(
+                    positions, velocities, torques, 0.0, 2
+                ),
+                accelerations,
+            )
+        )
+
+        self.assertTrue(
+            np.allclose(
+                self.dynamic.getJointAccelerationsBatch(
+                    positions, velocities, torques, 0.0, 2
+                ),
+                accelerations,
+            )
+        )
+
+    def test_invalidNumberOfDOF(self):
+        with self.assertRaises(ValueError):
+            self.dynamic.getEEMotor(np.zeros(6))
+
+        with self.assertRaises(ValueError):
+            self.dynamic.getEEMotorBatch(np.zeros((10, 6)))
+
+
+class TestDynamicManipulatorWithManyJoints(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.manipulator = createManipulator(createSerialSystem(20), 20, "joint20")
+
+    def test_creation(self):
+        self.assertTrue(isinstance(self.manipulator, DynamicManipulator))
+        self.assertEqual(self.manipulator.dof, 20)
+
+    def test_creationWithWrongNumberOfDOF(self):
+        with self.assertRaises(RuntimeError):
+            createManipulator(createSerialSystem(20), 18, "joint20")
+
+    def test_getEEMotor(self):
+        position = self.manipulator.getRandomConfiguration()
+
+        ee_point = self.manipulator.getEEMotor(position).apply(Point(0.0, 0.0, 0.0))
+
+        self.assertTrue(
+            np.allclose(ee_point.vector()[1:4], getSerialChainEEPosition(position))
+        )
+
+    def test_getEEMotorBatch(self):
+        positions = np.array(
+            [self.manipulator.getRandomConfiguration() for _ in range(5)]
+        )
+
+        motors = self.manipulator.getEEMotorBatch(positions)
+
+        self.assertEqual(motors.shape, (5, 8))
+
+        for i in range(5):
+            self.assertTrue(
+                np.allclose(
+                    motors[i], self.manipulator.getEEMotor(positions[i]).vector()
+                )
+            )
+
+    def test_getEEAnalyticJacobian(self):
+        position = self.manipulator.getRandomConfiguration()
+
+        jacobian = self.manipulator.getEEAnalyticJacobianArray(position)
+        self.assertEqual(jacobian.shape, (20, 8))
+
+        # Finite differences of the end-effector motor
+        epsilon = 1e-6
+        ee_motor = self.manipulator.getEEMotor(position).vector()
+
+        for i in range(20):
+            position2 = position.copy()
+            position2[i] += epsilon
+
+            ee_motor2 = self.manipulator.getEEMotor(position2).vector()
+
+            self.assertTrue(
+                np.allclose((ee_motor2 - ee_motor) / epsilon, jacobian[i], atol=1e-4)
+            )
+
+    def test_getEEGeometricJacobianBatch(self):
+        positions = np.array(
+            [self.manipulator.getRandomConfiguration() for _ in range(3)]
+        )
+
+        jacobians = self.manipulator.getEEGeometricJacobianBatch(positions)
+        self.assertEqual(jacobians.shape, (3, 20, 6))
+
+        for i in range(3):
+            self.assertTrue(
+                np.allclose(
+                    jacobians[i],
+                    self.manipulator.getEEGeometricJacobianArray(positions[i]),
+                )
+            )
+
+    def test_dynamics(self):
+        position = self.manipulator.getRandomConfiguration()
+        velocity = np.random.uniform(-1.0, 1.0, 20)
+        acceleration = np.random.uniform(-1.0, 1.0, 20)
+
+        torques = self.manipulator.getJointTorques(position, velocity, acceleration)
+        self.assertEqual(torques.shape, (20,))
+
+        self.assertTrue(
+            np.allclose(
+                self.manipulator.getJointAccelerations(position, velocity, torques),
+                acceleration,
+            )
+        )
+
+    def test_getJointTorquesWithWrench(self):
+        position = self.manipulator.getRandomConfiguration()
+        velocity = np.random.uniform(-1.0, 1.0, 20)
+        acceleration = np.random.uniform(-1.0, 1.0, 20)
+
+        torques = self.manipulator.getJointTorques(position, velocity, acceleration)
+
+        self.assertTrue(
+            np.allclose(
+                self.manipulator.getJointTorques(
+                    position, velocity, acceleration, 9.81, Wrench()
+                ),
+                torques,
+            )
+        )
+
+        # All the joints rotate around the Z-axis: a moment around that axis (e12) is
+        # balanced by the same torque on each joint (-J^T * wrench)
+        difference = (
+            self.manipulator.getJointTorques(
+                position,
+                velocity,
+                acceleration,
+                9.81,
+                Wrench([0.0, 0.0, 0.5, 0.0, 0.0, 0.0]),
+            )
+            - torques
+        )
+
+        self.assertTrue(np.allclose(difference, -0.5))
+
+    def test_getJointTorquesWithWrenchAgainstFixedManipulator(self):
+        system = createSerialSystem(3)
+        fixed = createManipulator(system, 3, "joint3")
+        dynamic = DynamicManipulator(system, "joint3")
+
+        position = fixed.getRandomConfiguration()
+        velocity = np.random.uniform(-1.0, 1.0, 3)
+        acceleration = np.random.uniform(-1.0, 1.0, 3)
+        wrench = Wrench([0.0, 0.0, 0.5, 0.0, 0.0, 0.0])
+
+        for manipulator in [fixed, dynamic]:
+            difference = manipulator.getJointTorques(
+                position, velocity, acceleration, 9.81, wrench
+            ) - manipulator.getJointTorques(position, velocity, acceleration)
+
+            self.assertTrue(np.allclose(difference, -0.5))
+
+    def test_getMassMatrix(self):
+        position = self.manipulator.getRandomConfiguration()
+
+        mass_matrix = self.manipulator.getMassMatrix(position)
+
+        self.assertEqual(mass_matrix.shape, (20, 20))
+        self.assertTrue(np.allclose(mass_matrix, mass_matrix.T))
+        self.assertTrue(np.all(np.linalg.eigvalsh(mass_matrix) > 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
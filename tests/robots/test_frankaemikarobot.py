@@ -10,6 +10,8 @@
 
 import unittest
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from pygafro import FrankaEmikaRobot
@@ -284,6 +286,30 @@ class TestFrankaEmikaRobot(unittest.TestCase):
             self.assertAlmostEqual(acceleration[5], acceleration_computed[5])
             self.assertAlmostEqual(acceleration[6], acceleration_computed[6])
 
+    def testConcurrentQueries(self):
+        robot = FrankaEmikaRobot()
+
+        positions = np.random.rand(32, 7)
+        velocities = np.random.rand(32, 7)
+        accelerations = np.random.rand(32, 7)
+
+        def query(i):
+            return (
+                robot.getEEMotor(positions[i]).vector(),
+                robot.getMassMatrix(positions[i]),
+                robot.getJointTorques(positions[i], velocities[i], accelerations[i]),
+            )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(query, range(positions.shape[0])))
+
+        for i, (motor, mass_matrix, torque) in enumerate(results):
+            expected_motor, expected_mass_matrix, expected_torque = query(i)
+
+            np.testing.assert_allclose(motor, expected_motor)
+            np.testing.assert_allclose(mass_matrix, expected_mass_matrix)
+            np.testing.assert_allclose(torque, expected_torque)
+
     def testVisual(self):
         robot = FrankaEmikaRobot()
         link = robot.getLink('panda_link6')
@@ -100,6 +100,25 @@ def addFinger(name, system):
     link3.setParentJoint(joint3)
 
 
+def createSystem(nb_fingers):
+    system = System()
+
+    com = Translator(TranslatorGenerator([0.0, 0.0, 0.0]))
+
+    palm = system.createLink("palm")
+    palm.setMass(0.1)
+    palm.setCenterOfMass(com)
+    palm.setInertia(Inertia(0.1, np.eye(3)))
+    palm.setAxis(MotorGenerator([1.0, 0.0, 0.0, 0.0, 0.0, 0.0]))
+
+    for i in range(nb_fingers):
+        addFinger(f"finger{i + 1}", system)
+
+    system.finalize()
+
+    return system
+
+
 
 class TestHandWith4Fingers(unittest.TestCase):
 
@@ -145,6 +164,25 @@ class TestHandWith4Fingers(unittest.TestCase):
         result = hand.getFingerSphere(position12)
         result = hand.getFingerSphereJacobian(position12)
 
+    def testIntoHand(self):
+        finger_tip_names = ["finger1_joint3", "finger2_joint3", "finger3_joint3", "finger4_joint3"]
+
+        expected = Hand_3_3_3_3(createSystem(4), finger_tip_names)
+
+        system = createSystem(4)
+        hand = system.intoHand(3, finger_tip_names)
+
+        self.assertTrue(isinstance(hand, Hand_3_3_3_3))
+        self.assertEqual(len(system.getJoints()), 0)
+
+        position12 = [0.1 * i for i in range(12)]
+
+        for result, expected_result in zip(hand.getFingerMotors(position12), expected.getFingerMotors(position12)):
+            np.testing.assert_allclose(result.vector(), expected_result.vector())
+
+        with self.assertRaises(ValueError):
+            createSystem(4).intoHand(3, ["finger1_joint3", "finger2_joint3", "finger3_joint3", "unknown"])
+
 
 
 class TestHandWith3Fingers(unittest.TestCase):
@@ -11,6 +11,9 @@
 import math
 import unittest
 
+import numpy as np
+
+from pygafro import FrankaEmikaRobot
 from pygafro import Motor
 from pygafro import RotorGenerator
 from pygafro import System
@@ -176,6 +179,48 @@ class TestKinematicChainWithJoints(unittest.TestCase):
         self.assertAlmostEqual(jacobian[2]["e3i"], 0.0)
         self.assertAlmostEqual(jacobian[2]["e123i"], 0.0)
 
+    def test_forwardKinematicsCache(self):
+        position = [0.1, 0.2, 0.3]
+
+        expected_motor = self.chain.computeFullMotor(position)
+        expected_jacobian = self.chain.computeAnalyticJacobian(position)
+
+        cache = self.chain.getForwardKinematicsCache()
+        self.assertFalse(cache.isEnabled())
+
+        cache.setEnabled()
+        self.assertTrue(cache.isEnabled())
+
+        motor = self.chain.computeFullMotor(position)
+        self.assertEqual(cache.getNbHits(), 0)
+        self.assertEqual(cache.getNbMisses(), 3)
+
+        np.testing.assert_allclose(motor.vector(), expected_motor.vector())
+
+        jacobian = self.chain.computeAnalyticJacobian(position)
+        self.assertEqual(cache.getNbHits(), 3)
+        self.assertEqual(cache.getNbMisses(), 3)
+
+        for i in range(3):
+            np.testing.assert_allclose(
+                jacobian[i].vector(), expected_jacobian[i].vector()
+            )
+
+        # Only the last joint changed
+        position = [0.1, 0.2, -0.5]
+        motor = self.chain.computeFullMotor(position)
+        self.assertEqual(cache.getNbHits(), 5)
+        self.assertEqual(cache.getNbMisses(), 4)
+
+        cache.setEnabled(False)
+        np.testing.assert_allclose(
+            motor.vector(), self.chain.computeFullMotor(position).vector()
+        )
+
+        cache.clear()
+        self.assertEqual(cache.getNbHits(), 0)
+        self.assertEqual(cache.getNbMisses(), 0)
+
     def test_computeGeometricJacobian(self):
         jacobian = self.chain.computeGeometricJacobian([0.0, 0.0, math.pi / 2.0])
 
@@ -800,5 +845,120 @@ class TestConstKinematicChainWithFixedMotors(unittest.TestCase):
         self.assertAlmostEqual(jacobian[2]["e3i"], 0.0)
 
 
+class TestKinematicChainDynamics(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.robot = FrankaEmikaRobot()
+        cls.system = cls.robot.getSystem()
+        cls.chain = cls.system.getKinematicChain("panda_endeffector_joint")
+
+    def setUp(self):
+        self.position = self.robot.getRandomConfiguration()
+        self.velocity = np.random.uniform(-1.0, 1.0, 7)
+        self.acceleration = np.random.uniform(-1.0, 1.0, 7)
+
+    def test_computeInverseDynamics(self):
+        torques = self.chain.computeInverseDynamics(
+            self.position, self.velocity, self.acceleration
+        )
+
+        self.assertTrue(isinstance(torques, np.ndarray))
+        self.assertEqual(torques.shape, (7,))
+
+        # Same results than the fixed-size implementation
+        self.assertTrue(
+            np.allclose(
+                torques,
+                self.system.computeInverseDynamics(
+                    self.position, self.velocity, self.acceleration
+                ),
+            )
+        )
+
+    def test_computeInverseDynamicsWithoutGravity(self):
+        zeros = np.zeros(7)
+
+        torques = self.chain.computeInverseDynamics(
+            self.position, zeros, zeros, gravity=0.0
+        )
+
+        self.assertTrue(np.allclose(torques, zeros))
+
+    def test_computeForwardDynamics(self):
+        torques = self.chain.computeInverseDynamics(
+            self.position, self.velocity, self.acceleration
+        )
+
+        acceleration = self.chain.computeForwardDynamics(
+            self.position, self.velocity, torques
+        )
+
+        self.assertTrue(isinstance(acceleration, np.ndarray))
+        self.assertTrue(np.allclose(acceleration, self.acceleration))
+
+        self.assertTrue(
+            np.allclose(
+                acceleration,
+                self.system.computeForwardDynamics(
+                    self.position, self.velocity, torques
+                ),
+            )
+        )
+
+    def test_computeMassMatrix(self):
+        mass_matrix = self.chain.computeMassMatrix(list(self.position))
+
+        self.assertEqual(mass_matrix.shape, (7, 7))
+        self.assertTrue(np.allclose(mass_matrix, mass_matrix.T))
+
+        # Same results than the fixed-size implementation
+        self.assertTrue(
+            np.allclose(mass_matrix, self.robot.getMassMatrix(self.position))
+        )
+
+        # Each column is the torque needed to produce a unit acceleration of one joint
+        zeros = np.zeros(7)
+        gravity_torques = self.chain.computeInverseDynamics(self.position, zeros, zeros)
+
+        for i in range(7):
+            self.assertTrue(
+                np.allclose(
+                    mass_matrix[:, i],
+                    self.chain.computeInverseDynamics(
+                        self.position, zeros, np.eye(7)[i]
+                    )
+                    - gravity_torques,
+                )
+            )
+
+    def test_invalidNumberOfDOF(self):
+        with self.assertRaises(ValueError):
+            self.chain.computeInverseDynamics(np.zeros(6), np.zeros(6), np.zeros(6))
+
+        with self.assertRaises(ValueError):
+            self.chain.computeMassMatrix([0.0] * 6)
+
+
+class TestKinematicChainAnalyticJacobian(unittest.TestCase):
+
+    def test_sameAsManipulator(self):
+        robot = FrankaEmikaRobot()
+        chain = robot.getSystem().getKinematicChain("panda_endeffector_joint")
+
+        for _ in range(10):
+            position = robot.getRandomConfiguration()
+
+            jacobian = chain.computeAnalyticJacobian(list(position))
+            expected = robot.getEEAnalyticJacobian(position)
+
+            self.assertEqual(len(jacobian), 7)
+
+            for i in range(7):
+                np.testing.assert_allclose(
+                    jacobian[i].vector(), expected[i].vector(), atol=1e-12
+                )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -12,8 +12,11 @@ import unittest
 
 import numpy as np
 
+from pygafro import FixedJoint
 from pygafro import Inertia
 from pygafro import MotorGenerator
+from pygafro import PrismaticJoint
+from pygafro import RevoluteJoint
 from pygafro import System
 from pygafro import Translator
 from pygafro import TranslatorGenerator
@@ -161,6 +164,30 @@ class TestDefaultLink(unittest.TestCase):
         self.assertTrue(children[1].getName() in ["joint1", "joint2"])
         self.assertTrue(children[0].getName() != children[1].getName())
 
+    def test_childJointsOfDifferentTypes(self):
+        system = System()
+        link = system.createLink("link1")
+
+        joint1 = system.createFixedJoint("joint1")
+        joint2 = system.createPrismaticJoint("joint2")
+        joint3 = system.createRevoluteJoint("joint3")
+
+        link.addChildJoint(joint1)
+        link.addChildJoint(joint2)
+        link.addChildJoint(joint3)
+
+        children = {joint.getName(): joint for joint in link.getChildJoints()}
+
+        self.assertEqual(len(children), 3)
+
+        self.assertTrue(isinstance(children["joint1"], FixedJoint))
+        self.assertTrue(isinstance(children["joint2"], PrismaticJoint))
+        self.assertTrue(isinstance(children["joint3"], RevoluteJoint))
+
+        self.assertTrue(children["joint1"] is joint1)
+        self.assertTrue(children["joint2"] is joint2)
+        self.assertTrue(children["joint3"] is joint3)
+
     def test_axis(self):
         system = System()
         link = system.createLink("link1")
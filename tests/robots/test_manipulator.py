@@ -62,6 +62,50 @@ class TestManipulatorConfiguration1With3Joints(unittest.TestCase):
         self.assertAlmostEqual(motor["e3i"], 0.0)
         self.assertAlmostEqual(motor["e123i"], 0.0)
 
+    def test_computeEndEffectorMotorBatch(self):
+        positions = np.array(
+            [
+                [0.0, math.pi / 2.0, 0.0],
+                [0.1, -0.2, 0.3],
+                [-1.0, 0.5, 2.0],
+            ]
+        )
+
+        motors = self.manipulator.getEEMotorBatch(positions)
+
+        self.assertTrue(isinstance(motors, np.ndarray))
+        self.assertEqual(motors.shape, (3, 8))
+
+        for i in range(positions.shape[0]):
+            motor = self.manipulator.getEEMotor(positions[i, :])
+            np.testing.assert_allclose(motors[i, :], motor.vector())
+
+    def test_computeEndEffectorTransformationMatrixBatch(self):
+        positions = np.array(
+            [
+                [0.0, math.pi / 2.0, 0.0],
+                [0.1, -0.2, 0.3],
+            ]
+        )
+
+        matrices = self.manipulator.getEETransformationMatrixBatch(positions)
+
+        self.assertTrue(isinstance(matrices, np.ndarray))
+        self.assertEqual(matrices.shape, (2, 4, 4))
+
+        for i in range(positions.shape[0]):
+            motor = self.manipulator.getEEMotor(positions[i, :])
+            np.testing.assert_allclose(matrices[i], motor.toTransformationMatrix())
+
+    def test_computeEndEffectorMotorBatchWithEmptyBatch(self):
+        motors = self.manipulator.getEEMotorBatch(np.zeros((0, 3)))
+        self.assertEqual(motors.shape, (0, 8))
+
+    def test_computeEndEffectorMotorBatchWithInvalidShape(self):
+        self.assertRaises(
+            ValueError, self.manipulator.getEEMotorBatch, np.zeros((4, 2))
+        )
+
     def test_computeEndEffectorAnalyticJacobian(self):
         position = [0.0, math.pi / 2.0, 0.0]
 
@@ -97,6 +141,102 @@ class TestManipulatorConfiguration1With3Joints(unittest.TestCase):
         self.assertAlmostEqual(jacobian[2]["e3i"], 0.0)
         self.assertAlmostEqual(jacobian[2]["e123i"], 0.0)
 
+    def test_computeEndEffectorAnalyticJacobianArray(self):
+        position = [0.0, math.pi / 2.0, 0.0]
+
+        jacobian = self.manipulator.getEEAnalyticJacobianArray(position)
+        expected = self.manipulator.getEEAnalyticJacobian(position)
+
+        self.assertTrue(isinstance(jacobian, np.ndarray))
+        self.assertEqual(jacobian.shape, (3, 8))
+
+        for i in range(3):
+            np.testing.assert_allclose(jacobian[i, :], expected[i].vector())
+
+    def test_computeEndEffectorAnalyticJacobianBatch(self):
+        positions = np.array(
+            [
+                [0.0, math.pi / 2.0, 0.0],
+                [0.1, -0.2, 0.3],
+            ]
+        )
+
+        jacobians = self.manipulator.getEEAnalyticJacobianBatch(positions)
+
+        self.assertTrue(isinstance(jacobians, np.ndarray))
+        self.assertEqual(jacobians.shape, (2, 3, 8))
+
+        for i in range(positions.shape[0]):
+            expected = self.manipulator.getEEAnalyticJacobian(positions[i, :])
+            for j in range(3):
+                np.testing.assert_allclose(jacobians[i, j, :], expected[j].vector())
+
+    def test_forwardKinematicsCache(self):
+        positions = [[0.0, math.pi / 2.0, 0.0], [0.0, math.pi / 2.0, 0.4]]
+
+        expected_motors = [self.manipulator.getEEMotor(x) for x in positions]
+        expected_jacobians = [
+            self.manipulator.getEEAnalyticJacobian(x) for x in positions
+        ]
+
+        cache = self.manipulator.getForwardKinematicsCache()
+        cache.setEnabled()
+
+        for x, expected_motor, expected_jacobian in zip(
+            positions, expected_motors, expected_jacobians
+        ):
+            np.testing.assert_allclose(
+                self.manipulator.getEEMotor(x).vector(), expected_motor.vector()
+            )
+
+            jacobian = self.manipulator.getEEAnalyticJacobian(x)
+            for i in range(3):
+                np.testing.assert_allclose(
+                    jacobian[i].vector(), expected_jacobian[i].vector()
+                )
+
+        # First configuration: 3 misses, then 3 hits for the Jacobian. Second one: only
+        # the last joint changed
+        self.assertEqual(cache.getNbHits(), 3 + 2 + 3)
+        self.assertEqual(cache.getNbMisses(), 3 + 1)
+
+        # The kinematic chain of the end-effector shares the cache
+        chain = self.manipulator.getEEKinematicChain()
+        self.assertTrue(chain.getForwardKinematicsCache().isEnabled())
+
+    def test_forwardKinematicsCacheAfterJointModification(self):
+        position = [0.1, -0.2, 0.3]
+
+        cache = self.manipulator.getForwardKinematicsCache()
+        cache.setEnabled()
+
+        motor = self.manipulator.getEEMotor(position)
+        self.manipulator.getEEAnalyticJacobian(position)
+
+        # Modifications of the joints through their wrappers (of the manipulator or of
+        # its system) invalidate the cached forward kinematics
+        joint = self.manipulator.getJoint("joint2")
+        joint.setFrame(Motor(Translator(TranslatorGenerator([0.0, 2.0, 0.0]))))
+
+        joint = self.manipulator.getSystem().getJoint("joint3")
+        joint.setAxis(RotorGenerator([0.0, 1.0, 0.0]))
+
+        cached_motor = self.manipulator.getEEMotor(position)
+        cached_jacobian = self.manipulator.getEEAnalyticJacobian(position)
+
+        cache.setEnabled(False)
+
+        expected_motor = self.manipulator.getEEMotor(position)
+        expected_jacobian = self.manipulator.getEEAnalyticJacobian(position)
+
+        self.assertFalse(np.allclose(motor.vector(), expected_motor.vector()))
+        np.testing.assert_allclose(cached_motor.vector(), expected_motor.vector())
+
+        for i in range(3):
+            np.testing.assert_allclose(
+                cached_jacobian[i].vector(), expected_jacobian[i].vector()
+            )
+
     def test_computeEndEffectorGeometricJacobian(self):
         position = [0.0, math.pi / 2.0, 0.0]
 
@@ -126,6 +266,36 @@ class TestManipulatorConfiguration1With3Joints(unittest.TestCase):
         self.assertAlmostEqual(jacobian[2]["e2i"], 1.0)
         self.assertAlmostEqual(jacobian[2]["e3i"], 0.0)
 
+    def test_computeEndEffectorGeometricJacobianArray(self):
+        position = [0.0, math.pi / 2.0, 0.0]
+
+        jacobian = self.manipulator.getEEGeometricJacobianArray(position)
+        expected = self.manipulator.getEEGeometricJacobian(position)
+
+        self.assertTrue(isinstance(jacobian, np.ndarray))
+        self.assertEqual(jacobian.shape, (3, 6))
+
+        for i in range(3):
+            np.testing.assert_allclose(jacobian[i, :], expected[i].vector())
+
+    def test_computeEndEffectorGeometricJacobianBatch(self):
+        positions = np.array(
+            [
+                [0.0, math.pi / 2.0, 0.0],
+                [0.1, -0.2, 0.3],
+            ]
+        )
+
+        jacobians = self.manipulator.getEEGeometricJacobianBatch(positions)
+
+        self.assertTrue(isinstance(jacobians, np.ndarray))
+        self.assertEqual(jacobians.shape, (2, 3, 6))
+
+        for i in range(positions.shape[0]):
+            expected = self.manipulator.getEEGeometricJacobian(positions[i, :])
+            for j in range(3):
+                np.testing.assert_allclose(jacobians[i, j, :], expected[j].vector())
+
     def test_computeEndEffectorFrameJacobian(self):
         position = [0.0, math.pi / 2.0, 0.0]
 
@@ -244,6 +414,76 @@ class TestManipulatorConfiguration1With3Joints(unittest.TestCase):
         self.assertAlmostEqual(acceleration[1], 0.8, places=4)
         self.assertAlmostEqual(acceleration[2], 0.0, places=4)
 
+    def test_getJointTorquesBatch(self):
+        positions = np.array(
+            [self.manipulator.getRandomConfiguration() for _ in range(10)]
+        )
+        velocities = np.random.uniform(-1.0, 1.0, (10, 3))
+        accelerations = np.random.uniform(-1.0, 1.0, (10, 3))
+
+        torques = self.manipulator.getJointTorquesBatch(
+            positions, velocities, accelerations
+        )
+
+        self.assertTrue(isinstance(torques, np.ndarray))
+        self.assertEqual(torques.shape, (10, 3))
+
+        for i in range(10):
+            self.assertTrue(
+                np.allclose(
+                    torques[i],
+                    self.manipulator.getJointTorques(
+                        positions[i], velocities[i], accelerations[i]
+                    ),
+                )
+            )
+
+        self.assertTrue(
+            np.allclose(
+                self.manipulator.getJointTorquesBatch(
+                    positions, velocities, accelerations, nbThreads=4
+                ),
+                torques,
+            )
+        )
+
+    def test_getJointAccelerationsBatch(self):
+        positions = np.array(
+            [self.manipulator.getRandomConfiguration() for _ in range(10)]
+        )
+        velocities = np.random.uniform(-1.0, 1.0, (10, 3))
+        accelerations = np.random.uniform(-1.0, 1.0, (10, 3))
+
+        torques = self.manipulator.getJointTorquesBatch(
+            positions, velocities, accelerations
+        )
+
+        result = self.manipulator.getJointAccelerationsBatch(
+            positions, velocities, torques, nbThreads=0
+        )
+
+        self.assertTrue(isinstance(result, np.ndarray))
+        self.assertEqual(result.shape, (10, 3))
+        self.assertTrue(np.allclose(result, accelerations))
+
+    def test_dynamicsBatchWithEmptyBatch(self):
+        torques = self.manipulator.getJointTorquesBatch(
+            np.zeros((0, 3)), np.zeros((0, 3)), np.zeros((0, 3))
+        )
+
+        self.assertEqual(torques.shape, (0, 3))
+
+    def test_dynamicsBatchWithInvalidShapes(self):
+        with self.assertRaises(ValueError):
+            self.manipulator.getJointTorquesBatch(
+                np.zeros((10, 2)), np.zeros((10, 2)), np.zeros((10, 2))
+            )
+
+        with self.assertRaises(ValueError):
+            self.manipulator.getJointAccelerationsBatch(
+                np.zeros((10, 3)), np.zeros((9, 3)), np.zeros((10, 3))
+            )
+
 
 class TestManipulatorConfiguration1With2Joints(unittest.TestCase):
 
@@ -655,6 +895,19 @@ class TestManipulatorCreationFromYAML(unittest.TestCase):
         self.assertAlmostEqual(ee_point["e3"], 0.5583231694)
         self.assertAlmostEqual(ee_point["ei"], 0.25739749)
 
+    def testNumPyNumberOfDOF(self):
+        filename = os.path.join(
+            pygafro_path[0], "assets", "robots", "panda", "panda.yaml"
+        )
+
+        manipulator = createManipulator(
+            filename, np.int64(7), "panda_endeffector_joint"
+        )
+        self.assertEqual(manipulator.dof, 7)
+
+        with self.assertRaises(TypeError):
+            createManipulator(filename, 7.0, "panda_endeffector_joint")
+
     def testUnknownFileName(self):
         with self.assertRaises(ValueError):
             manipulator = createManipulator(
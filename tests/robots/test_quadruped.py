@@ -82,26 +82,32 @@ def addLeg(name, system):
     link2.setParentJoint(joint2)
 
 
-class TestQuadruped(unittest.TestCase):
+def createSystem():
+    system = System()
 
-    def testAllMethodsRun(self):
-        # Create the system
-        system = System()
+    com = Translator(TranslatorGenerator([0.0, 0.0, 0.0]))
+
+    body = system.createLink("body")
+    body.setMass(0.1)
+    body.setCenterOfMass(com)
+    body.setInertia(Inertia(0.1, np.eye(3)))
+    body.setAxis(MotorGenerator([1.0, 0.0, 0.0, 0.0, 0.0, 0.0]))
 
-        com = Translator(TranslatorGenerator([0.0, 0.0, 0.0]))
+    addLeg("leg1", system)
+    addLeg("leg2", system)
+    addLeg("leg3", system)
+    addLeg("leg4", system)
 
-        body = system.createLink("body")
-        body.setMass(0.1)
-        body.setCenterOfMass(com)
-        body.setInertia(Inertia(0.1, np.eye(3)))
-        body.setAxis(MotorGenerator([1.0, 0.0, 0.0, 0.0, 0.0, 0.0]))
+    system.finalize()
 
-        addLeg("leg1", system)
-        addLeg("leg2", system)
-        addLeg("leg3", system)
-        addLeg("leg4", system)
+    return system
 
-        system.finalize()
+
+class TestQuadruped(unittest.TestCase):
+
+    def testAllMethodsRun(self):
+        # Create the system
+        system = createSystem()
 
         # Create the hand
         quadruped = Quadruped_2(system, ["leg1_joint2", "leg2_joint2", "leg3_joint2", "leg4_joint2"])
@@ -126,6 +132,27 @@ class TestQuadruped(unittest.TestCase):
         result = quadruped.getMeanMotorAnalyticJacobian(position8)
         result = quadruped.getMeanMotorGeometricJacobian(position8)
 
+    def testIntoQuadruped(self):
+        foot_tip_names = ["leg1_joint2", "leg2_joint2", "leg3_joint2", "leg4_joint2"]
+
+        expected = Quadruped_2(createSystem(), foot_tip_names)
+
+        system = createSystem()
+        quadruped = system.intoQuadruped(2, foot_tip_names)
+
+        self.assertTrue(isinstance(quadruped, Quadruped_2))
+        self.assertEqual(len(system.getJoints()), 0)
+
+        position8 = [0.1, -0.2, 0.3, 0.4, -0.5, 0.6, 0.7, -0.8]
+
+        for result, expected_result in zip(
+            quadruped.getFootMotors(position8), expected.getFootMotors(position8)
+        ):
+            np.testing.assert_allclose(result.vector(), expected_result.vector())
+
+        with self.assertRaises(ValueError):
+            createSystem().intoQuadruped(3, foot_tip_names)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,7 +12,10 @@ import math
 import unittest
 
 import numpy as np
+from helpers import createSerialSystem
+from helpers import createSystemWith3Joints
 
+from pygafro import FixedJoint
 from pygafro import Inertia
 from pygafro import Joint
 from pygafro import Motor
@@ -22,6 +25,7 @@ from pygafro import RotorGenerator
 from pygafro import System
 from pygafro import Translator
 from pygafro import TranslatorGenerator
+from pygafro import createManipulator
 
 
 class TestDefaultSystem(unittest.TestCase):
@@ -137,6 +141,42 @@ class TestSystem(unittest.TestCase):
         self.assertTrue(self.system.getJoint("joint1") is not None)
         self.assertTrue(self.system.getJoint("joint2") is not None)
 
+    def test_wrapperIdentity(self):
+        joints = self.system.getJoints()
+        links = self.system.getLinks()
+
+        self.assertTrue(self.system.getJoint("joint1") is joints[0])
+        self.assertTrue(self.system.getLink("link2") is links[1])
+        self.assertTrue(self.system.getBaseLink() is links[0])
+
+        self.assertTrue(joints[0].getParentLink() is links[0])
+        self.assertTrue(joints[0].getChildLink() is links[1])
+        self.assertTrue(links[1].getParentJoint() is joints[0])
+        self.assertTrue(links[1].getChildJoints()[0] is joints[1])
+
+    def test_wrappersOfDestroyedSystems(self):
+        # The joints of a new system can reuse the addresses of the ones of a destroyed
+        # system, still referenced by Python: their wrappers must not be shared
+        for _ in range(20):
+            system = System()
+            joint = system.createRevoluteJoint("joint1")
+            system = None
+
+            system = System()
+            system.createFixedJoint("joint1")
+
+            self.assertTrue(isinstance(system.getJoint("joint1"), FixedJoint))
+            self.assertTrue(system.getJoint("joint1") is not joint)
+
+    def test_topology(self):
+        parents, children = self.system.getTopology()
+
+        self.assertTrue(isinstance(parents, np.ndarray))
+        self.assertTrue(isinstance(children, np.ndarray))
+
+        self.assertEqual(parents.tolist(), [0, 1])
+        self.assertEqual(children.tolist(), [1, 2])
+
     def testRandomConfiguration(self):
         config = self.system.getRandomConfiguration()
 
@@ -415,7 +455,7 @@ class TestSystemDynamics(unittest.TestCase):
 
         torques = self.system.computeInverseDynamics(position, velocity, acceleration)
 
-        self.assertTrue(isinstance(torques, list))
+        self.assertTrue(isinstance(torques, np.ndarray))
         self.assertEqual(len(torques), 3)
 
         self.assertAlmostEqual(torques[0], 1.0574, places=4)
@@ -436,7 +476,7 @@ class TestSystemDynamics(unittest.TestCase):
 
         torques = self.system.computeInverseDynamics(position, velocity, acceleration)
 
-        self.assertTrue(isinstance(torques, list))
+        self.assertTrue(isinstance(torques, np.ndarray))
         self.assertEqual(len(torques), 2)
 
         self.assertAlmostEqual(torques[0], 1.0574, places=4)
@@ -475,7 +515,7 @@ class TestSystemDynamics(unittest.TestCase):
 
         acceleration = self.system.computeForwardDynamics(position, velocity, torques)
 
-        self.assertTrue(isinstance(acceleration, list))
+        self.assertTrue(isinstance(acceleration, np.ndarray))
         self.assertEqual(len(acceleration), 3)
 
         self.assertAlmostEqual(acceleration[0], -0.2, places=4)
@@ -496,7 +536,7 @@ class TestSystemDynamics(unittest.TestCase):
 
         acceleration = self.system.computeForwardDynamics(position, velocity, torques)
 
-        self.assertTrue(isinstance(acceleration, list))
+        self.assertTrue(isinstance(acceleration, np.ndarray))
         self.assertEqual(len(acceleration), 2)
 
         self.assertAlmostEqual(acceleration[0], -0.2, places=4)
@@ -528,6 +568,60 @@ class TestSystemDynamics(unittest.TestCase):
             torques,
         )
 
+    def testDynamicsBatch(self):
+        positions = np.random.uniform(-0.5, 0.5, (10, 3))
+        velocities = np.random.uniform(-1.0, 1.0, (10, 3))
+        accelerations = np.random.uniform(-1.0, 1.0, (10, 3))
+
+        torques = self.system.computeInverseDynamicsBatch(
+            positions, velocities, accelerations, nbThreads=2
+        )
+
+        self.assertTrue(isinstance(torques, np.ndarray))
+        self.assertEqual(torques.shape, (10, 3))
+
+        for i in range(10):
+            self.assertTrue(
+                np.allclose(
+                    torques[i],
+                    self.system.computeInverseDynamics(
+                        positions[i], velocities[i], accelerations[i]
+                    ),
+                )
+            )
+
+        result = self.system.computeForwardDynamicsBatch(positions, velocities, torques)
+
+        self.assertEqual(result.shape, (10, 3))
+        self.assertTrue(np.allclose(result, accelerations))
+
+        torques = self.system.computeInverseDynamicsBatch(
+            positions, velocities, accelerations, gravity=0.0
+        )
+
+        result = self.system.computeForwardDynamicsBatch(
+            positions, velocities, torques, 0.0, 2
+        )
+
+        self.assertTrue(np.allclose(result, accelerations))
+
+    def testDynamicsBatchWithInvalidShapes(self):
+        self.assertRaises(
+            ValueError,
+            self.system.computeInverseDynamicsBatch,
+            np.zeros((10, 3)),
+            np.zeros((10, 3)),
+            np.zeros((10,)),
+        )
+
+        self.assertRaises(
+            ValueError,
+            self.system.computeForwardDynamicsBatch,
+            np.zeros((10, 3)),
+            np.zeros((8, 3)),
+            np.zeros((10, 3)),
+        )
+
 
 class TestSystemWithFixedJoints(unittest.TestCase):
 
@@ -812,7 +906,7 @@ class TestSystemWithFixedJoints(unittest.TestCase):
 
         torques = self.system.computeInverseDynamics(position, velocity, acceleration)
 
-        self.assertTrue(isinstance(torques, list))
+        self.assertTrue(isinstance(torques, np.ndarray))
         self.assertEqual(len(torques), 3)
 
         self.assertAlmostEqual(torques[0], 4.7830207575, places=4)
@@ -826,7 +920,7 @@ class TestSystemWithFixedJoints(unittest.TestCase):
 
         acceleration = self.system.computeForwardDynamics(position, velocity, torques)
 
-        self.assertTrue(isinstance(acceleration, list))
+        self.assertTrue(isinstance(acceleration, np.ndarray))
         self.assertEqual(len(acceleration), 3)
 
         self.assertAlmostEqual(acceleration[0], -0.2, places=4)
@@ -1031,7 +1125,7 @@ class TestSystemWith7Joints(unittest.TestCase):
 
         torques = self.system.computeInverseDynamics(position, velocity, acceleration)
 
-        self.assertTrue(isinstance(torques, list))
+        self.assertTrue(isinstance(torques, np.ndarray))
         self.assertEqual(len(torques), 7)
 
         self.assertAlmostEqual(torques[0], 11.157, places=4)
@@ -1049,7 +1143,7 @@ class TestSystemWith7Joints(unittest.TestCase):
 
         acceleration = self.system.computeForwardDynamics(position, velocity, torques)
 
-        self.assertTrue(isinstance(acceleration, list))
+        self.assertTrue(isinstance(acceleration, np.ndarray))
         self.assertEqual(len(acceleration), 7)
 
         self.assertAlmostEqual(acceleration[0], 0.0, places=3)
@@ -1061,5 +1155,186 @@ class TestSystemWith7Joints(unittest.TestCase):
         self.assertAlmostEqual(acceleration[6], 0.0, places=3)
 
 
+class TestSystemDynamicsWithManyJoints(unittest.TestCase):
+
+    def setUp(self):
+        self.system = createSerialSystem(20)
+        self.system.finalize()
+
+        self.chain = self.system.getKinematicChain("joint20")
+
+        self.position = np.random.uniform(-0.8, 0.8, 20)
+        self.velocity = np.random.uniform(-1.0, 1.0, 20)
+        self.acceleration = np.random.uniform(-1.0, 1.0, 20)
+
+    def tearDown(self):
+        self.chain = None
+        self.system = None
+
+    def testInverseDynamics(self):
+        torques = self.system.computeInverseDynamics(
+            self.position, self.velocity, self.acceleration
+        )
+
+        self.assertTrue(isinstance(torques, np.ndarray))
+        self.assertEqual(torques.shape, (20,))
+
+        self.assertTrue(
+            np.allclose(
+                torques,
+                self.chain.computeInverseDynamics(
+                    self.position, self.velocity, self.acceleration
+                ),
+            )
+        )
+
+    def testInverseDynamicsAgainstMassMatrix(self):
+        zeros = np.zeros(20)
+
+        torques = self.system.computeInverseDynamics(
+            self.position, zeros, self.acceleration
+        )
+        gravity_torques = self.system.computeInverseDynamics(
+            self.position, zeros, zeros
+        )
+
+        mass_matrix = self.chain.computeMassMatrix(list(self.position))
+
+        self.assertTrue(
+            np.allclose(torques - gravity_torques, mass_matrix @ self.acceleration)
+        )
+
+    def testForwardDynamics(self):
+        torques = self.system.computeInverseDynamics(
+            self.position, self.velocity, self.acceleration
+        )
+
+        acceleration = self.system.computeForwardDynamics(
+            self.position, self.velocity, torques
+        )
+
+        self.assertTrue(isinstance(acceleration, np.ndarray))
+        self.assertEqual(acceleration.shape, (20,))
+        self.assertTrue(np.allclose(acceleration, self.acceleration))
+
+    def testInverseDynamicsWithWrongSizes(self):
+        self.assertRaises(
+            ValueError,
+            self.system.computeInverseDynamics,
+            self.position,
+            self.velocity[:10],
+            self.acceleration,
+        )
+
+    def testDynamicsBatch(self):
+        positions = np.random.uniform(-0.8, 0.8, (5, 20))
+        velocities = np.random.uniform(-1.0, 1.0, (5, 20))
+        accelerations = np.random.uniform(-1.0, 1.0, (5, 20))
+
+        torques = self.system.computeInverseDynamicsBatch(
+            positions, velocities, accelerations, nbThreads=0
+        )
+
+        self.assertEqual(torques.shape, (5, 20))
+
+        for i in range(5):
+            self.assertTrue(
+                np.allclose(
+                    torques[i],
+                    self.chain.computeInverseDynamics(
+                        positions[i], velocities[i], accelerations[i]
+                    ),
+                )
+            )
+
+        self.assertTrue(
+            np.allclose(
+                self.system.computeForwardDynamicsBatch(positions, velocities, torques),
+                accelerations,
+            )
+        )
+
+
+class TestSystemIntoManipulator(unittest.TestCase):
+
+    def test_intoManipulator(self):
+        expected = createManipulator(createSystemWith3Joints(), 3, "joint3")
+
+        system = createSystemWith3Joints()
+        joint = system.getJoint("joint3")
+        manipulator = system.intoManipulator(3, "joint3")
+
+        self.assertEqual(type(manipulator), type(expected))
+        self.assertEqual(manipulator.dof, 3)
+
+        # The content of the system was moved
+        self.assertEqual(len(system.getJoints()), 0)
+        self.assertEqual(len(system.getLinks()), 0)
+        self.assertEqual(len(manipulator.getSystem().getJoints()), 3)
+
+        # The wrappers of the moved joints aren't shared with the new system
+        self.assertTrue(manipulator.getJoint("joint3") is not joint)
+
+        for position in [[0.0, 0.0, 0.0], [0.1, -0.2, 0.3]]:
+            np.testing.assert_allclose(
+                manipulator.getEEMotor(position).vector(),
+                expected.getEEMotor(position).vector(),
+            )
+
+    def test_emptiedSystem(self):
+        system = createSystemWith3Joints()
+        manipulator = system.intoManipulator(3, "joint3")
+
+        # The emptied system behaves like a new one
+        system.finalize()
+
+        self.assertEqual(len(system.getJoints()), 0)
+        self.assertEqual(len(system.getLinks()), 0)
+        self.assertTrue(system.getBaseLink() is None)
+        self.assertFalse(system.hasKinematicChain("joint3"))
+
+        with self.assertRaises(RuntimeError):
+            system.getKinematicChain("joint3")
+
+        # The manipulator isn't affected
+        self.assertTrue(manipulator.getSystem().hasKinematicChain("joint3"))
+        self.assertEqual(
+            manipulator.getSystem().getKinematicChain("joint3").getDoF(), 3
+        )
+
+    def test_intoDynamicManipulator(self):
+        system = createSerialSystem(14)
+        manipulator = system.intoManipulator(14, "joint14")
+
+        self.assertEqual(manipulator.dof, 14)
+        self.assertEqual(len(system.getJoints()), 0)
+
+    def test_invalidParameters(self):
+        system = createSystemWith3Joints()
+
+        with self.assertRaises(ValueError):
+            system.intoManipulator(3, "unknown")
+
+        with self.assertRaises(ValueError):
+            system.intoManipulator(2, "joint3")
+
+        with self.assertRaises(TypeError):
+            system.intoManipulator(0, "joint3")
+
+        with self.assertRaises(TypeError):
+            system.intoManipulator(3.0, "joint3")
+
+        # The system wasn't modified
+        self.assertEqual(len(system.getJoints()), 3)
+
+        # The system of a manipulator belongs to it (NumPy integers are accepted)
+        manipulator = system.intoManipulator(np.int64(3), "joint3")
+
+        with self.assertRaises(ValueError):
+            manipulator.getSystem().intoManipulator(3, "joint3")
+
+        self.assertEqual(len(manipulator.getSystem().getJoints()), 3)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+#! /usr/bin/env python3
+
+#
+# SPDX-FileCopyrightText: Copyright © 2025 Idiap Research Institute <contact@idiap.ch>
+#
+# SPDX-FileContributor: Philip Abbet <philip.abbet@idiap.ch>
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from pygafro import DynamicManipulator
+from pygafro import FrankaEmikaRobot
+from pygafro import LeapHand
+from pygafro import Manipulator_7
+from pygafro import SystemCache
+from pygafro import __path__ as pygafro_path
+
+PANDA_YAML = os.path.join(pygafro_path[0], "assets", "robots", "panda", "panda.yaml")
+
+
+class TestSystemCache(unittest.TestCase):
+
+    def setUp(self):
+        SystemCache.clear()
+
+    def tearDown(self):
+        SystemCache.clear()
+
+    def testParsedOnce(self):
+        robot1 = Manipulator_7(PANDA_YAML, "panda_endeffector_joint")
+        robot2 = Manipulator_7(PANDA_YAML, "panda_endeffector_joint")
+        robot3 = DynamicManipulator(PANDA_YAML, "panda_endeffector_joint")
+
+        self.assertEqual(SystemCache.getSize(), 1)
+        self.assertEqual(SystemCache.getNbMisses(), 1)
+        self.assertEqual(SystemCache.getNbHits(), 2)
+
+        position = robot1.getRandomConfiguration()
+
+        self.assertTrue(
+            np.allclose(
+                robot1.getEEMotor(position).vector(),
+                robot2.getEEMotor(position).vector(),
+            )
+        )
+        self.assertTrue(
+            np.allclose(
+                robot1.getEEMotor(position).vector(),
+                robot3.getEEMotor(position).vector(),
+            )
+        )
+
+    def testPrebuiltRobots(self):
+        robot1 = FrankaEmikaRobot()
+        robot2 = FrankaEmikaRobot()
+        hand = LeapHand()
+
+        self.assertEqual(SystemCache.getSize(), 2)
+        self.assertEqual(SystemCache.getNbMisses(), 2)
+        self.assertEqual(SystemCache.getNbHits(), 1)
+
+        # Each robot has its own copy of the system, visuals included
+        self.assertIsNot(robot1.getSystem(), robot2.getSystem())
+        self.assertTrue(robot2.getLink("panda_link0").hasVisual())
+        self.assertEqual(hand.nbFingers, 4)
+
+    def testModifiedFile(self):
+        folder = tempfile.mkdtemp()
+
+        try:
+            filename = os.path.join(folder, "robot.yaml")
+            shutil.copyfile(PANDA_YAML, filename)
+
+            Manipulator_7(filename, "panda_endeffector_joint")
+
+            stat = os.stat(filename)
+            os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            Manipulator_7(filename, "panda_endeffector_joint")
+
+            self.assertEqual(SystemCache.getSize(), 1)
+            self.assertEqual(SystemCache.getNbMisses(), 2)
+            self.assertEqual(SystemCache.getNbHits(), 0)
+        finally:
+            shutil.rmtree(folder)
+
+    def testClear(self):
+        Manipulator_7(PANDA_YAML, "panda_endeffector_joint")
+
+        SystemCache.clear()
+
+        self.assertEqual(SystemCache.getSize(), 0)
+        self.assertEqual(SystemCache.getNbHits(), 0)
+        self.assertEqual(SystemCache.getNbMisses(), 0)
+
+        Manipulator_7(PANDA_YAML, "panda_endeffector_joint")
+
+        self.assertEqual(SystemCache.getSize(), 1)
+        self.assertEqual(SystemCache.getNbMisses(), 1)
+
+    def testUnknownFile(self):
+        with self.assertRaises(Exception):
+            Manipulator_7(
+                os.path.join(tempfile.gettempdir(), "unknown.yaml"),
+                "panda_endeffector_joint",
+            )
+
+        self.assertEqual(SystemCache.getSize(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()